@@ -0,0 +1,155 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, List, Mapping, MutableMapping
+
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import ConfiguredAirbyteCatalog
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.serialization import serialize_message
+from airbyte_cdk.sources import Source
+from airbyte_cdk.sources.streams.http.cassette import Cassette, use_cassette
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measures of a read. cpu_seconds is the CPU time of the whole process (all threads) during the read, and peak_rss_bytes the highest resident
+    memory of the process since it started, which includes whatever ran before the read.
+    """
+
+    records: int
+    messages: int
+    output_bytes: int
+    seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+def benchmark_read(
+    source: Source,
+    config: Mapping[str, Any],
+    catalog: ConfiguredAirbyteCatalog,
+    state: MutableMapping[str, Any] = None,
+    cassette: Cassette = None,
+) -> BenchmarkResult:
+    """
+    Reads the source like the read command would (messages are serialized, logs are written to a discarded STDOUT) and measures the read.
+
+    :param cassette: the cassette to replay HTTP requests from (or record them to) during the read. Defaults to the cassette configured with
+    environment variables, if any, see airbyte_cdk.sources.streams.http.cassette
+    """
+    records = messages = output_bytes = 0
+    with contextlib.ExitStack() as stack:
+        if cassette:
+            stack.enter_context(use_cassette(cassette))
+        stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+
+        started_at, cpu_started_at = time.perf_counter(), time.process_time()
+        for message in source.read(AirbyteLogger(), config, catalog, state):
+            messages += 1
+            if message.type == MessageType.RECORD:
+                records += 1
+            output_bytes += len(serialize_message(message))
+        seconds, cpu_seconds = time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+    return BenchmarkResult(
+        records=records,
+        messages=messages,
+        output_bytes=output_bytes,
+        seconds=seconds,
+        cpu_seconds=cpu_seconds,
+        peak_rss_bytes=_peak_rss_bytes(),
+    )
+
+
+def _peak_rss_bytes() -> int:
+    import resource  # Not available on Windows
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes on Linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the read command of a source, e.g: against a cassette of recorded HTTP requests to compare CDK versions offline"
+    )
+    parser.add_argument("--source", type=str, required=True, help="the source class, as module:class e.g: source_github:SourceGithub")
+    parser.add_argument("--config", type=str, required=True, help="path to the json configuration file")
+    parser.add_argument("--catalog", type=str, required=True, help="path to the catalog used to determine which data to read")
+    parser.add_argument("--state", type=str, required=False, help="path to the json-encoded state file")
+    parser.add_argument("--cassette", type=str, required=False, help="path to the cassette HTTP requests are replayed from")
+    parser.add_argument(
+        "--record", action="store_true", help="send HTTP requests and record them to the cassette instead of replaying them"
+    )
+    parser.add_argument("--latency", type=float, default=0, help="simulated latency of replayed requests, in seconds")
+    parser.add_argument("--rate-limit-every", type=int, help="simulate rate limits by answering every N-th replayed request with a 429")
+    parser.add_argument("--repeat", type=int, default=1, help="how many times to run the read")
+    parsed_args = parser.parse_args(args)
+    if parsed_args.record and not parsed_args.cassette:
+        parser.error("--record requires --cassette")
+    if parsed_args.record and parsed_args.repeat > 1:
+        parser.error("--record can't be repeated")
+    return parsed_args
+
+
+def main(args: List[str] = None):
+    parsed_args = parse_args(sys.argv[1:] if args is None else args)
+    module_name, class_name = parsed_args.source.split(":")
+    source = getattr(importlib.import_module(module_name), class_name)()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = source.configure(source.read_config(parsed_args.config), temp_dir)
+        catalog = source.read_catalog(parsed_args.catalog)
+        for _ in range(parsed_args.repeat):
+            cassette = None
+            if parsed_args.cassette:
+                # Replayed responses are consumed, so each run replays a fresh cassette
+                cassette = Cassette(
+                    parsed_args.cassette,
+                    mode=Cassette.RECORD if parsed_args.record else Cassette.REPLAY,
+                    latency=parsed_args.latency,
+                    rate_limit_every=parsed_args.rate_limit_every,
+                )
+            result = benchmark_read(source, config, catalog, source.read_state(parsed_args.state), cassette)
+            print(json.dumps({**asdict(result), "records_per_second": result.records_per_second}))
+
+
+if __name__ == "__main__":
+    main()
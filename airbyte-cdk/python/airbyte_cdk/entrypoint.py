@@ -32,10 +32,17 @@ from typing import Iterable, List
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.output_writer import output_writer
+from airbyte_cdk.profiling import PROFILERS, profiled
+from airbyte_cdk.serialization import serialize_message
 from airbyte_cdk.sources import Source
 
 logger = AirbyteLogger()
 
+PROFILE_ENV_VAR = "AIRBYTE_PROFILE"
+PROFILE_MODE_ENV_VAR = "AIRBYTE_PROFILE_MODE"
+PROFILE_TOP_ENV_VAR = "AIRBYTE_PROFILE_TOP"
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -61,6 +68,7 @@ class AirbyteEntrypoint(object):
         )
         required_discover_parser = discover_parser.add_argument_group("required named arguments")
         required_discover_parser.add_argument("--config", type=str, required=True, help="path to the json configuration file")
+        self._add_profiling_args(discover_parser)
 
         # read
         read_parser = subparsers.add_parser("read", help="reads the source and outputs messages to STDOUT", parents=[parent_parser])
@@ -71,10 +79,41 @@ class AirbyteEntrypoint(object):
         required_read_parser.add_argument(
             "--catalog", type=str, required=True, help="path to the catalog used to determine which data to read"
         )
+        self._add_profiling_args(read_parser)
 
         return main_parser.parse_args(args)
 
+    @staticmethod
+    def _add_profiling_args(parser: argparse.ArgumentParser):
+        # Profiling arguments are left out of the parsed arguments unless they are passed: they can also be set with environment variables
+        profiling_parser = parser.add_argument_group("profiling arguments")
+        profiling_parser.add_argument(
+            "--profile",
+            type=str,
+            default=argparse.SUPPRESS,
+            help=f"profile the command and write the profile to this path. Defaults to ${PROFILE_ENV_VAR} if it is set",
+        )
+        profiling_parser.add_argument(
+            "--profile-mode",
+            choices=sorted(PROFILERS),
+            default=argparse.SUPPRESS,
+            help=f"how to profile the command. Defaults to ${PROFILE_MODE_ENV_VAR}, or sampling",
+        )
+        profiling_parser.add_argument(
+            "--profile-top",
+            type=int,
+            default=argparse.SUPPRESS,
+            help=f"how many of the functions the command spent the most time in to log. Defaults to ${PROFILE_TOP_ENV_VAR}, or 30",
+        )
+
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for message in self.run_messages(parsed_args):
+            yield serialize_message(message)
+
+    def run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
+        """
+        Same as run, but returns the messages to output before they are serialized
+        """
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -83,8 +122,7 @@ class AirbyteEntrypoint(object):
 
         with tempfile.TemporaryDirectory() as temp_dir:
             if cmd == "spec":
-                message = AirbyteMessage(type=Type.SPEC, spec=self.source.spec(logger))
-                yield message.json(exclude_unset=True)
+                yield AirbyteMessage(type=Type.SPEC, spec=self.source.spec(logger))
             else:
                 raw_config = self.source.read_config(parsed_args.config)
                 config = self.source.configure(raw_config, temp_dir)
@@ -96,17 +134,14 @@ class AirbyteEntrypoint(object):
                     else:
                         logger.error("Check failed")
 
-                    output_message = AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result).json(exclude_unset=True)
-                    yield output_message
+                    yield AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result)
                 elif cmd == "discover":
                     catalog = self.source.discover(logger, config)
-                    yield AirbyteMessage(type=Type.CATALOG, catalog=catalog).json(exclude_unset=True)
+                    yield AirbyteMessage(type=Type.CATALOG, catalog=catalog)
                 elif cmd == "read":
                     config_catalog = self.source.read_catalog(parsed_args.catalog)
                     state = self.source.read_state(parsed_args.state)
-                    generator = self.source.read(logger, config, config_catalog, state)
-                    for message in generator:
-                        yield message.json(exclude_unset=True)
+                    yield from self.source.read(logger, config, config_catalog, state)
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -114,8 +149,39 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    with output_writer.buffered(), _profiled(parsed_args):
+        for message in source_entrypoint.run_messages(parsed_args):
+            output_writer.write(serialize_message(message), message.type)
+
+
+def _profiled(parsed_args: argparse.Namespace):
+    """
+    Profiles the discover and read commands when a profile path is passed as an argument or in the environment
+    """
+    if parsed_args.command not in ("discover", "read"):
+        return profiled(None)
+    path = parsed_args.profile if hasattr(parsed_args, "profile") else os.environ.get(PROFILE_ENV_VAR)
+    if not path:
+        return profiled(None)
+    return profiled(
+        path=path,
+        mode=parsed_args.profile_mode if hasattr(parsed_args, "profile_mode") else os.environ.get(PROFILE_MODE_ENV_VAR, "sampling"),
+        top=parsed_args.profile_top if hasattr(parsed_args, "profile_top") else _profile_top_from_env(),
+        logger=logger,
+    )
+
+
+def _profile_top_from_env() -> int:
+    value = os.environ.get(PROFILE_TOP_ENV_VAR)
+    if value is None:
+        return 30
+    try:
+        top = int(value)
+    except ValueError:
+        top = 0
+    if top <= 0:
+        raise ValueError(f"${PROFILE_TOP_ENV_VAR} must be a positive number of functions to log, got {value!r}")
+    return top
 
 
 def main():
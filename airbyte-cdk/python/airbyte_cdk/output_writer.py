@@ -0,0 +1,135 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO
+
+from airbyte_cdk.models import Type
+
+
+class OutputWriter:
+    """
+    Writes serialized Airbyte messages to STDOUT, one message per line.
+
+    By default every message is written as soon as it is received, like print() would. While buffering is enabled (see buffered()), messages are
+    accumulated in memory and written in large blocks instead, which avoids a write syscall (and, when the stream is unbuffered, a flush) per
+    message. The buffer is flushed when it grows past buffer_size bytes, when flush_interval seconds elapsed since the last flush (checked on
+    every write, and by a background thread so messages are not held back while the source is blocked, e.g: waiting on an API), and always
+    right after a STATE message so a checkpoint is never held back behind the records it covers.
+
+    A single writer should be shared by everything that outputs messages (records and logs alike) so messages are output in the order they were
+    written. Writing is thread safe.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = 1024 * 1024, flush_interval: float = 1.0):
+        """
+        :param stream: the stream to write to. Defaults to whatever sys.stdout is at the time of writing
+        :param buffer_size: the number of characters after which buffered messages are flushed
+        :param flush_interval: the number of seconds after which buffered messages are flushed
+        """
+        self._stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+        self._buffering = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+    @property
+    def stream(self) -> TextIO:
+        return self._stream or sys.stdout
+
+    def write(self, message: str, message_type: Optional[Type] = None):
+        """
+        :param message: the serialized message
+        :param message_type: the type of the message, so STATE messages can be flushed right away
+        """
+        with self._lock:
+            self._buffer.append(message)
+            self._buffered_size += len(message) + 1
+            if (
+                not self._buffering
+                or message_type == Type.STATE
+                or self._buffered_size >= self.buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._write_buffer(flush_stream=self._buffering)
+
+    def flush(self):
+        with self._lock:
+            self._write_buffer(flush_stream=True)
+
+    @contextmanager
+    def buffered(self) -> Iterator["OutputWriter"]:
+        """
+        Buffers messages written in this context. Any message still buffered is written when exiting the context, even on errors.
+        """
+        with self._lock:
+            previously_buffering, self._buffering = self._buffering, True
+        stop_flushing = threading.Event()
+        flusher = None
+        if not previously_buffering and self.flush_interval > 0:
+            flusher = threading.Thread(target=self._flush_periodically, args=(stop_flushing,), name="OutputWriterFlush", daemon=True)
+            flusher.start()
+        try:
+            yield self
+        finally:
+            stop_flushing.set()
+            if flusher:
+                flusher.join()
+            with self._lock:
+                self._buffering = previously_buffering
+                self._write_buffer(flush_stream=True)
+
+    def _flush_periodically(self, stop: threading.Event):
+        timeout = self.flush_interval
+        while not stop.wait(timeout):
+            with self._lock:
+                elapsed = time.monotonic() - self._last_flush
+                if elapsed >= self.flush_interval:
+                    if self._buffer:
+                        self._write_buffer(flush_stream=True)
+                    timeout = self.flush_interval
+                else:
+                    # Messages were flushed by a write in the meantime
+                    timeout = self.flush_interval - elapsed
+
+    def _write_buffer(self, flush_stream: bool):
+        if self._buffer:
+            self._buffer.append("")
+            self.stream.write("\n".join(self._buffer))
+            self._buffer = []
+            self._buffered_size = 0
+        if flush_stream:
+            self.stream.flush()
+        self._last_flush = time.monotonic()
+
+
+# The writer shared by the entrypoint and the logger
+output_writer = OutputWriter()
@@ -0,0 +1,184 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from airbyte_cdk.logger import AirbyteLogger
+
+# A function, as (file name, first line number, function name)
+_Function = Tuple[str, int, str]
+
+
+class Profiler(ABC):
+    @abstractmethod
+    def start(self):
+        pass
+
+    @abstractmethod
+    def stop(self):
+        pass
+
+    @abstractmethod
+    def dump(self, path: str):
+        """
+        Writes the profile to a file
+        """
+
+    @abstractmethod
+    def summary(self, top: int) -> str:
+        """
+        :return: a human-readable table of the top functions the profiled code spent the most time in
+        """
+
+
+class DeterministicProfiler(Profiler):
+    """
+    Profiles every function call with cProfile. The profile is dumped in the pstats format, which can be read with pstats, snakeviz, etc..
+
+    Exact, but it slows down the profiled code and only profiles the thread it was started from: use the SamplingProfiler to profile streams
+    or slices read concurrently.
+    """
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def dump(self, path: str):
+        self._profile.dump_stats(path)
+
+    def summary(self, top: int) -> str:
+        output = io.StringIO()
+        pstats.Stats(self._profile, stream=output).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        return output.getvalue()
+
+
+class SamplingProfiler(Profiler):
+    """
+    Samples the call stack of every thread each interval seconds from a background thread. The overhead is low enough to profile production
+    workloads, and the profile covers the threads reading streams or slices concurrently. Time is wall clock time: functions waiting on the
+    network or on a lock are sampled too.
+
+    The profile is dumped as "folded" stacks (one line per distinct stack, with its number of samples) which flame graph tools like
+    speedscope or flamegraph.pl read.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._stacks: Dict[Tuple[_Function, ...], int] = Counter()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == threading.get_ident():
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            self._stacks[tuple(reversed(stack))] += 1
+
+    def dump(self, path: str):
+        with open(path, "w") as file:
+            for stack, samples in self._stacks.items():
+                file.write(";".join(f"{name} ({filename}:{line})" for filename, line, name in stack) + f" {samples}\n")
+
+    def summary(self, top: int) -> str:
+        samples = sum(self._stacks.values())
+        if not samples:
+            return "No samples were taken"
+        self_samples: Dict[_Function, int] = Counter()
+        total_samples: Dict[_Function, int] = Counter()
+        for stack, count in self._stacks.items():
+            self_samples[stack[-1]] += count
+            # Recursive functions appear several times in a stack but should only be counted once
+            for function in set(stack):
+                total_samples[function] += count
+
+        lines = [f"{samples} samples taken every {self.interval}s", f"{'self':>8} {'total':>8}  function"]
+        for function, count in sorted(self_samples.items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"{count / samples:8.1%} {total_samples[function] / samples:8.1%}  {_format_function(function)}")
+        return "\n".join(lines)
+
+
+PROFILERS = {"deterministic": DeterministicProfiler, "sampling": SamplingProfiler}
+
+
+@contextmanager
+def profiled(path: Optional[str], mode: str = "sampling", top: int = 30, logger: AirbyteLogger = None) -> Iterator[None]:
+    """
+    Profiles the code run in the with block, then writes the profile to path and logs the top functions the code spent the most time in. The
+    profile is written even if the code raises an exception. Does nothing if path is None.
+
+    :param mode: either "sampling" (see SamplingProfiler) or "deterministic" (see DeterministicProfiler)
+    """
+    if not path:
+        yield
+        return
+
+    if mode not in PROFILERS:
+        raise ValueError(f"Unknown profiling mode {mode}, expected one of {sorted(PROFILERS)}")
+    logger = logger or AirbyteLogger()
+    profiler = PROFILERS[mode]()
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        profiler.dump(path)
+        logger.info(f"Wrote {mode} profile to {path}. Top {top} functions:\n{profiler.summary(top)}")
+
+
+def _format_function(function: _Function) -> str:
+    filename, line, name = function
+    return f"{name} ({os.path.basename(filename)}:{line})"
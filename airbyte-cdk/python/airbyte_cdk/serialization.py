@@ -0,0 +1,68 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+from typing import Any
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, see the "orjson" extra in setup.py
+    orjson = None
+
+_RECORD_FIELDS = set(AirbyteRecordMessage.__fields__)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serializes obj to a JSON string using orjson if it is installed, or the standard library's json module otherwise.
+    Values which aren't natively JSON serializable (e.g: Decimal) are encoded the same way pydantic encodes them.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson is stricter than json (e.g: integers larger than 64 bits), so fall back to json rather than failing the sync
+            pass
+    return json.dumps(obj, default=pydantic_encoder)
+
+
+def serialize_message(message: AirbyteMessage) -> str:
+    """
+    Serializes an AirbyteMessage to the JSON string output by the connector.
+
+    RECORD messages are by far the most frequent messages output by a connector, so they are serialized directly from the record's data instead
+    of going through pydantic's json(), which is expensive because it copies and re-validates the whole message. All other messages are
+    serialized by pydantic.
+    """
+    record = message.record
+    if message.type == Type.RECORD and record is not None and record.__fields_set__ <= _RECORD_FIELDS:
+        serialized_record = {"stream": record.stream, "data": record.data, "emitted_at": record.emitted_at}
+        if record.namespace is not None:
+            serialized_record["namespace"] = record.namespace
+        return dumps({"type": Type.RECORD.value, "record": serialized_record})
+    return message.json(exclude_unset=True)
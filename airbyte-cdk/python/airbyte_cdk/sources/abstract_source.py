@@ -24,9 +24,14 @@
 
 
 import copy
+import json
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import (
@@ -43,6 +48,11 @@ from airbyte_cdk.models import (
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.checkpointing import IncrementalStateTracker
+from airbyte_cdk.sources.utils.concurrency import ITERABLE_EXHAUSTED, read_concurrently
+from airbyte_cdk.sources.utils.metrics import MetricsReporter, MetricsSink, StreamMetrics
+from airbyte_cdk.sources.utils.record_validation import RecordValidator
+from airbyte_cdk.sources.utils.transform import TypeTransformer
 
 
 class AbstractSource(Source, ABC):
@@ -73,6 +83,53 @@ class AbstractSource(Source, ABC):
         """Source name"""
         return self.__class__.__name__
 
+    @property
+    def max_concurrent_streams(self) -> Optional[int]:
+        """
+        Decides how many streams are read at the same time. E.g: if this returns a value of 4, then up to 4 streams are read concurrently in a pool
+        of worker threads and their messages are multiplexed into the output as they are produced.
+
+        Concurrent reads are a good fit for sources which are bound by network latency rather than by rate limits, since each stream spends most of
+        its time waiting on the API. Streams must not share mutable state to be read concurrently: they can share a requests.Session for its
+        connection pools, as long as the session isn't modified once streams started reading.
+
+        Messages from the same stream keep their relative order, and STATE messages only ever contain state for records which were already output.
+
+        return None (the default) to read streams one after another, in the order they appear in the configured catalog.
+        """
+        return None
+
+    @property
+    def record_validation_sample_rate(self) -> Optional[float]:
+        """
+        Decides whether records are validated against the schema of their stream in the configured catalog, to catch schema drift in
+        production. E.g: if this returns 0.01, one record out of 100 of each stream is validated. Validation never fails the sync: the number of
+        records which don't match their schema is logged for each stream, along with a few of the validation errors.
+
+        Validation is much cheaper when the optional fastjsonschema package is installed (pip install airbyte-cdk[validation]).
+
+        return None (the default) to not validate records.
+        """
+        return None
+
+    @property
+    def metrics_report_interval(self) -> Optional[float]:
+        """
+        Decides how often (in seconds) the metrics of each stream being read (see Stream.metrics) are logged. When set, metrics are also logged
+        once each stream was read, and the metrics of each slice are logged at debug level.
+
+        return None (the default) to not log metrics. The metrics_sinks still get the metrics of each stream once it was read.
+        """
+        return None
+
+    @property
+    def metrics_sinks(self) -> List[MetricsSink]:
+        """
+        Override to export the metrics of streams to a monitoring system, e.g: [PrometheusTextfileSink("/var/lib/node_exporter")] or
+        [StatsdSink("statsd.example.com")]. Called once for each stream which is read.
+        """
+        return []
+
     def discover(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteCatalog:
         """Implements the Discover operation from the Airbyte Specification. See https://docs.airbyte.io/architecture/airbyte-specification."""
         streams = [stream.as_airbyte_stream() for stream in self.streams(config=config)]
@@ -98,22 +155,67 @@ class AbstractSource(Source, ABC):
         # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
-        for configured_stream in catalog.streams:
-            stream_instance = stream_instances.get(configured_stream.stream.name)
-            if not stream_instance:
-                raise KeyError(
-                    f"The requested stream {configured_stream.stream.name} was not found in the source. Available streams: {stream_instances.keys()}"
-                )
+        if self.max_concurrent_streams and self.max_concurrent_streams > 1:
+            yield from self._read_streams_concurrently(logger, stream_instances, catalog, connector_state)
+        else:
+            for configured_stream in catalog.streams:
+                stream_instance = self._get_stream_instance(stream_instances, configured_stream)
+                try:
+                    yield from self._read_stream(
+                        logger=logger, stream_instance=stream_instance, configured_stream=configured_stream, connector_state=connector_state
+                    )
+                except Exception as e:
+                    logger.exception(f"Encountered an exception while reading stream {self.name}")
+                    raise e
+
+        logger.info(f"Finished syncing {self.name}")
 
-            try:
-                yield from self._read_stream(
-                    logger=logger, stream_instance=stream_instance, configured_stream=configured_stream, connector_state=connector_state
+    @staticmethod
+    def _get_stream_instance(stream_instances: Mapping[str, Stream], configured_stream: ConfiguredAirbyteStream) -> Stream:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            raise KeyError(
+                f"The requested stream {configured_stream.stream.name} was not found in the source. Available streams: {stream_instances.keys()}"
+            )
+        return stream_instance
+
+    def _read_streams_concurrently(
+        self,
+        logger: AirbyteLogger,
+        stream_instances: Mapping[str, Stream],
+        catalog: ConfiguredAirbyteCatalog,
+        connector_state: MutableMapping[str, Any],
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads up to max_concurrent_streams streams at the same time. Each stream checkpoints into its own copy of the connector state; a stream's
+        state is only merged into the connector state once its STATE message reaches this (consuming) thread, i.e: after all of the stream's
+        preceding records were output.
+        """
+        readers = []
+        for configured_stream in catalog.streams:
+            stream_instance = self._get_stream_instance(stream_instances, configured_stream)
+            stream_connector_state = {configured_stream.stream.name: connector_state.get(configured_stream.stream.name, {})}
+            readers.append(
+                partial(
+                    self._read_stream,
+                    logger=logger,
+                    stream_instance=stream_instance,
+                    configured_stream=configured_stream,
+                    connector_state=stream_connector_state,
                 )
-            except Exception as e:
-                logger.exception(f"Encountered an exception while reading stream {self.name}")
-                raise e
+            )
 
-        logger.info(f"Finished syncing {self.name}")
+        try:
+            for _, message in read_concurrently(readers, max_workers=self.max_concurrent_streams):
+                if message is ITERABLE_EXHAUSTED:
+                    continue
+                if message.type == MessageType.STATE:
+                    connector_state.update(message.state.data)
+                    message = AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
+                yield message
+        except Exception as e:
+            logger.exception(f"Encountered an exception while reading stream {self.name}")
+            raise e
 
     def _read_stream(
         self,
@@ -127,7 +229,18 @@ class AbstractSource(Source, ABC):
         if use_incremental:
             record_iterator = self._read_incremental(logger, stream_instance, configured_stream, connector_state)
         else:
-            record_iterator = self._read_full_refresh(stream_instance, configured_stream)
+            record_iterator = self._read_full_refresh(logger, stream_instance, configured_stream)
+
+        transform_config = stream_instance.transform_config
+        transformer = TypeTransformer(stream_instance.get_json_schema(), transform_config) if transform_config else None
+        sample_rate = self.record_validation_sample_rate
+        validator = RecordValidator(configured_stream.stream.json_schema, sample_rate) if sample_rate else None
+
+        metrics = stream_instance.metrics
+        metrics_reporter = MetricsReporter(logger, metrics, self.metrics_sinks, self.metrics_report_interval)
+
+        # Timing each record is only worth its cost when the metrics are reported while the stream is read or exported
+        record_metrics = metrics if metrics_reporter.enabled else None
 
         record_counter = 0
         stream_name = configured_stream.stream.name
@@ -135,9 +248,28 @@ class AbstractSource(Source, ABC):
         for record in record_iterator:
             if record.type == MessageType.RECORD:
                 record_counter += 1
+                if record_metrics:
+                    record_metrics.increment("records")
+                if transformer or validator:
+                    self._transform_and_validate(record.record, transformer, validator, record_metrics)
+            if not record_metrics:
+                yield record
+                continue
+            output_started_at = time.perf_counter()
             yield record
+            metrics.increment("output_seconds", time.perf_counter() - output_started_at)
+            metrics_reporter.maybe_report()
 
         logger.info(f"Read {record_counter} records from {stream_name} stream")
+        if not record_metrics:
+            # Counted at once rather than for each record, so the stream's metrics still hold the number of records read
+            metrics.increment("records", record_counter)
+        metrics_reporter.report()
+        if validator:
+            if validator.invalid_records:
+                logger.warn(validator.summary(stream_name))
+            else:
+                logger.info(validator.summary(stream_name))
 
     def _read_incremental(
         self,
@@ -151,35 +283,132 @@ class AbstractSource(Source, ABC):
         if stream_state:
             logger.info(f"Setting state of {stream_name} stream to {stream_state.get(stream_name)}")
 
-        checkpoint_interval = stream_instance.state_checkpoint_interval
         slices = stream_instance.stream_slices(
             cursor_field=configured_stream.cursor_field, sync_mode=SyncMode.incremental, stream_state=stream_state
         )
+        state_tracker = IncrementalStateTracker(stream_instance, stream_state, configured_stream.cursor_field)
+        if self._reads_slices_concurrently(stream_instance):
+            yield from self._read_incremental_slices_concurrently(
+                logger, stream_instance, configured_stream, connector_state, slices, state_tracker
+            )
+            return
+
         for slice in slices:
-            record_counter = 0
             records = stream_instance.read_records(
                 sync_mode=SyncMode.incremental,
                 stream_slice=slice,
-                stream_state=stream_state,
+                stream_state=state_tracker.state,
                 cursor_field=configured_stream.cursor_field or None,
             )
             for record_data in records:
-                record_counter += 1
                 yield self._as_airbyte_record(stream_name, record_data)
-                stream_state = stream_instance.get_updated_state(stream_state, record_data)
-                if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                    yield self._checkpoint_state(stream_name, stream_state, connector_state, logger)
+                if state_tracker.update(record_data):
+                    yield self._checkpoint_state(stream_name, state_tracker.checkpoint(), connector_state, logger)
+
+            yield self._checkpoint_state(stream_name, state_tracker.checkpoint(), connector_state, logger)
+            self._complete_slice(logger, stream_instance, slice)
+
+    def _read_incremental_slices_concurrently(
+        self,
+        logger: AirbyteLogger,
+        stream_instance: Stream,
+        configured_stream: ConfiguredAirbyteStream,
+        connector_state: MutableMapping[str, Any],
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        state_tracker: IncrementalStateTracker,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads up to max_concurrent_slices slices of the stream at the same time. Records are output as soon as they are read, but they are applied
+        to the stream state in slice order: records of the earliest slice which is still being read (the "head" slice) update the state
+        right away, while records of later slices are held back until every slice before them completes. This way a STATE message only ever
+        covers the highest contiguous range of completed slices, and the resulting state is the same as if the slices had been read one by one.
 
-            yield self._checkpoint_state(stream_name, stream_state, connector_state, logger)
+        Slices only read up to max_records_ahead_of_head_slice records ahead of the head slice, which bounds the records held back.
+        """
+        stream_name = configured_stream.stream.name
+
+        def slices_read_kwargs():
+            for slice in slices:
+                # slices read concurrently can't observe each other's progress, so each one starts from the state committed so far
+                yield dict(
+                    sync_mode=SyncMode.incremental,
+                    stream_slice=slice,
+                    stream_state=copy.deepcopy(state_tracker.state),
+                    cursor_field=configured_stream.cursor_field or None,
+                )
+
+        head = 0
+        pending_records: Dict[int, List[Mapping[str, Any]]] = defaultdict(list)
+        completed_slices = set()
+        records = stream_instance.read_slices_concurrently(
+            slices_read_kwargs(), max_records_ahead=stream_instance.max_records_ahead_of_head_slice
+        )
+        for index, record_data in records:
+            if record_data is ITERABLE_EXHAUSTED:
+                stream_instance.metrics.complete_slice()
+                completed_slices.add(index)
+                while head in completed_slices:
+                    completed_slices.remove(head)
+                    yield self._checkpoint_state(stream_name, state_tracker.checkpoint(), connector_state, logger)
+                    head += 1
+                    for pending_record in pending_records.pop(head, []):
+                        if state_tracker.update(pending_record):
+                            yield self._checkpoint_state(stream_name, state_tracker.checkpoint(), connector_state, logger)
+                continue
 
-    def _read_full_refresh(self, stream_instance: Stream, configured_stream: ConfiguredAirbyteStream) -> Iterator[AirbyteMessage]:
+            yield self._as_airbyte_record(stream_name, record_data)
+            if index != head:
+                pending_records[index].append(record_data)
+                continue
+
+            if state_tracker.update(record_data):
+                yield self._checkpoint_state(stream_name, state_tracker.checkpoint(), connector_state, logger)
+
+    def _read_full_refresh(
+        self, logger: AirbyteLogger, stream_instance: Stream, configured_stream: ConfiguredAirbyteStream
+    ) -> Iterator[AirbyteMessage]:
         slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
+        if self._reads_slices_concurrently(stream_instance):
+            slices_read_kwargs = (
+                dict(stream_slice=slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field) for slice in slices
+            )
+            for _, record in stream_instance.read_slices_concurrently(slices_read_kwargs):
+                if record is ITERABLE_EXHAUSTED:
+                    stream_instance.metrics.complete_slice()
+                else:
+                    yield self._as_airbyte_record(configured_stream.stream.name, record)
+            return
+
         for slice in slices:
             records = stream_instance.read_records(
                 stream_slice=slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field
             )
             for record in records:
                 yield self._as_airbyte_record(configured_stream.stream.name, record)
+            self._complete_slice(logger, stream_instance, slice)
+
+    @staticmethod
+    def _transform_and_validate(
+        record: AirbyteRecordMessage,
+        transformer: Optional[TypeTransformer],
+        validator: Optional[RecordValidator],
+        metrics: Optional[StreamMetrics],
+    ):
+        if transformer:
+            with metrics.timer("transform_seconds") if metrics else nullcontext():
+                record.data = transformer.transform(record.data)
+        if validator:
+            with metrics.timer("validation_seconds") if metrics else nullcontext():
+                validator.validate(record.data)
+
+    @staticmethod
+    def _reads_slices_concurrently(stream_instance: Stream) -> bool:
+        return bool(stream_instance.max_concurrent_slices and stream_instance.max_concurrent_slices > 1)
+
+    def _complete_slice(self, logger: AirbyteLogger, stream_instance: Stream, slice: Optional[Mapping[str, Any]]):
+        slice_metrics = stream_instance.metrics.complete_slice()
+        if self.metrics_report_interval is not None:
+            logger.debug(f"Read slice {slice} of {stream_instance.name} stream. Metrics: {json.dumps(slice_metrics, sort_keys=True)}")
 
     def _checkpoint_state(self, stream_name, stream_state, connector_state, logger):
         logger.info(f"Setting state of {stream_name} stream to {stream_state}")
@@ -188,5 +417,6 @@ class AbstractSource(Source, ABC):
 
     def _as_airbyte_record(self, stream_name: str, data: Mapping[str, Any]):
         now_millis = int(datetime.now().timestamp()) * 1000
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        # Records are output as-is, so skip pydantic's validation which would otherwise copy every record
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
@@ -1,4 +1,4 @@
-from .singer_helpers import SingerHelper, SyncModeInfo
+from .singer_helpers import DiscoverCache, SingerHelper, SyncModeInfo
 from .source import SingerSource
 
-__all__ = ["SingerSource", "SyncModeInfo", "SingerHelper"]
+__all__ = ["SingerSource", "SyncModeInfo", "SingerHelper", "DiscoverCache"]
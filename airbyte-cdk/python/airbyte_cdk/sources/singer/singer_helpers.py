@@ -23,10 +23,13 @@
 #
 
 
+import hashlib
 import json
 import os
 import selectors
 import subprocess
+import tempfile
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from io import TextIOWrapper
@@ -147,6 +150,15 @@ class SingerHelper:
 
     @staticmethod
     def get_catalogs(logger, shell_command: str, sync_mode_overrides: Dict[str, SyncModeInfo], excluded_streams: List) -> Catalogs:
+        singer_catalog = SingerHelper.discover(logger, shell_command)
+        return SingerHelper.catalogs_from_singer_catalog(singer_catalog, sync_mode_overrides, excluded_streams)
+
+    @staticmethod
+    def discover(logger, shell_command: str) -> Dict[str, any]:
+        """
+        Runs the discovery command of a tap
+        :return: the Singer catalog output by the tap
+        """
         completed_process = subprocess.run(
             shell_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
         )
@@ -154,7 +166,12 @@ class SingerHelper:
         for line in completed_process.stderr.splitlines():
             logger.log_by_prefix(line, "ERROR")
 
-        singer_catalog = json.loads(completed_process.stdout)
+        return json.loads(completed_process.stdout)
+
+    @staticmethod
+    def catalogs_from_singer_catalog(
+        singer_catalog: Dict[str, any], sync_mode_overrides: Dict[str, SyncModeInfo], excluded_streams: List
+    ) -> Catalogs:
         streams = singer_catalog.get("streams", [])
         if streams and excluded_streams:
             singer_catalog["streams"] = [stream for stream in streams if stream["stream"] not in excluded_streams]
@@ -221,6 +238,29 @@ class SingerHelper:
             out_message = AirbyteMessage(type=Type.RECORD, record=out_record)
         return out_message
 
+    @staticmethod
+    def singer_catalog_from_configured_catalog(configured_catalog: ConfiguredAirbyteCatalog) -> Dict[str, any]:
+        """
+        Builds a Singer catalog from the schemas stored in the configured catalog, to read without running the tap's discovery.
+        Only stream level metadata is rendered: taps relying on other metadata they discover (e.g: field inclusion, database names) must be
+        read with their discovered catalog.
+        """
+        singer_streams = []
+        for configured_stream in configured_catalog.streams:
+            stream = configured_stream.stream
+            stream_metadata = {}
+            if stream.source_defined_primary_key:
+                stream_metadata["table-key-properties"] = [key[0] for key in stream.source_defined_primary_key]
+            singer_streams.append(
+                {
+                    "stream": stream.name,
+                    "tap_stream_id": stream.name,
+                    "schema": dict(stream.json_schema),
+                    "metadata": [{"breadcrumb": [], "metadata": stream_metadata}],
+                }
+            )
+        return {"streams": singer_streams}
+
     @staticmethod
     def create_singer_catalog_with_selection(masked_airbyte_catalog: ConfiguredAirbyteCatalog, discovered_singer_catalog: object) -> str:
         combined_catalog_path = os.path.join("singer_rendered_catalog.json")
@@ -264,3 +304,42 @@ class SingerHelper:
             fh.write(json.dumps(combined_catalog))
 
         return combined_catalog_path
+
+
+class DiscoverCache:
+    """
+    Persists the Singer catalogs discovered by taps in a directory, so they can be reused until they are ttl seconds old instead of running
+    the tap's discovery again. Catalogs are keyed by a fingerprint of the source and its config: changing the config invalidates them.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    @staticmethod
+    def fingerprint(source_name: str, config: Mapping[str, Any]) -> str:
+        # The config holds credentials, so only its hash is ever written to the cache directory
+        return hashlib.sha256(json.dumps({"source": source_name, "config": config}, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """
+        :return: the catalog cached for the key, or None if there is none or it expired
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, singer_catalog: Mapping[str, Any]):
+        os.makedirs(self.directory, exist_ok=True)
+        # Concurrent syncs may read the file at any time, so it is replaced at once rather than rewritten in place
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as file:
+            json.dump(singer_catalog, file)
+        os.replace(file.name, self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
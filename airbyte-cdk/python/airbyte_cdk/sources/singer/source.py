@@ -26,14 +26,17 @@
 import json
 import os
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Type
+from typing import Dict, Iterable, List, Optional, Type
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import AirbyteCatalog, AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, Status
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.utils.catalog_helpers import CatalogHelper
 
-from .singer_helpers import Catalogs, SingerHelper, SyncModeInfo
+from .singer_helpers import Catalogs, DiscoverCache, SingerHelper, SyncModeInfo
+
+DISCOVER_CACHE_DIR_ENV_VAR = "AIRBYTE_SINGER_DISCOVER_CACHE_DIR"
+DISCOVER_CACHE_TTL_ENV_VAR = "AIRBYTE_SINGER_DISCOVER_CACHE_TTL"
 
 
 @dataclass
@@ -43,6 +46,9 @@ class ConfigContainer:
 
 
 class SingerSource(Source):
+    # Whether read builds the tap's catalog from the schemas stored in the configured catalog rather than from the tap's discovery.
+    # See SingerHelper.singer_catalog_from_configured_catalog for the taps this works with
+    read_from_configured_catalog = False
 
     # can be overridden to change an input config
     def configure(self, raw_config: json, temp_dir: str) -> json:
@@ -98,10 +104,29 @@ class SingerSource(Source):
         """
         raise NotImplementedError
 
-    def _discover_internal(self, logger: AirbyteLogger, config_path: str) -> Catalogs:
-        cmd = self.discover_cmd(logger, config_path)
-        catalogs = SingerHelper.get_catalogs(logger, cmd, self.get_sync_mode_overrides(), self.get_excluded_streams())
-        return catalogs
+    def _discover_internal(self, logger: AirbyteLogger, config_path: str, use_cache: bool = True) -> Catalogs:
+        """
+        :param use_cache: whether a catalog cached by a previous discovery can be returned. The discovered catalog is cached either way
+        """
+        cache = self._discover_cache()
+        cache_key = singer_catalog = None
+        if cache:
+            cache_key = DiscoverCache.fingerprint(f"{type(self).__module__}.{type(self).__qualname__}", self.read_config(config_path))
+            if use_cache:
+                singer_catalog = cache.get(cache_key)
+                if singer_catalog is not None:
+                    logger.info(f"Using the catalog discovered less than {cache.ttl} seconds ago, cached in {cache.directory}")
+
+        if singer_catalog is None:
+            singer_catalog = SingerHelper.discover(logger, self.discover_cmd(logger, config_path))
+            if cache:
+                cache.put(cache_key, singer_catalog)
+
+        return SingerHelper.catalogs_from_singer_catalog(singer_catalog, self.get_sync_mode_overrides(), self.get_excluded_streams())
+
+    def _discover_cache(self) -> Optional[DiscoverCache]:
+        directory = self.get_discover_cache_dir()
+        return DiscoverCache(directory, self.get_discover_cache_ttl()) if directory else None
 
     def check(self, logger: AirbyteLogger, config_container: ConfigContainer) -> AirbyteConnectionStatus:
         """
@@ -113,10 +138,11 @@ class SingerSource(Source):
         """
         Implements the parent class discover method.
         """
+        # Discover is how the schema is refreshed, so it always runs the tap's discovery, updating the cached catalog
         if isinstance(config_container, ConfigContainer):
-            return self._discover_internal(logger, config_container.config_path).airbyte_catalog
+            return self._discover_internal(logger, config_container.config_path, use_cache=False).airbyte_catalog
         else:
-            return self._discover_internal(logger, config_container).airbyte_catalog
+            return self._discover_internal(logger, config_container, use_cache=False).airbyte_catalog
 
     def read(
         self, logger: AirbyteLogger, config_container: ConfigContainer, catalog_path: str, state_path: str = None
@@ -124,9 +150,12 @@ class SingerSource(Source):
         """
         Implements the parent class read method.
         """
-        catalogs = self._discover_internal(logger, config_container.config_path)
         masked_airbyte_catalog = ConfiguredAirbyteCatalog.parse_obj(self.read_config(catalog_path))
-        selected_singer_catalog_path = SingerHelper.create_singer_catalog_with_selection(masked_airbyte_catalog, catalogs.singer_catalog)
+        if self.read_from_configured_catalog:
+            singer_catalog = SingerHelper.singer_catalog_from_configured_catalog(masked_airbyte_catalog)
+        else:
+            singer_catalog = self._discover_internal(logger, config_container.config_path).singer_catalog
+        selected_singer_catalog_path = SingerHelper.create_singer_catalog_with_selection(masked_airbyte_catalog, singer_catalog)
 
         read_cmd = self.read_cmd(logger, config_container.config_path, selected_singer_catalog_path, state_path)
         return SingerHelper.read(logger, read_cmd)
@@ -155,6 +184,22 @@ class SingerSource(Source):
         """
         return []
 
+    def get_discover_cache_dir(self) -> Optional[str]:
+        """
+        Discovery can take minutes for taps with large schemas, and read needs the discovered catalog. When this returns a directory, the
+        catalogs discovered by the tap are cached in it and reused by read until they expire.
+
+        :return: The directory discovered catalogs are cached in, or None to not cache them. Defaults to the AIRBYTE_SINGER_DISCOVER_CACHE_DIR
+        environment variable
+        """
+        return os.environ.get(DISCOVER_CACHE_DIR_ENV_VAR)
+
+    def get_discover_cache_ttl(self) -> float:
+        """
+        :return: For how many seconds a cached catalog is reused. Defaults to the AIRBYTE_SINGER_DISCOVER_CACHE_TTL environment variable, or an hour
+        """
+        return float(os.environ.get(DISCOVER_CACHE_TTL_ENV_VAR, 3600))
+
 
 class BaseSingerSource(SingerSource):
     force_full_refresh = False
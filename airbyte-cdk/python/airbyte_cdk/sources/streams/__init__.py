@@ -1,4 +1,5 @@
 # Initialize Streams Package
+from .async_job import AsyncJobFailed, AsyncJobStatus, AsyncJobStream
 from .core import Stream
 
-__all__ = ["Stream"]
+__all__ = ["AsyncJobFailed", "AsyncJobStatus", "AsyncJobStream", "Stream"]
@@ -0,0 +1,213 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Mapping, Optional
+
+from airbyte_cdk.models import SyncMode
+
+from .core import Stream
+
+
+class AsyncJobStatus(Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AsyncJobFailed(Exception):
+    """
+    Raised when a job failed, or timed out, as many times as it was allowed to be attempted
+    """
+
+
+@dataclass
+class _RunningJob:
+    params: Mapping[str, Any]
+    job: Any
+    attempt: int
+    started_at: float
+    next_poll_at: float
+    poll_interval: float
+
+
+# Marks the end of the jobs to submit
+_NO_MORE_JOBS = object()
+
+
+class AsyncJobStream(Stream, ABC):
+    """
+    Base abstract class for streams whose records are produced by asynchronous jobs, e.g: reports which must be requested, then polled until
+    they are ready, then downloaded.
+
+    The jobs of a slice are submitted up front (up to max_running_jobs at the same time) and all of the running jobs are polled in turn, with
+    an exponentially increasing interval. Records of a job are read as soon as it completes, so a slow job doesn't delay the jobs submitted
+    after it and the records of a slice are output in the order its jobs complete. As a consequence, state is only checkpointed at the end
+    of each slice, whatever the stream's state_checkpoint_* properties.
+
+    Jobs are scheduled per slice: the jobs of a slice are only submitted once the jobs of the previous slice completed, unless slices are
+    read concurrently (see max_concurrent_slices), in which case max_running_jobs applies to each slice.
+    """
+
+    @property
+    def max_running_jobs(self) -> int:
+        """
+        Override to change the maximum number of jobs running at the same time, e.g: to stay within the API's limits.
+        """
+        return 10
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        How long in seconds to wait before checking the status of a job for the first time. The wait doubles after each check, up to
+        max_poll_interval.
+        """
+        return 5
+
+    @property
+    def max_poll_interval(self) -> float:
+        return 300
+
+    @property
+    def job_timeout(self) -> Optional[float]:
+        """
+        Override to give up on jobs which did not complete after this many seconds. A job which times out is handled like a failed job.
+        """
+        return None
+
+    @property
+    def max_job_attempts(self) -> int:
+        """
+        How many times a job is submitted before giving up on it, when it fails or times out.
+        """
+        return 3
+
+    # Records are not output in cursor order since jobs complete in any order, so the state can only be saved at the end of each slice
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return None
+
+    @property
+    def state_checkpoint_seconds(self) -> Optional[float]:
+        return None
+
+    @property
+    def state_checkpoint_bytes(self) -> Optional[int]:
+        return None
+
+    @abstractmethod
+    def job_params(self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        :return: the parameters of each of the jobs to run to read the input slice, e.g: one per day of the slice's date range
+        """
+
+    @abstractmethod
+    def create_job(self, params: Mapping[str, Any]) -> Any:
+        """
+        Submits a job.
+
+        :param params: the parameters of the job, as returned by job_params
+        :return: anything needed by check_job and read_job_results to identify the job, e.g: its id
+        """
+
+    @abstractmethod
+    def check_job(self, job: Any) -> AsyncJobStatus:
+        """
+        :return: the current status of the job
+        """
+
+    @abstractmethod
+    def read_job_results(self, job: Any) -> Iterable[Mapping[str, Any]]:
+        """
+        :return: the records produced by a completed job
+        """
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        for job in self._run_jobs(self.job_params(stream_slice=stream_slice, stream_state=stream_state or {})):
+            yield from self.read_job_results(job)
+
+    def _run_jobs(self, jobs_params: Iterable[Mapping[str, Any]]) -> Iterator[Any]:
+        """
+        Runs the jobs, keeping up to max_running_jobs of them running at the same time.
+
+        :return: an iterator of the jobs, in the order they complete
+        """
+        pending = iter(jobs_params)
+        running: List[_RunningJob] = []
+        while True:
+            while len(running) < self.max_running_jobs:
+                params = next(pending, _NO_MORE_JOBS)
+                if params is _NO_MORE_JOBS:
+                    break
+                running.append(self._submit_job(params, attempt=1))
+            if not running:
+                return
+
+            now = time.monotonic()
+            next_poll_at = min(job.next_poll_at for job in running)
+            if next_poll_at > now:
+                time.sleep(next_poll_at - now)
+                continue
+
+            for running_job in [job for job in running if job.next_poll_at <= now]:
+                status = self.check_job(running_job.job)
+                if status == AsyncJobStatus.COMPLETED:
+                    self.logger.info(f"Job {running_job.job} completed after {now - running_job.started_at:.0f} seconds")
+                    running.remove(running_job)
+                    yield running_job.job
+                elif status == AsyncJobStatus.FAILED or self._timed_out(running_job, now):
+                    running.remove(running_job)
+                    running.append(self._retry_job(running_job, status))
+                else:
+                    running_job.next_poll_at = now + running_job.poll_interval
+                    running_job.poll_interval = min(running_job.poll_interval * 2, self.max_poll_interval)
+
+    def _submit_job(self, params: Mapping[str, Any], attempt: int) -> _RunningJob:
+        job = self.create_job(params)
+        self.logger.info(f"Submitted job {job} (attempt {attempt})")
+        now = time.monotonic()
+        return _RunningJob(
+            params=params, job=job, attempt=attempt, started_at=now, next_poll_at=now + self.poll_interval, poll_interval=self.poll_interval
+        )
+
+    def _timed_out(self, running_job: _RunningJob, now: float) -> bool:
+        return self.job_timeout is not None and now - running_job.started_at > self.job_timeout
+
+    def _retry_job(self, running_job: _RunningJob, status: AsyncJobStatus) -> _RunningJob:
+        outcome = "failed" if status == AsyncJobStatus.FAILED else f"did not complete after {self.job_timeout} seconds"
+        if running_job.attempt >= self.max_job_attempts:
+            raise AsyncJobFailed(f"Job {running_job.job} {outcome}, giving up after {running_job.attempt} attempts")
+        self.logger.warn(f"Job {running_job.job} {outcome}, submitting it again")
+        return self._submit_job(running_job.params, attempt=running_job.attempt + 1)
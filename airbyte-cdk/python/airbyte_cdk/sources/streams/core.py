@@ -25,12 +25,16 @@
 
 import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import partial
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import AirbyteStream, SyncMode
+from airbyte_cdk.sources.utils.concurrency import read_concurrently
+from airbyte_cdk.sources.utils.metrics import StreamMetrics
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
+from airbyte_cdk.sources.utils.transform import TransformConfig
 
 
 def package_name_from_class(cls: object) -> str:
@@ -90,6 +94,27 @@ class Stream(ABC):
 
         return stream
 
+    @property
+    def metrics(self) -> StreamMetrics:
+        """
+        Counters of this stream's reads (records, HTTP requests, retries, time spent on the network or parsing responses, etc..), which the
+        AbstractSource reports periodically. Streams can keep their own metrics too, e.g: self.metrics.increment("pages").
+        """
+        if getattr(self, "_metrics", None) is None:
+            self._metrics = StreamMetrics(self.name)
+        return self._metrics
+
+    @property
+    def transform_config(self) -> Optional[TransformConfig]:
+        """
+        Override to make the records output by this stream conform to its JSON schema (see get_json_schema), e.g: to cast values to the type
+        declared by the schema, normalize dates or drop undeclared fields. The schema is compiled once per sync and records are transformed
+        after they are read, right before being output: get_updated_state receives records as returned by read_records.
+
+        return None (the default) to output records as returned by read_records.
+        """
+        return None
+
     @property
     def supports_incremental(self) -> bool:
         """
@@ -134,6 +159,50 @@ class Stream(ABC):
         """
         return [None]
 
+    @property
+    def max_concurrent_slices(self) -> Optional[int]:
+        """
+        Decides how many slices of this stream are read at the same time. E.g: if this returns a value of 8, then up to 8 slices returned by
+        stream_slices are read concurrently in a pool of worker threads, and their records are output as soon as they are read.
+
+        When reading incrementally, records are applied to the stream state in slice order and state is only checkpointed up to the last slice
+        for which all preceding slices were fully read, so the output state is the same as when reading slices one after another. Note that each
+        slice's read_records is passed the state committed when the slice starts, which may not include records of slices still being read.
+
+        read_records must be safe to call from several threads at the same time to enable this.
+
+        return None (the default) to read slices one after another.
+        """
+        return None
+
+    @property
+    def max_records_ahead_of_head_slice(self) -> int:
+        """
+        When reading slices concurrently and incrementally, records of a slice can only be applied to the stream state once all the slices
+        before it were fully read, so they are held in memory until then. Decides how many records a slice may read while an earlier slice
+        is still being read: once it read that many, it waits for all the earlier slices to complete. This bounds the memory used to hold
+        records back to max_concurrent_slices * max_records_ahead_of_head_slice records.
+        """
+        return 10000
+
+    def read_slices_concurrently(
+        self, slices_read_kwargs: Iterable[Mapping[str, Any]], max_records_ahead: Optional[int] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Reads several slices at the same time, up to max_concurrent_slices. Used by the AbstractSource when max_concurrent_slices is set.
+
+        By default, each slice is read by calling read_records in a pool of worker threads. Override to read slices concurrently by other means
+        (e.g: an event loop).
+
+        :param slices_read_kwargs: for each slice, the keyword arguments of the read_records call which reads it
+        :param max_records_ahead: if set, how many records a slice may read while an earlier slice is still being read, see
+        max_records_ahead_of_head_slice
+        :return: an iterator of (index, record) tuples where index is the position of the slice in slices_read_kwargs, followed by
+        (index, ITERABLE_EXHAUSTED) once all the records of a slice were returned. See airbyte_cdk.sources.utils.concurrency.read_concurrently.
+        """
+        slice_readers = (partial(self.read_records, **read_kwargs) for read_kwargs in slices_read_kwargs)
+        return read_concurrently(slice_readers, max_workers=self.max_concurrent_slices, max_items_ahead=max_records_ahead)
+
     @property
     def state_checkpoint_interval(self) -> Optional[int]:
         """
@@ -148,6 +217,40 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def state_checkpoint_seconds(self) -> Optional[float]:
+        """
+        Decides how often to checkpoint state in time: if this returns a value of 300, then state is persisted once 5 minutes passed since it
+        was last persisted (checked whenever a record is read). Useful for slow streams, whose progress would otherwise be saved too rarely.
+
+        Combines with state_checkpoint_interval and state_checkpoint_bytes: state is checkpointed as soon as any of them is reached. The same
+        ordering requirements as state_checkpoint_interval apply. return None to not checkpoint state based on time.
+        """
+        return None
+
+    @property
+    def state_checkpoint_bytes(self) -> Optional[int]:
+        """
+        Decides how often to checkpoint state in volume of data: if this returns a value of 10000000, then state is persisted once 10MB of
+        records (serialized as JSON) were read since it was last persisted. Useful for streams whose records vary a lot in size. The volume of
+        records is estimated from the size of a sample of them, so checkpoints may come a little earlier or later than this.
+
+        Combines with state_checkpoint_interval and state_checkpoint_seconds: state is checkpointed as soon as any of them is reached. The same
+        ordering requirements as state_checkpoint_interval apply. return None to not checkpoint state based on volume.
+        """
+        return None
+
+    @property
+    def lazy_state_updates(self) -> bool:
+        """
+        Override to return True to compute the state lazily: rather than calling get_updated_state for every record, the record with the highest
+        cursor value is tracked, and get_updated_state is only called with that record when the state is checkpointed.
+
+        Only enable this if get_updated_state keeps the highest cursor value it was given (the most common implementation), and the cursor
+        values of the stream's records can be compared with each other.
+        """
+        return False
+
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """
         Override to extract state from the latest record. Needed to implement incremental sync.
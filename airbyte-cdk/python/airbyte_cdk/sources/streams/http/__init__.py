@@ -1,5 +1,21 @@
 # Initialize Streams Package
+from .async_http import AsyncHttpStream
+from .cassette import Cassette, use_cassette
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream
+from .rate_limiting import BackoffPolicy, CircuitBreaker, RateLimiter, RateLimitPolicy
+from .session import ConnectionPoolConfig, create_session
 
-__all__ = ["HttpStream", "UserDefinedBackoffException"]
+__all__ = [
+    "AsyncHttpStream",
+    "BackoffPolicy",
+    "Cassette",
+    "CircuitBreaker",
+    "ConnectionPoolConfig",
+    "HttpStream",
+    "RateLimiter",
+    "RateLimitPolicy",
+    "UserDefinedBackoffException",
+    "create_session",
+    "use_cassette",
+]
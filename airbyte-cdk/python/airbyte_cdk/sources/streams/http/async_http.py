@@ -0,0 +1,225 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import asyncio
+import time
+from abc import ABC
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import requests
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.utils.concurrency import iterate_async, read_concurrently_async
+from requests import codes
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .auth.core import HttpAuthenticator, NoAuth
+from .cassette import Cassette, get_active_cassette
+from .exceptions import DefaultBackoffException, UserDefinedBackoffException
+from .http import HttpStream
+from .rate_limiting import BackoffPolicy, RateLimiter
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # aiohttp is an optional dependency, see the "async" extra in setup.py
+    aiohttp = None
+
+logger = AirbyteLogger()
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    Base abstract class for an Airbyte Stream using the HTTP protocol, which sends its requests with asyncio (using aiohttp) instead of requests.
+
+    It is overridden exactly like HttpStream: path, request_params, next_page_token, parse_response, should_retry, backoff_time, etc.. all
+    receive the same arguments, and responses are handed to them as requests.Response objects once their body was read.
+
+    What changes is how the stream is read: all the slices read concurrently (see max_concurrent_slices) are read as tasks of a single event
+    loop rather than in a pool of threads, so a stream can have a large number of requests in flight (e.g: one per sub-resource) without
+    spawning a thread for each. The AbstractSource reads AsyncHttpStreams alongside regular streams without any special handling.
+    """
+
+    def __init__(self, authenticator: HttpAuthenticator = NoAuth(), rate_limiter: RateLimiter = None, backoff_policy: BackoffPolicy = None):
+        if aiohttp is None:
+            raise ImportError("AsyncHttpStream requires aiohttp. Install it with `pip install airbyte-cdk[async]`.")
+        super().__init__(authenticator=authenticator, rate_limiter=rate_limiter, backoff_policy=backoff_policy)
+        self._client_session: Optional["aiohttp.ClientSession"] = None
+        # The event loop the client session was created in
+        self._client_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def max_connections(self) -> int:
+        """
+        Override to change the maximum number of connections opened at the same time by this stream, across all hosts.
+        """
+        return 100
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        records = self.read_records_async(
+            sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+        )
+        yield from iterate_async(records, cleanup=self._close_client_session)
+
+    def read_slices_concurrently(
+        self, slices_read_kwargs: Iterable[Mapping[str, Any]], max_records_ahead: Optional[int] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        slice_readers = (lambda read_kwargs=read_kwargs: self.read_records_async(**read_kwargs) for read_kwargs in slices_read_kwargs)
+        return read_concurrently_async(
+            slice_readers, max_concurrency=self.max_concurrent_slices, cleanup=self._close_client_session, max_items_ahead=max_records_ahead
+        )
+
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Same as HttpStream.read_records, but as an async generator which must run on an event loop.
+        """
+        stream_state = stream_state or {}
+        pagination_complete = False
+
+        next_page_token = None
+        while not pagination_complete:
+            # Authenticators may block (e.g: while refreshing an OAuth token with requests), which must not stall the requests in flight on the
+            # event loop, so the auth header is fetched in a thread
+            auth_header = await asyncio.get_running_loop().run_in_executor(None, self.authenticator.get_auth_header)
+            request = self._build_request(
+                stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token, auth_header=auth_header
+            )
+            response = await self._send_request_async(request)
+            for record in self._parse_response(response, stream_state=stream_state, stream_slice=stream_slice):
+                yield record
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+
+    async def _send_request_async(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Sends the request, retrying it with the same rules as HttpStream._send_request: user defined backoff times when backoff_time returns one,
+        exponential backoff otherwise, and connection errors or timeouts are retried too. See backoff_policy.
+        """
+        policy = self.backoff_policy
+        breaker = policy.circuit_breaker
+        started_at = time.monotonic()
+        tries = 0
+        while True:
+            tries += 1
+            out_of_time = policy.max_time is not None and time.monotonic() - started_at >= policy.max_time
+            try:
+                with breaker.request() if breaker else nullcontext():
+                    response = await self._send_async(request)
+            except UserDefinedBackoffException as e:
+                if tries >= policy.max_tries or out_of_time:
+                    logger.error(f"Max retry limit reached. Request: {e.request}, Response: {e.response}")
+                    raise
+                logger.info(f"Retrying. Sleeping for {e.backoff} seconds")
+                self.metrics.increment("http_retries")
+                with self.metrics.timer("backoff_seconds"):
+                    await asyncio.sleep(e.backoff + 1)  # extra second to cover any fractions of second
+                continue
+            except (DefaultBackoffException, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                response = getattr(e, "response", None)
+                if response is not None and response.status_code != codes.too_many_requests and 400 <= response.status_code < 500:
+                    logger.info(f"Giving up for returned HTTP status: {response.status_code}")
+                    raise
+                if tries >= policy.max_tries or out_of_time:
+                    raise
+                wait = policy.wait_time(tries)
+                logger.info(f"Caught retryable error '{e}' after {tries} tries. Waiting {wait} seconds then retrying...")
+                self.metrics.increment("http_retries")
+                with self.metrics.timer("backoff_seconds"):
+                    await asyncio.sleep(wait)
+                continue
+            return response
+
+    async def _send_async(self, request: requests.PreparedRequest) -> requests.Response:
+        session = self._get_client_session()
+        if self._rate_limiter:
+            with self.metrics.timer("rate_limit_wait_seconds"):
+                await self._rate_limiter.acquire_async(request)
+        response = None
+        self.metrics.increment("http_requests")
+        cassette = get_active_cassette()
+        try:
+            # Other requests run on the event loop in the meantime, so this is the latency of the request rather than time spent on it
+            with self.metrics.timer("request_seconds"):
+                if cassette and cassette.mode == Cassette.REPLAY:
+                    await asyncio.sleep(cassette.latency)
+                    response = cassette.replay(request)
+                else:
+                    async with session.request(
+                        request.method, URL(request.url, encoded=True), headers=request.headers, data=request.body
+                    ) as client_response:
+                        body = await client_response.read()
+                    response = self._as_requests_response(request, client_response, body)
+                    if cassette:
+                        cassette.record(request, response)
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release(request, response)
+        self.metrics.increment("response_bytes", len(response.content))
+        self._check_response(request, response)
+        return response
+
+    def _get_client_session(self) -> "aiohttp.ClientSession":
+        # aiohttp sessions are bound to the event loop they are created in, so a session is created (and later closed) for each loop
+        loop = asyncio.get_running_loop()
+        if self._client_session is None or self._client_session.closed or self._client_session_loop is not loop:
+            self._client_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_connections))
+            self._client_session_loop = loop
+        return self._client_session
+
+    async def _close_client_session(self):
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+            self._client_session_loop = None
+
+    @staticmethod
+    def _as_requests_response(
+        request: requests.PreparedRequest, client_response: "aiohttp.ClientResponse", body: bytes
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = client_response.status
+        response.reason = client_response.reason
+        response.headers = CaseInsensitiveDict(client_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(client_response.url)
+        response.request = request
+        response._content = body
+        return response
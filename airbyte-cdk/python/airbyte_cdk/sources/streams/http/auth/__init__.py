@@ -2,10 +2,12 @@
 from .core import HttpAuthenticator, NoAuth
 from .oauth import Oauth2Authenticator
 from .token import TokenAuthenticator
+from .token_manager import TokenManager
 
 __all__ = [
     "HttpAuthenticator",
     "NoAuth",
     "Oauth2Authenticator",
     "TokenAuthenticator",
+    "TokenManager",
 ]
@@ -25,42 +25,55 @@
 
 from typing import Any, List, Mapping, MutableMapping, Tuple
 
-import pendulum
 import requests
 
+from ..cassette import get_active_cassette
 from .core import HttpAuthenticator
+from .token_manager import TokenManager
 
 
 class Oauth2Authenticator(HttpAuthenticator):
     """
     Generates OAuth2.0 access tokens from an OAuth2.0 refresh token and client credentials.
     The generated access token is attached to each request via the Authorization header.
+
+    Access tokens are refreshed by a TokenManager: ahead of their expiry in the background, once for all the threads using the authenticator,
+    and with retries. Pass the same authenticator to all the streams of a source so they share its access token.
     """
 
-    def __init__(self, token_refresh_endpoint: str, client_id: str, client_secret: str, refresh_token: str, scopes: List[str] = None):
+    def __init__(
+        self,
+        token_refresh_endpoint: str,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        scopes: List[str] = None,
+        session: requests.Session = None,
+        token_manager: TokenManager = None,
+    ):
+        """
+        :param session: the session used to send token refresh requests, e.g: the session shared by the source's streams. If None, each refresh
+        opens a new connection.
+        :param token_manager: the token manager caching access tokens. Defaults to a manager refreshing them with refresh_access_token and its
+        default settings.
+        """
         self.token_refresh_endpoint = token_refresh_endpoint
         self.client_secret = client_secret
         self.client_id = client_id
         self.refresh_token = refresh_token
         self.scopes = scopes
-
-        self._token_expiry_date = pendulum.now().subtract(days=1)
-        self._access_token = None
+        self._session = session
+        # Calls refresh_access_token at refresh time rather than binding it now, so subclasses and mocks can replace it
+        self._token_manager = token_manager or TokenManager(lambda: self.refresh_access_token())
 
     def get_auth_header(self) -> Mapping[str, Any]:
         return {"Authorization": f"Bearer {self.get_access_token()}"}
 
     def get_access_token(self):
-        if self.token_has_expired():
-            t0 = pendulum.now()
-            token, expires_in = self.refresh_access_token()
-            self._access_token = token
-            self._token_expiry_date = t0.add(seconds=expires_in)
-
-        return self._access_token
+        return self._token_manager.get_token()
 
     def token_has_expired(self) -> bool:
-        return pendulum.now() > self._token_expiry_date
+        return self._token_manager.token_has_expired()
 
     def get_refresh_request_body(self) -> Mapping[str, Any]:
         """ Override to define additional parameters """
@@ -81,7 +94,13 @@ class Oauth2Authenticator(HttpAuthenticator):
         returns a tuple of (access_token, token_lifespan_in_seconds)
         """
         try:
-            response = requests.request(method="POST", url=self.token_refresh_endpoint, data=self.get_refresh_request_body())
+            cassette = get_active_cassette()
+            if cassette:
+                request = requests.Request(method="POST", url=self.token_refresh_endpoint, data=self.get_refresh_request_body()).prepare()
+                response = cassette.send(self._session or requests.Session(), request)
+            else:
+                requester = self._session or requests
+                response = requester.request(method="POST", url=self.token_refresh_endpoint, data=self.get_refresh_request_body())
             response.raise_for_status()
             response_json = response.json()
             return response_json["access_token"], response_json["expires_in"]
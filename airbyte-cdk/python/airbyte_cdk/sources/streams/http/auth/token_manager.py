@@ -0,0 +1,132 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import threading
+import time
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import backoff
+import requests
+from airbyte_cdk.logger import AirbyteLogger
+
+logger = AirbyteLogger()
+
+
+class _Token(NamedTuple):
+    value: str
+    # Monotonic times at which the token should be refreshed in the background, and after which it can't be used anymore
+    refresh_at: float
+    expires_at: float
+
+
+class TokenManager:
+    """
+    Caches an access token and refreshes it when needed, for any number of threads:
+
+    - once the token is close to its expiry (see refresh_ahead), the next caller triggers a refresh in a background thread and keeps using the
+      current token in the meantime, so requests don't stall on the token endpoint
+    - once the token expired, callers wait for a refresh. Concurrent callers wait for the same refresh rather than each sending their own
+    - refreshes failing with a transient error (connection errors, timeouts, 429 and 5XX responses) are retried with exponential backoff
+
+    Share a manager (or the authenticator holding it) between all the streams of a source so they share its token.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], Tuple[str, float]],
+        refresh_ahead: float = 300,
+        max_tries: int = 5,
+        factor: float = 1,
+    ):
+        """
+        :param refresh: fetches a new token, returned as a tuple of (access_token, token_lifespan_in_seconds)
+        :param refresh_ahead: how many seconds before its expiry a token is refreshed in the background. Capped to half of the token lifespan
+        :param max_tries: how many times a refresh is attempted before giving up
+        :param factor: multiplier of the exponential backoff between attempts
+        """
+        self._refresh = refresh
+        self.refresh_ahead = refresh_ahead
+        self.max_tries = max_tries
+        self.factor = factor
+        self._token: Optional[_Token] = None
+        # Held for the whole duration of a refresh (sometimes by a background thread), so concurrent refreshes are never sent
+        self._refresh_lock = threading.Lock()
+
+    def get_token(self) -> str:
+        token = self._token
+        now = time.monotonic()
+        if token is None or now >= token.expires_at:
+            with self._refresh_lock:
+                # Another thread may have refreshed the token while this one was waiting for the lock
+                if self._token is None or time.monotonic() >= self._token.expires_at:
+                    self._refresh_with_retries()
+                return self._token.value
+
+        if now >= token.refresh_at and self._refresh_lock.acquire(blocking=False):
+            threading.Thread(target=self._refresh_in_background, name="TokenManagerRefresh", daemon=True).start()
+        return token.value
+
+    def token_has_expired(self) -> bool:
+        return self._token is None or time.monotonic() >= self._token.expires_at
+
+    def invalidate(self):
+        """
+        Drops the current token so the next call to get_token refreshes it, e.g: when the API rejected the token before its expiry
+        """
+        self._token = None
+
+    def _refresh_in_background(self):
+        try:
+            self._refresh_with_retries()
+        except Exception as e:
+            # The current token is still valid: callers only wait for a refresh once it expires, and retry it then
+            logger.warn(f"Failed to refresh access token ahead of its expiry: {e!r}")
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh_with_retries(self):
+        @backoff.on_exception(backoff.expo, Exception, max_tries=self.max_tries, factor=self.factor, giveup=lambda e: not _is_transient(e))
+        def refresh() -> Tuple[str, float]:
+            # Wrapped in a function since backoff requires a __name__, which callables like partials don't have
+            return self._refresh()
+
+        requested_at = time.monotonic()
+        value, lifespan = refresh()
+        expires_at = requested_at + lifespan
+        self._token = _Token(value=value, refresh_at=expires_at - min(self.refresh_ahead, lifespan / 2), expires_at=expires_at)
+
+
+def _is_transient(exception: BaseException) -> bool:
+    """
+    :return: whether the exception, or any exception it was raised from, is a connection error, timeout or retryable HTTP error
+    """
+    while exception is not None:
+        if isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        response = getattr(exception, "response", None)
+        if isinstance(exception, requests.exceptions.HTTPError) and response is not None:
+            return response.status_code == requests.codes.too_many_requests or response.status_code >= 500
+        exception = exception.__cause__
+    return False
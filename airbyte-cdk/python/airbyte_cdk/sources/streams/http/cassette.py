@@ -0,0 +1,232 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import CassetteMissError
+
+CASSETTE_ENV_VAR = "AIRBYTE_HTTP_CASSETTE"
+CASSETTE_MODE_ENV_VAR = "AIRBYTE_HTTP_CASSETTE_MODE"
+CASSETTE_LATENCY_ENV_VAR = "AIRBYTE_HTTP_CASSETTE_LATENCY"
+CASSETTE_RATE_LIMIT_EVERY_ENV_VAR = "AIRBYTE_HTTP_CASSETTE_RATE_LIMIT_EVERY"
+
+# Request key, as (method, URL, hash of the body)
+_RequestKey = Tuple[str, str, Optional[str]]
+
+
+class Cassette:
+    """
+    Records the HTTP requests sent by a connector and their responses to a file, or replays the recorded responses instead of sending the
+    requests, so a connector can be run (e.g: benchmarked) reproducibly and offline.
+
+    In replay mode, requests are matched to recorded responses by method, URL and body. A request sent several times gets the responses
+    recorded for it in order, and the last one once they were all replayed. Replayed responses can be slowed down by a simulated latency, and
+    rate limits can be simulated by answering every rate_limit_every-th request with a 429 response.
+
+    Request headers are not recorded, and request bodies are only recorded as a hash, so credentials sent in headers or bodies (e.g: OAuth
+    refresh tokens) don't end up in cassettes. Credentials passed in URLs and in response bodies (e.g: access tokens) do.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = REPLAY,
+        latency: float = 0,
+        rate_limit_every: Optional[int] = None,
+        retry_after: float = 1,
+        ignored_params: List[str] = None,
+    ):
+        """
+        :param path: the file requests are recorded to or replayed from, as JSON lines
+        :param mode: either Cassette.RECORD or Cassette.REPLAY. Recording overwrites the file
+        :param latency: how long (in seconds) to wait before returning each replayed response
+        :param rate_limit_every: if set, every rate_limit_every-th replayed request gets a 429 response instead of its recorded response
+        :param retry_after: the value of the Retry-After header of simulated 429 responses
+        :param ignored_params: query parameters left out when matching requests, e.g: parameters whose value depends on the time of the run
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown cassette mode {mode}, expected {self.RECORD} or {self.REPLAY}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.ignored_params = set(ignored_params or [])
+        self._lock = threading.Lock()
+        self._replayed_requests = 0
+        self._responses: Dict[_RequestKey, Deque[Mapping[str, Any]]] = defaultdict(deque)
+        if mode == self.RECORD:
+            open(path, "w").close()
+        else:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassette"]:
+        """
+        :return: the cassette configured by the AIRBYTE_HTTP_CASSETTE* environment variables, or None if AIRBYTE_HTTP_CASSETTE isn't set
+        """
+        path = os.environ.get(CASSETTE_ENV_VAR)
+        if not path:
+            return None
+        rate_limit_every = os.environ.get(CASSETTE_RATE_LIMIT_EVERY_ENV_VAR)
+        return cls(
+            path,
+            mode=os.environ.get(CASSETTE_MODE_ENV_VAR, cls.REPLAY),
+            latency=float(os.environ.get(CASSETTE_LATENCY_ENV_VAR, 0)),
+            rate_limit_every=int(rate_limit_every) if rate_limit_every else None,
+        )
+
+    def send(self, session: requests.Session, request: requests.PreparedRequest, **send_kwargs) -> requests.Response:
+        """
+        Sends the request with the session and records its response in record mode, or returns its recorded response in replay mode.
+        """
+        if self.mode == self.REPLAY:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.replay(request)
+
+        response = session.send(request, **send_kwargs)
+        self.record(request, response)
+        return response
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response):
+        # Streamed bodies are downloaded right away to be recorded, then read from memory
+        body = response.content or b""
+        response.raw = io.BytesIO(body)
+        try:
+            recorded_body = {"body": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            recorded_body = {"body_base64": base64.b64encode(body).decode("ascii")}
+        method, url, body_hash = self._request_key(request)
+        entry = {
+            "request": {"method": method, "url": url, "body_sha256": body_hash},
+            "response": {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                **recorded_body,
+            },
+        }
+        with self._lock, open(self.path, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        key = self._request_key(request)
+        with self._lock:
+            self._replayed_requests += 1
+            if self.rate_limit_every and self._replayed_requests % self.rate_limit_every == 0:
+                recorded = {
+                    "status_code": 429,
+                    "reason": "Too Many Requests",
+                    "headers": {"Retry-After": str(self.retry_after)},
+                    "body": "",
+                }
+            else:
+                responses = self._responses.get(key)
+                if not responses:
+                    raise CassetteMissError(f"No response was recorded in {self.path} for {key[0]} {key[1]}", request=request)
+                recorded = responses.popleft() if len(responses) > 1 else responses[0]
+        return self._as_response(request, recorded)
+
+    def _load(self):
+        with open(self.path) as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    recorded_request = entry["request"]
+                    key = (recorded_request["method"], self._normalize_url(recorded_request["url"]), recorded_request["body_sha256"])
+                    self._responses[key].append(entry["response"])
+
+    def _request_key(self, request: requests.PreparedRequest) -> _RequestKey:
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        return request.method.upper(), self._normalize_url(request.url), hashlib.sha256(body).hexdigest() if body else None
+
+    def _normalize_url(self, url: str) -> str:
+        scheme, netloc, path, query, fragment = urlsplit(url)
+        params = [(name, value) for name, value in parse_qsl(query, keep_blank_values=True) if name not in self.ignored_params]
+        return urlunsplit((scheme, netloc, path, urlencode(sorted(params)), fragment))
+
+    @staticmethod
+    def _as_response(request: requests.PreparedRequest, recorded: Mapping[str, Any]) -> requests.Response:
+        if "body_base64" in recorded:
+            body = base64.b64decode(recorded["body_base64"])
+        else:
+            body = recorded["body"].encode("utf-8")
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(body)
+        response._content = body
+        response._content_consumed = True
+        return response
+
+
+_active_cassette: Optional[Cassette] = None
+_active_cassette_loaded = False
+
+
+def get_active_cassette() -> Optional[Cassette]:
+    """
+    :return: the cassette HTTP requests are recorded to or replayed from: the one set by use_cassette if any, otherwise the one configured by
+    environment variables (see Cassette.from_env), so any connector can be run against a cassette without changing its code.
+    """
+    global _active_cassette, _active_cassette_loaded
+    if not _active_cassette_loaded:
+        _active_cassette = Cassette.from_env()
+        _active_cassette_loaded = True
+    return _active_cassette
+
+
+@contextmanager
+def use_cassette(cassette: Optional[Cassette]) -> Iterator[Optional[Cassette]]:
+    """
+    Records HTTP requests to, or replays them from, the cassette in the with block
+    """
+    global _active_cassette
+    previous = get_active_cassette()
+    _active_cassette = cassette
+    try:
+        yield cassette
+    finally:
+        _active_cassette = previous
@@ -49,3 +49,15 @@ class UserDefinedBackoffException(BaseBackoffException):
 
 class DefaultBackoffException(BaseBackoffException):
     pass
+
+
+class CircuitBreakerOpenError(requests.exceptions.RequestException):
+    """
+    Raised instead of sending a request while the circuit breaker of a BackoffPolicy is open, i.e: after too many consecutive failures
+    """
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """
+    Raised when replaying a cassette, for a request which was not recorded in the cassette
+    """
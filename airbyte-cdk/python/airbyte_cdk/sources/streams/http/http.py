@@ -23,16 +23,19 @@
 #
 
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional
 
 import requests
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.concurrency import ITERABLE_EXHAUSTED, read_concurrently
 
 from .auth.core import HttpAuthenticator, NoAuth
+from .cassette import get_active_cassette
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import BackoffPolicy, RateLimiter, parse_retry_after
 
 
 class HttpStream(Stream, ABC):
@@ -42,9 +45,26 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
 
-    def __init__(self, authenticator: HttpAuthenticator = NoAuth()):
+    def __init__(
+        self,
+        authenticator: HttpAuthenticator = NoAuth(),
+        session: requests.Session = None,
+        rate_limiter: RateLimiter = None,
+        backoff_policy: BackoffPolicy = None,
+    ):
+        """
+        :param authenticator: the authenticator used to authenticate every request of this stream
+        :param session: the session used to send requests. Pass the same session to all the streams of a source to share their connection
+        pool, see airbyte_cdk.sources.streams.http.session.create_session. By default each stream uses its own session.
+        :param rate_limiter: paces the requests of this stream to stay within the API's rate limits. Pass the same rate limiter to all the
+        streams of a source so the limits apply to all of their requests. By default requests are only slowed down once the API throttles them.
+        :param backoff_policy: how requests are retried, see the backoff_policy property. Pass the same policy to all the streams of a source to
+        share its circuit breaker.
+        """
         self._authenticator = authenticator
-        self._session = requests.Session()
+        self._session = session or requests.Session()
+        self._rate_limiter = rate_limiter
+        self._backoff_policy = backoff_policy or BackoffPolicy()
 
     @property
     @abstractmethod
@@ -146,6 +166,33 @@ class HttpStream(Stream, ABC):
         """
         return response.status_code == 429 or 500 <= response.status_code < 600
 
+    @property
+    def stream_responses(self) -> bool:
+        """
+        Override to return True to download response bodies incrementally, as parse_response reads them, rather than entirely before calling it.
+        Use this for large responses (e.g: bulk exports) which would not fit in memory: parse_response should then read the body with
+        response.iter_content, response.iter_lines or response.raw, see airbyte_cdk.sources.streams.http.streaming for helpers to spool bodies
+        to disk and decompress them on the fly.
+
+        Note that a streamed body can only be read once: next_page_token must not read the body if parse_response already did. The response is
+        closed after next_page_token is called. AsyncHttpStream always reads bodies entirely.
+        """
+        return False
+
+    @property
+    def page_prefetch_depth(self) -> Optional[int]:
+        """
+        Override to request the next pages of a slice in the background while the records of the current page are parsed and output, which
+        hides the network latency of streams that cannot be split into slices read concurrently. E.g: if this returns 2, up to 2 pages are
+        fetched ahead of the page being parsed.
+
+        Only enable this if next_page_token can compute the next token from the response alone (e.g: a cursor in the response body or a Link
+        header): in this mode, next_page_token is called before parse_response, from a background thread.
+
+        return None (the default) to request the next page only once all the records of the current page were read.
+        """
+        return None
+
     def backoff_time(self, response: requests.Response) -> Optional[float]:
         """
         Override this method to dynamically determine backoff time e.g: by reading the X-Retry-After header.
@@ -153,10 +200,18 @@ class HttpStream(Stream, ABC):
         This method is called only if should_backoff() returns True for the input request.
 
         :return how long to backoff in seconds. The return value may be a floating point number for subsecond precision. Returning None defers backoff
-        to the default backoff behavior (e.g using an exponential algorithm).
+        to the default backoff behavior (e.g using the Retry-After header if there is one, an exponential algorithm otherwise).
         """
         return None
 
+    @property
+    def backoff_policy(self) -> BackoffPolicy:
+        """
+        Override to change how requests are retried (number of attempts, exponential backoff factor, jitter, maximum time spent retrying, circuit
+        breaker). Defaults to the policy passed to the constructor, or to BackoffPolicy's defaults.
+        """
+        return self._backoff_policy
+
     def _create_prepared_request(
         self, path: str, headers: Mapping = None, params: Mapping = None, json: Any = None
     ) -> requests.PreparedRequest:
@@ -168,13 +223,11 @@ class HttpStream(Stream, ABC):
 
         return requests.Request(**args).prepare()
 
-    # TODO allow configuring these parameters. If we can get this into the requests library, then we can do it without the ugly exception hacks
+    # TODO If we can get this into the requests library, then we can do it without the ugly exception hacks
     #  see https://github.com/litl/backoff/pull/122
-    @default_backoff_handler(max_tries=5, factor=5)
-    @user_defined_backoff_handler(max_tries=5)
     def _send_request(self, request: requests.PreparedRequest) -> requests.Response:
         """
-        Wraps sending the request in rate limit and error handlers.
+        Wraps sending the request in rate limit and error handlers, configured by the stream's backoff_policy.
 
         This method handles two types of exceptions:
             1. Expected transient exceptions e.g: 429 status code.
@@ -190,10 +243,66 @@ class HttpStream(Stream, ABC):
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
         """
-        response: requests.Response = self._session.send(request)
+        attempts_seconds = []
+
+        def send_attempt(request: requests.PreparedRequest) -> requests.Response:
+            started_at = time.perf_counter()
+            try:
+                return self._send(request)
+            finally:
+                attempts_seconds.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        try:
+            return self.backoff_policy.retrying(send_attempt)(request)
+        finally:
+            if len(attempts_seconds) > 1:
+                self.metrics.increment("http_retries", len(attempts_seconds) - 1)
+                # Whatever time wasn't spent sending the request was spent waiting to retry it
+                self.metrics.increment("backoff_seconds", time.perf_counter() - started_at - sum(attempts_seconds))
+
+    def _send(self, request: requests.PreparedRequest) -> requests.Response:
+        if self._rate_limiter:
+            with self.metrics.timer("rate_limit_wait_seconds"):
+                self._rate_limiter.acquire(request)
+        response = None
+        self.metrics.increment("http_requests")
+        cassette = get_active_cassette()
+        try:
+            with self.metrics.timer("request_seconds"):
+                if cassette:
+                    response = cassette.send(self._session, request, stream=self.stream_responses)
+                else:
+                    response = self._session.send(request, stream=self.stream_responses)
+        finally:
+            if self._rate_limiter:
+                self._rate_limiter.release(request, response)
+        self._count_response_bytes(response)
+        try:
+            self._check_response(request, response)
+        except Exception:
+            if self.stream_responses:
+                # Read the body of failed responses, so their content is available to whoever handles the error and the connection is released
+                response.content
+            raise
+        return response
+
+    def _count_response_bytes(self, response: requests.Response):
+        if not self.stream_responses:
+            self.metrics.increment("response_bytes", len(response.content or b""))
+        elif response.headers.get("Content-Length", "").isdigit():
+            # The body of streamed responses is only downloaded while parsing them
+            self.metrics.increment("response_bytes", int(response.headers["Content-Length"]))
+
+    def _check_response(self, request: requests.PreparedRequest, response: requests.Response):
+        """
+        Raises a backoff exception if the response should be retried, or an HTTPError if it is otherwise unsuccessful.
+        """
         if self.should_retry(response):
 
             custom_backoff_time = self.backoff_time(response)
+            if custom_backoff_time is None and self.backoff_policy.retry_after:
+                custom_backoff_time = parse_retry_after(response)
             if custom_backoff_time:
                 raise UserDefinedBackoffException(backoff=custom_backoff_time, request=request, response=response)
             else:
@@ -203,7 +312,25 @@ class HttpStream(Stream, ABC):
             # TODO handle ignoring errors
             response.raise_for_status()
 
-        return response
+    def _build_request(
+        self,
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+        auth_header: Mapping[str, Any] = None,
+    ) -> requests.PreparedRequest:
+        """
+        :param auth_header: the authentication headers of the request. Defaults to the ones of the stream's authenticator
+        """
+        if auth_header is None:
+            auth_header = self.authenticator.get_auth_header()
+        request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return self._create_prepared_request(
+            path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            headers=dict(request_headers, **auth_header),
+            params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+        )
 
     def read_records(
         self,
@@ -213,24 +340,53 @@ class HttpStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         stream_state = stream_state or {}
+        if self.page_prefetch_depth:
+            for response in self._prefetch_pages(stream_state=stream_state, stream_slice=stream_slice):
+                yield from self._parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+                if self.stream_responses:
+                    response.close()
+            return
+
         pagination_complete = False
 
         next_page_token = None
         while not pagination_complete:
-            request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-            request = self._create_prepared_request(
-                path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                headers=dict(request_headers, **self.authenticator.get_auth_header()),
-                params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            )
-
+            request = self._build_request(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
             response = self._send_request(request)
-            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            yield from self._parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
 
             next_page_token = self.next_page_token(response)
+            if self.stream_responses:
+                response.close()
             if not next_page_token:
                 pagination_complete = True
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
+
+    def _parse_response(
+        self, response: requests.Response, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None
+    ) -> Iterator[Mapping[str, Any]]:
+        records = self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+        return self.metrics.timed("parse_seconds", records)
+
+    def _prefetch_pages(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None) -> Iterator[requests.Response]:
+        """
+        Fetches the pages of a slice in a background thread, which keeps requesting the following pages while the current one is parsed, until
+        page_prefetch_depth pages are waiting to be parsed.
+        """
+
+        def fetch_pages() -> Iterator[requests.Response]:
+            next_page_token = None
+            while True:
+                request = self._build_request(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+                response = self._send_request(request)
+                # The token is read before the page is handed over, so the next request can be sent while this page is parsed
+                next_page_token = self.next_page_token(response)
+                yield response
+                if not next_page_token:
+                    return
+
+        for _, response in read_concurrently([fetch_pages], max_workers=1, buffer_size=self.page_prefetch_depth):
+            if response is not ITERABLE_EXHAUSTED:
+                yield response
@@ -23,14 +23,23 @@
 #
 
 
+import asyncio
+import random
+import re
 import sys
+import threading
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, List, Mapping, Optional
 
 import backoff
+import requests
 from airbyte_cdk.logger import AirbyteLogger
 from requests import codes, exceptions
 
-from .exceptions import DefaultBackoffException, UserDefinedBackoffException
+from .exceptions import CircuitBreakerOpenError, DefaultBackoffException, UserDefinedBackoffException
 
 TRANSIENT_EXCEPTIONS = (DefaultBackoffException, exceptions.ConnectTimeout, exceptions.ReadTimeout, exceptions.ConnectionError)
 
@@ -38,7 +47,7 @@ TRANSIENT_EXCEPTIONS = (DefaultBackoffException, exceptions.ConnectTimeout, exce
 logger = AirbyteLogger()
 
 
-def default_backoff_handler(max_tries: int, factor: int, **kwargs):
+def default_backoff_handler(max_tries: int, factor: int, jitter: Callable[[float], float] = None, **kwargs):
     def log_retry_attempt(details):
         _, exc, _ = sys.exc_info()
         logger.info(str(exc))
@@ -54,7 +63,7 @@ def default_backoff_handler(max_tries: int, factor: int, **kwargs):
     return backoff.on_exception(
         backoff.expo,
         TRANSIENT_EXCEPTIONS,
-        jitter=None,
+        jitter=jitter,
         on_backoff=log_retry_attempt,
         giveup=should_give_up,
         max_tries=max_tries,
@@ -85,3 +94,367 @@ def user_defined_backoff_handler(max_tries: int, **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+def is_transient_error(exception: BaseException) -> bool:
+    """
+    :return: whether the exception raised while sending a request means the API is unavailable: a connection error, a timeout, or a 429 or 5XX
+    response
+    """
+    if isinstance(exception, exceptions.RequestException) and exception.response is not None:
+        status_code = exception.response.status_code
+        return status_code == codes.too_many_requests or status_code >= 500
+    return isinstance(exception, (exceptions.ConnectionError, exceptions.Timeout))
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests after too many consecutive failures, so a source fails fast (or waits once) while the API is down instead of having
+    each of its requests go through all of its retries.
+
+    Once failure_threshold requests in a row failed, the circuit opens: requests raise a CircuitBreakerOpenError without being sent. After
+    reset_timeout seconds, a single request is let through to probe the API: the circuit closes if it succeeds and opens again if it fails.
+
+    A circuit breaker is thread-safe, and can be shared by all the streams of a source (through their BackoffPolicy) to track the health of an API.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self):
+        """
+        :raises CircuitBreakerOpenError: if the request must not be sent
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or self._clock() - self._opened_at < self.reset_timeout:
+                raise CircuitBreakerOpenError(f"Circuit breaker open after {self._consecutive_failures} consecutive failed requests")
+            self._probing = True
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """
+        Wraps sending a request: raises a CircuitBreakerOpenError if the request must not be sent, otherwise records the request as a success
+        if the with block completes and as a failure if it raises a transient error (see is_transient_error). Any other exception, e.g: a 4XX
+        response or an interruption, says nothing about the health of the API: it only lets another request probe the API.
+        """
+        self.before_request()
+        try:
+            yield
+        except BaseException as e:
+            if is_transient_error(e):
+                self.record_failure()
+            else:
+                self.release_probe()
+            raise
+        self.record_success()
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._probing or self._consecutive_failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.error(f"Opening the circuit breaker after {self._consecutive_failures} consecutive failed requests")
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def release_probe(self):
+        with self._lock:
+            self._probing = False
+
+
+@dataclass
+class BackoffPolicy:
+    """
+    How the requests of a stream are retried. The defaults match the historical behavior of the CDK: Retry-After headers are ignored unless
+    retry_after is enabled.
+
+    max_tries: the maximum number of attempts per request
+    factor: retryable errors are retried after an exponentially growing wait of factor * 2 ** (attempt - 1) seconds
+    max_wait: the maximum number of seconds to wait between two attempts, None for no limit
+    max_time: the maximum number of seconds spent trying to send a request, across all attempts, None for no limit
+    jitter: whether to randomize waits (between 0 and the exponential wait, i.e: "full jitter"). Spreads out the retries of requests which failed
+        at the same time, e.g: requests of concurrent slices hitting the same outage, instead of retrying them all at once
+    retry_after: whether to wait as long as asked by the Retry-After header of retried responses, when HttpStream.backoff_time returns None
+    circuit_breaker: stops sending requests after too many consecutive failures. Share the same breaker across the streams of a source to
+        track the health of the API as a whole
+    """
+
+    max_tries: int = 5
+    factor: float = 5
+    max_wait: Optional[float] = None
+    max_time: Optional[float] = None
+    jitter: bool = False
+    retry_after: bool = False
+    circuit_breaker: Optional[CircuitBreaker] = None
+
+    def wait_time(self, tries: int) -> float:
+        """
+        :return: how long to wait after the tries-th attempt failed with a retryable error, when the server did not say how long to wait
+        """
+        wait = self.factor * 2 ** (tries - 1)
+        if self.max_wait is not None:
+            wait = min(wait, self.max_wait)
+        return random.uniform(0, wait) if self.jitter else wait
+
+    def retrying(
+        self, send: Callable[[requests.PreparedRequest], requests.Response]
+    ) -> Callable[[requests.PreparedRequest], requests.Response]:
+        """
+        Wraps a function sending a single request attempt in the retries and circuit breaker of this policy.
+        """
+
+        def send_through_circuit_breaker(request: requests.PreparedRequest) -> requests.Response:
+            with self.circuit_breaker.request():
+                return send(request)
+
+        wrapped = send_through_circuit_breaker if self.circuit_breaker else send
+        retry_kwargs = {"max_time": self.max_time} if self.max_time is not None else {}
+        wrapped = user_defined_backoff_handler(max_tries=self.max_tries, **retry_kwargs)(wrapped)
+        if self.max_wait is not None:
+            retry_kwargs["max_value"] = self.max_wait
+        return default_backoff_handler(
+            max_tries=self.max_tries, factor=self.factor, jitter=backoff.full_jitter if self.jitter else None, **retry_kwargs
+        )(wrapped)
+
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    :return: how many seconds the Retry-After header of the response asks to wait, given either as a number of seconds or as an HTTP date
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    seconds = _parse_number(value)
+    if seconds is None:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, seconds)
+
+
+# Timestamps above this value in a rate limit reset header are epoch timestamps rather than a number of seconds (i.e: after 2001-09-09)
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# How often (in seconds) a request waiting for a free concurrency slot checks whether one was released
+_CONCURRENCY_POLL_INTERVAL = 0.05
+
+
+class TokenBucket:
+    """
+    Allows up to `rate` requests per `period` seconds on average, with bursts of up to `capacity` requests.
+
+    A token bucket is not thread-safe by itself: callers are expected to hold a lock while using it, see RateLimiter.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, capacity: float = None, clock: Callable[[], float] = time.monotonic):
+        """
+        :param rate: how many requests are allowed per period
+        :param period: the length of a period, in seconds
+        :param capacity: the maximum number of requests which can be sent in a burst. Defaults to rate, i.e: a full period's worth of requests
+        :param clock: returns the current time in seconds
+        """
+        self.refill_rate = rate / period
+        self.capacity = capacity or rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._last_refill = clock()
+
+    def _refill(self):
+        now = self._clock()
+        # _last_refill is in the future while the bucket is paused
+        if now > self._last_refill:
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """
+        :return: how many seconds to wait until `tokens` tokens are available, 0 if they are available right now
+        """
+        self._refill()
+        now = self._clock()
+        pause = max(0.0, self._last_refill - now)
+        missing = tokens - self._tokens
+        return pause + missing / self.refill_rate if missing > 0 else pause
+
+    def consume(self, tokens: float = 1):
+        self._tokens -= tokens
+
+    def limit_remaining(self, remaining: float, reset_after: float = None):
+        """
+        Reconciles the bucket with what the server reports: no more than `remaining` requests can be sent until the server's window resets in
+        `reset_after` seconds. When nothing remains, the bucket is paused until then.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+        if remaining <= 0 and reset_after:
+            self._tokens = 0
+            self._last_refill = max(self._last_refill, self._clock() + reset_after)
+
+
+@dataclass
+class RateLimitPolicy:
+    """
+    A declarative rate limit, as documented by an API. Limits are combined, e.g: 10 requests per second and 300 requests per minute.
+
+    requests_per_second: the maximum sustained number of requests per second
+    requests_per_minute: the maximum sustained number of requests per minute
+    burst: the maximum number of requests sent back to back before pacing requests at the above rates. Defaults to a full second's (or
+        minute's) worth of requests
+    max_concurrent_requests: the maximum number of requests in flight at the same time
+    remaining_header: name of the response header holding the number of requests left in the current window, e.g: X-RateLimit-Remaining.
+        When the server reports fewer requests left than the limiter expects, the limiter slows down accordingly
+    reset_header: name of the response header holding when the current window resets, either as a number of seconds or an epoch timestamp
+    """
+
+    requests_per_second: Optional[float] = None
+    requests_per_minute: Optional[float] = None
+    burst: Optional[int] = None
+    max_concurrent_requests: Optional[int] = None
+    remaining_header: Optional[str] = "X-RateLimit-Remaining"
+    reset_header: Optional[str] = "X-RateLimit-Reset"
+
+    def create_buckets(self, clock: Callable[[], float]) -> List[TokenBucket]:
+        buckets = []
+        if self.requests_per_second:
+            buckets.append(TokenBucket(self.requests_per_second, period=1, capacity=self.burst, clock=clock))
+        if self.requests_per_minute:
+            buckets.append(TokenBucket(self.requests_per_minute, period=60, capacity=self.burst, clock=clock))
+        return buckets
+
+
+@dataclass
+class _Limit:
+    policy: RateLimitPolicy
+    buckets: List[TokenBucket]
+    in_flight: int = 0
+    pattern: Optional["re.Pattern"] = None
+
+
+class RateLimiter:
+    """
+    Paces requests so they stay within the limits of an API, instead of waiting to be throttled with 429 responses.
+
+    A rate limiter is thread-safe: a source should create one per API and pass it to all of its streams (see HttpStream's rate_limiter
+    argument), so the limits apply to all the requests the source sends, whichever stream or thread sends them.
+
+    Each request must fit within the source wide policy as well as the policy of every endpoint it matches.
+    """
+
+    def __init__(
+        self,
+        policy: RateLimitPolicy = None,
+        endpoint_policies: Mapping[str, RateLimitPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param policy: the limits applying to all requests
+        :param endpoint_policies: limits applying to some of the requests only, keyed by a regular expression searched in the request URL
+        :param clock: returns the current time in seconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limits = [_Limit(policy, policy.create_buckets(clock))] if policy else []
+        for pattern, endpoint_policy in (endpoint_policies or {}).items():
+            self._limits.append(_Limit(endpoint_policy, endpoint_policy.create_buckets(clock), pattern=re.compile(pattern)))
+
+    def _matching_limits(self, request: requests.PreparedRequest) -> List[_Limit]:
+        return [limit for limit in self._limits if limit.pattern is None or limit.pattern.search(request.url)]
+
+    def try_acquire(self, request: requests.PreparedRequest) -> float:
+        """
+        Reserves the right to send a request if all the limits it is subject to allow it. Each successful call must be followed by a call to
+        release once the request completed.
+
+        :return: 0 if the request can be sent right away, otherwise how many seconds to wait before trying again
+        """
+        limits = self._matching_limits(request)
+        with self._lock:
+            wait = 0.0
+            for limit in limits:
+                if limit.policy.max_concurrent_requests and limit.in_flight >= limit.policy.max_concurrent_requests:
+                    wait = max(wait, _CONCURRENCY_POLL_INTERVAL)
+                for bucket in limit.buckets:
+                    wait = max(wait, bucket.wait_time())
+            if wait > 0:
+                return wait
+
+            for limit in limits:
+                limit.in_flight += 1
+                for bucket in limit.buckets:
+                    bucket.consume()
+            return 0
+
+    def release(self, request: requests.PreparedRequest, response: requests.Response = None):
+        """
+        Frees the concurrency slots held by a request once it completed, and adapts the limits to the rate limit headers of its response.
+        """
+        limits = self._matching_limits(request)
+        with self._lock:
+            for limit in limits:
+                limit.in_flight -= 1
+                if response is not None:
+                    self._update_from_response(limit, response)
+
+    def acquire(self, request: requests.PreparedRequest):
+        """
+        Blocks until the request can be sent, see try_acquire.
+        """
+        wait = self.try_acquire(request)
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire(request)
+
+    async def acquire_async(self, request: requests.PreparedRequest):
+        """
+        Same as acquire, but waits without blocking the event loop.
+        """
+        wait = self.try_acquire(request)
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self.try_acquire(request)
+
+    def _update_from_response(self, limit: _Limit, response: requests.Response):
+        policy = limit.policy
+        remaining = _parse_number(response.headers.get(policy.remaining_header)) if policy.remaining_header else None
+        reset_after = self._parse_reset(response.headers.get(policy.reset_header)) if policy.reset_header else None
+        if response.status_code == codes.too_many_requests:
+            # The server is throttling us anyway: stop sending requests until it says we can
+            remaining = 0
+            reset_after = parse_retry_after(response) or reset_after
+        if remaining is None:
+            return
+        for bucket in limit.buckets:
+            bucket.limit_remaining(remaining, reset_after)
+
+    @staticmethod
+    def _parse_reset(value: Optional[str]) -> Optional[float]:
+        reset = _parse_number(value)
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(0.0, reset - time.time())
+        return reset
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
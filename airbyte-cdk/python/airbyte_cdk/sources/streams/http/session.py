@@ -0,0 +1,94 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import socket
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """
+    Tuning parameters of the connection pool backing a requests.Session.
+
+    pool_connections: the number of hosts to keep a pool of connections for
+    pool_maxsize: the maximum number of connections kept open to the same host. Should be at least the number of requests sent concurrently
+        to that host (e.g: when reading streams or slices concurrently), otherwise extra connections are opened and discarded after each request
+    pool_block: whether to wait for a connection to be released instead of opening extra connections once pool_maxsize is reached
+    max_retries: how many times failed connections (DNS lookups, refused or reset connections) are retried at the transport level before
+        surfacing the error. HTTP error statuses are never retried at this level, see HttpStream.should_retry for that
+    tcp_keepalive: whether to enable TCP keep-alive probes on pooled connections, which stops idle connections from being dropped by
+        proxies and load balancers between requests
+    adapter_factory: a callable returning the transport adapter to mount on the session instead of the default urllib3 one, e.g: to send
+        requests over HTTP/2. When set, all the other parameters are left to the factory to apply
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    max_retries: int = 0
+    tcp_keepalive: bool = True
+    adapter_factory: Optional[Callable[["ConnectionPoolConfig"], BaseAdapter]] = None
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter which enables TCP keep-alive on the sockets of its pooled connections
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(config: ConnectionPoolConfig = None) -> requests.Session:
+    """
+    Creates a requests.Session backed by a connection pool tuned with the input config.
+
+    A session reuses connections (and therefore TLS handshakes) across requests, and its connection pools can be shared between threads. So a
+    source should usually create a single session and pass it to all of its streams (and authenticator), rather than letting each stream open
+    its own. The session itself isn't thread-safe though: don't mutate it (e.g: its headers, cookies or adapters) once streams started
+    sending requests through it.
+    """
+    config = config or ConnectionPoolConfig()
+    if config.adapter_factory:
+        adapter = config.adapter_factory(config)
+    else:
+        adapter_class = KeepAliveHTTPAdapter if config.tcp_keepalive else HTTPAdapter
+        adapter = adapter_class(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            max_retries=config.max_retries,
+        )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,88 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Helpers to read the bodies of responses sent by streams with stream_responses enabled (see HttpStream.stream_responses) without holding them
+entirely in memory.
+"""
+
+import gzip
+import tempfile
+import zipfile
+from typing import IO, Iterator, Tuple
+
+import requests
+
+# Bodies up to this size are spooled in memory, larger ones are written to a temporary file
+DEFAULT_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def spool_response(
+    response: requests.Response, max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IO[bytes]:
+    """
+    Downloads the body of a response into a seekable file object, e.g: to open a zip archive, which can't be read sequentially. The body is
+    kept in memory if it is smaller than max_memory_size, and is transparently written to a temporary file otherwise.
+
+    The returned file is positioned at the start of the body, and is deleted once closed: use it as a context manager.
+
+    :param response: a response whose body was not read yet
+    :param max_memory_size: the size in bytes above which the body is written to disk
+    :param chunk_size: the size in bytes of the chunks the body is read by
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            spooled.write(chunk)
+        spooled.seek(0)
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
+
+
+def iter_zip_members(fileobj: IO[bytes]) -> Iterator[Tuple[str, IO[bytes]]]:
+    """
+    Iterates over the files of a zip archive, decompressing each one on the fly as it is read.
+
+    :param fileobj: a seekable file object holding the archive, see spool_response
+    :return: an iterator of (file name, file object) tuples. Each file object is closed once the iteration moves on to the next file
+    """
+    with zipfile.ZipFile(fileobj) as archive:
+        for name in archive.namelist():
+            with archive.open(name) as member:
+                yield name, member
+
+
+def iter_gzip_lines(fileobj: IO[bytes]) -> Iterator[bytes]:
+    """
+    Iterates over the lines of gzip compressed data, decompressing it on the fly as it is read. The data doesn't need to be seekable, so this can
+    read a zip archive member or the raw body of a response.
+
+    :param fileobj: a file object holding the compressed data
+    """
+    with gzip.GzipFile(fileobj=fileobj) as lines:
+        yield from lines
@@ -0,0 +1,120 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import time
+from typing import Any, List, Mapping, MutableMapping, Optional
+
+from airbyte_cdk.serialization import dumps
+from airbyte_cdk.sources.streams import Stream
+
+# Serializing every record to count the bytes read would cost about as much as outputting them, so the volume of records read is estimated
+# from the average serialized size of one record out of this many
+BYTES_SAMPLE_INTERVAL = 100
+
+
+class IncrementalStateTracker:
+    """
+    Keeps track of the state of a stream read incrementally, and of when to checkpoint it according to the stream's checkpointing policy:
+    state is checkpointed as soon as state_checkpoint_interval records, state_checkpoint_seconds seconds or state_checkpoint_bytes bytes of
+    records were read since the previous checkpoint, whichever comes first. The bytes of records are estimated from a sample of them, see
+    BYTES_SAMPLE_INTERVAL.
+
+    When the stream has lazy_state_updates enabled, get_updated_state is only called at checkpoint time, with the record holding the highest
+    cursor value since the previous checkpoint.
+    """
+
+    def __init__(self, stream: Stream, stream_state: MutableMapping[str, Any], cursor_field: List[str] = None):
+        self._stream = stream
+        self._state = stream_state
+        self._cursor_field = cursor_field or stream._wrapped_cursor_field()
+        self._lazy = stream.lazy_state_updates
+        self._max_records = stream.state_checkpoint_interval
+        self._max_seconds = stream.state_checkpoint_seconds
+        self._max_bytes = stream.state_checkpoint_bytes
+        # Record with the highest cursor value which was not applied to the state yet, when updating the state lazily
+        self._latest_record: Optional[Mapping[str, Any]] = None
+        self._latest_cursor_value: Any = None
+        # Size of the records sampled since the stream started being read, to estimate the size of the others
+        self._total_records = 0
+        self._sampled_records = 0
+        self._sampled_bytes = 0
+        self._reset_counters()
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        """
+        :return: the state of the stream, updated with all the records read so far
+        """
+        if self._latest_record is not None:
+            self._state = self._stream.get_updated_state(self._state, self._latest_record)
+            self._latest_record = None
+            self._latest_cursor_value = None
+        return self._state
+
+    def update(self, record: Mapping[str, Any]) -> bool:
+        """
+        Applies a record to the state.
+
+        :return: True if the state should be checkpointed now, in which case checkpoint must be called
+        """
+        if self._lazy:
+            cursor_value = self._cursor_value(record)
+            if cursor_value is not None and (self._latest_cursor_value is None or cursor_value > self._latest_cursor_value):
+                self._latest_record, self._latest_cursor_value = record, cursor_value
+        else:
+            self._state = self._stream.get_updated_state(self._state, record)
+
+        self._records += 1
+        if self._max_bytes:
+            if self._total_records % BYTES_SAMPLE_INTERVAL == 0:
+                self._sampled_records += 1
+                self._sampled_bytes += len(dumps(record))
+            self._bytes += self._sampled_bytes / self._sampled_records
+        self._total_records += 1
+        return bool(
+            (self._max_records and self._records >= self._max_records)
+            or (self._max_bytes and self._bytes >= self._max_bytes)
+            or (self._max_seconds and time.monotonic() - self._last_checkpoint_at >= self._max_seconds)
+        )
+
+    def checkpoint(self) -> MutableMapping[str, Any]:
+        """
+        :return: the state to checkpoint
+        """
+        self._reset_counters()
+        return self.state
+
+    def _reset_counters(self):
+        self._records = 0
+        self._bytes = 0
+        self._last_checkpoint_at = time.monotonic()
+
+    def _cursor_value(self, record: Mapping[str, Any]) -> Any:
+        value = record
+        for key in self._cursor_field:
+            if not isinstance(value, Mapping):
+                return None
+            value = value.get(key)
+        return value
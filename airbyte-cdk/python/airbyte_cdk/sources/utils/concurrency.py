@@ -0,0 +1,254 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, Awaitable, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Marker yielded by read_concurrently once an iterable has been fully consumed
+ITERABLE_EXHAUSTED = object()
+
+# How often (in seconds) a blocked worker checks whether the consumer went away
+_POLL_INTERVAL = 0.1
+
+
+def read_concurrently(
+    iterable_factories: Iterable[Callable[[], Iterable[T]]],
+    max_workers: int,
+    buffer_size: int = 1000,
+    max_items_ahead: Optional[int] = None,
+) -> Iterator[Tuple[int, T]]:
+    """
+    Consumes several iterables concurrently in a bounded pool of threads and multiplexes their items into a single iterator.
+
+    Items are yielded as (index, item) tuples, where index is the position of the iterable's factory in iterable_factories. Items coming from the
+    same iterable are always yielded in the order that iterable produced them. Once an iterable is exhausted, (index, ITERABLE_EXHAUSTED) is
+    yielded, which lets the caller know all of the iterable's items have already been yielded.
+
+    Factories are only invoked once a worker is free to consume them, so at most max_workers iterables are in flight at any time and
+    iterable_factories may itself be a lazy (even unbounded) generator.
+
+    Any exception raised by an iterable is re-raised in the consuming thread. If the consumer stops iterating (e.g: because of an exception),
+    the remaining workers are told to stop after their current item.
+
+    :param iterable_factories: callables returning the iterables to consume
+    :param max_workers: maximum number of iterables consumed at the same time
+    :param buffer_size: maximum number of items buffered between the workers and the consumer
+    :param max_items_ahead: if set, an iterable which is not the earliest one still being consumed (the "head" iterable) only produces up to
+    this many items, then waits until it becomes the head iterable. This bounds how many items a consumer which processes items in iterable
+    order has to hold back
+    """
+    output: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+    head_moved = threading.Condition()
+    # Index of the earliest iterable which isn't exhausted yet, as seen by the consumer
+    head = 0
+
+    def wait_for_turn(index: int, produced: int) -> bool:
+        if max_items_ahead is None or produced < max_items_ahead:
+            return True
+        with head_moved:
+            while index != head and not stopped.is_set():
+                head_moved.wait(_POLL_INTERVAL)
+        return not stopped.is_set()
+
+    def put(entry) -> bool:
+        while not stopped.is_set():
+            try:
+                output.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def consume(index: int, factory: Callable[[], Iterable[T]]):
+        try:
+            for produced, item in enumerate(factory()):
+                if not wait_for_turn(index, produced) or not put((index, item, None)):
+                    return
+            put((index, ITERABLE_EXHAUSTED, None))
+        except BaseException as e:
+            put((index, None, e))
+
+    pending = enumerate(iterable_factories)
+    exhausted = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            in_flight = 0
+            for index, factory in pending:
+                executor.submit(consume, index, factory)
+                in_flight += 1
+                if in_flight >= max_workers:
+                    break
+
+            while in_flight:
+                index, item, error = output.get()
+                if error is not None:
+                    raise error
+                if item is ITERABLE_EXHAUSTED:
+                    in_flight -= 1
+                    exhausted.add(index)
+                    with head_moved:
+                        while head in exhausted:
+                            exhausted.remove(head)
+                            head += 1
+                        head_moved.notify_all()
+                    next_iterable = next(pending, None)
+                    if next_iterable is not None:
+                        executor.submit(consume, *next_iterable)
+                        in_flight += 1
+                yield index, item
+        finally:
+            stopped.set()
+
+
+def iterate_async(async_iterable: AsyncIterable[T], cleanup: Optional[Callable[[], Awaitable]] = None) -> Iterator[T]:
+    """
+    Iterates over an async iterable from synchronous code, by running it on a dedicated event loop.
+
+    :param async_iterable: the async iterable to iterate over
+    :param cleanup: a coroutine function awaited on the event loop before it's closed, e.g: to close client sessions bound to the loop
+    """
+    loop = asyncio.new_event_loop()
+    iterator = async_iterable.__aiter__()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        try:
+            if hasattr(iterator, "aclose"):
+                loop.run_until_complete(iterator.aclose())
+            if cleanup:
+                loop.run_until_complete(cleanup())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def read_concurrently_async(
+    async_iterable_factories: Iterable[Callable[[], AsyncIterable[T]]],
+    max_concurrency: int,
+    buffer_size: int = 1000,
+    cleanup: Optional[Callable[[], Awaitable]] = None,
+    max_items_ahead: Optional[int] = None,
+) -> Iterator[Tuple[int, T]]:
+    """
+    Same as read_concurrently, but consumes async iterables as tasks of a single event loop instead of in a pool of threads. This allows a
+    large number of iterables to be consumed at the same time (e.g: thousands of in-flight HTTP requests) from a single thread.
+
+    The event loop only runs while this iterator waits for the next item, so async iterables make progress while the consumer is waiting on
+    them, and are paused while the consumer processes an item.
+
+    :param async_iterable_factories: callables returning the async iterables to consume
+    :param max_concurrency: maximum number of async iterables consumed at the same time
+    :param buffer_size: maximum number of items buffered between the async iterables and the consumer
+    :param cleanup: a coroutine function awaited on the event loop before it's closed, e.g: to close client sessions bound to the loop
+    :param max_items_ahead: see read_concurrently
+    """
+    loop = asyncio.new_event_loop()
+    tasks = set()
+    # Index of the earliest async iterable which isn't exhausted yet, as seen by the consumer
+    head = 0
+    exhausted = set()
+
+    async def create_queue_and_condition() -> Tuple[asyncio.Queue, asyncio.Condition]:
+        # the queue and condition must be created from within the loop they are used by
+        return asyncio.Queue(maxsize=buffer_size), asyncio.Condition()
+
+    output, head_moved = loop.run_until_complete(create_queue_and_condition())
+
+    async def wait_for_turn(index: int, produced: int):
+        if max_items_ahead is not None and produced >= max_items_ahead:
+            async with head_moved:
+                await head_moved.wait_for(lambda: index == head)
+
+    async def notify_head_moved():
+        async with head_moved:
+            head_moved.notify_all()
+
+    async def consume(index: int, factory: Callable[[], AsyncIterable[T]]):
+        try:
+            produced = 0
+            async for item in factory():
+                await wait_for_turn(index, produced)
+                produced += 1
+                await output.put((index, item, None))
+            await output.put((index, ITERABLE_EXHAUSTED, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await output.put((index, None, e))
+
+    pending = enumerate(async_iterable_factories)
+
+    async def cancel_tasks():
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def start_next() -> bool:
+        next_iterable = next(pending, None)
+        if next_iterable is None:
+            return False
+        task = loop.create_task(consume(*next_iterable))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return True
+
+    try:
+        in_flight = 0
+        while in_flight < max_concurrency and start_next():
+            in_flight += 1
+
+        while in_flight:
+            index, item, error = loop.run_until_complete(output.get())
+            if error is not None:
+                raise error
+            if item is ITERABLE_EXHAUSTED:
+                in_flight -= 1
+                exhausted.add(index)
+                while head in exhausted:
+                    exhausted.remove(head)
+                    head += 1
+                loop.run_until_complete(notify_head_moved())
+                if start_next():
+                    in_flight += 1
+            yield index, item
+    finally:
+        try:
+            loop.run_until_complete(cancel_tasks())
+            if cleanup:
+                loop.run_until_complete(cleanup())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
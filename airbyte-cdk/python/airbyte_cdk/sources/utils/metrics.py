@@ -0,0 +1,242 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from airbyte_cdk.logger import AirbyteLogger
+
+
+class StreamMetrics:
+    """
+    Counters of a stream's reads, which can be updated from all the threads reading the stream. Values are either counts (e.g: records,
+    http_requests) or durations in seconds (names ending with _seconds). The CDK keeps the following metrics:
+
+    - records, slices: records output and slices fully read
+    - http_requests, http_retries, response_bytes: requests sent (including retries), retried requests and size of the response bodies
+    - request_seconds: time spent waiting on the network for requests to complete
+    - rate_limit_wait_seconds, backoff_seconds: time spent waiting on the stream's rate limiter and between retries
+    - parse_seconds: time spent producing records from responses (i.e: in parse_response)
+    - transform_seconds: time spent transforming records to match the stream's schema (see Stream.transform_config)
+    - validation_seconds: time spent validating records against the stream's schema (see AbstractSource.record_validation_sample_rate)
+    - output_seconds: time spent serializing and writing out records, which includes waiting on the destination when it reads them slower
+      than they are produced
+
+    The metrics timing each record (transform_seconds, validation_seconds and output_seconds) are only kept when the source reports metrics
+    while streams are read or exports them to sinks, see MetricsReporter.enabled.
+    """
+
+    def __init__(self, stream_name: str):
+        self.stream_name = stream_name
+        self._lock = threading.Lock()
+        self._values: Dict[str, float] = defaultdict(float)
+        self._slice_start_values: Dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1):
+        with self._lock:
+            self._values[name] += value
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Adds the time spent in the with block to the metric
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.increment(name, time.perf_counter() - started_at)
+
+    def timed(self, name: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Yields the items of the iterable, adding the time spent producing them (but not the time spent by the caller consuming them) to the
+        metric once the iterable is exhausted or closed.
+        """
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                started_at = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - started_at
+                yield item
+        finally:
+            self.increment(name, elapsed)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        :return: the current value of each metric
+        """
+        with self._lock:
+            return dict(self._values)
+
+    def complete_slice(self) -> Dict[str, float]:
+        """
+        Counts a slice as fully read.
+
+        :return: how much each metric increased since the previous slice was completed. When slices are read one after another, these are the
+        metrics of the completed slice.
+        """
+        with self._lock:
+            self._values["slices"] += 1
+            values = dict(self._values)
+            slice_values = {name: value - self._slice_start_values.get(name, 0) for name, value in values.items() if name != "slices"}
+            self._slice_start_values = values
+        return slice_values
+
+
+class MetricsSink(ABC):
+    """
+    Exports the metrics of streams to a monitoring system. A sink instance only ever receives the metrics of one stream.
+    """
+
+    @abstractmethod
+    def export(self, stream_name: str, metrics: Mapping[str, float]):
+        """
+        :param stream_name: the stream the metrics belong to
+        :param metrics: the current (cumulative) value of each of the stream's metrics
+        """
+
+
+class PrometheusTextfileSink(MetricsSink):
+    """
+    Writes metrics in the Prometheus text format to a file per stream in the given directory, for the textfile collector of the Prometheus
+    node exporter. Each metric is exposed as a counter named {prefix}_{metric}_total with a "stream" label, plus the given constant labels.
+    """
+
+    def __init__(self, directory: str, prefix: str = "airbyte_source", labels: Mapping[str, str] = None):
+        self.directory = directory
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+
+    def export(self, stream_name: str, metrics: Mapping[str, float]):
+        labels = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in {**self.labels, "stream": stream_name}.items())
+        lines = []
+        for name, value in sorted(metrics.items()):
+            metric_name = f"{self.prefix}_{_sanitize(name)}_total"
+            lines.append(f"# TYPE {metric_name} counter")
+            lines.append(f"{metric_name}{{{labels}}} {value}")
+
+        # The collector may read the file at any time, so it is replaced at once rather than rewritten in place
+        path = os.path.join(self.directory, f"{self.prefix}_{_sanitize(stream_name)}.prom")
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(file.name, path)
+
+
+class StatsdSink(MetricsSink):
+    """
+    Sends metrics over UDP to a StatsD server, as counters named {prefix}.{stream}.{metric} which are incremented by how much each metric
+    increased since the previous export.
+    """
+
+    # Payloads above this size may be fragmented or dropped on common networks
+    MAX_PACKET_SIZE = 1432
+
+    def __init__(self, host: str = "localhost", port: int = 8125, prefix: str = "airbyte.source"):
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._exported: Dict[str, float] = {}
+
+    def export(self, stream_name: str, metrics: Mapping[str, float]):
+        lines = []
+        for name, value in sorted(metrics.items()):
+            delta = value - self._exported.get(name, 0)
+            if delta:
+                lines.append(f"{self.prefix}.{_sanitize(stream_name)}.{_sanitize(name)}:{delta:g}|c")
+        self._exported = dict(metrics)
+
+        packet = ""
+        for line in lines:
+            if packet and len(packet) + len(line) + 1 > self.MAX_PACKET_SIZE:
+                self._socket.sendto(packet.encode(), self.address)
+                packet = ""
+            packet = f"{packet}\n{line}" if packet else line
+        if packet:
+            self._socket.sendto(packet.encode(), self.address)
+
+
+class MetricsReporter:
+    """
+    Reports the metrics of a stream in LOG messages (as JSON) and to the sinks, every interval seconds while the stream is read and once it
+    was read. Without an interval, metrics are only exported to the sinks once the stream was read and are not logged.
+    """
+
+    def __init__(self, logger: AirbyteLogger, metrics: StreamMetrics, sinks: List[MetricsSink] = None, interval: Optional[float] = None):
+        self._logger = logger
+        self._metrics = metrics
+        self._sinks = sinks or []
+        self._interval = interval
+        self._started_at = self._reported_at = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: whether the metrics are reported at all, i.e: logged every interval seconds or exported to sinks
+        """
+        return self._interval is not None or bool(self._sinks)
+
+    def maybe_report(self):
+        """
+        Reports the metrics if interval seconds passed since they were last reported
+        """
+        if self._interval and time.monotonic() - self._reported_at >= self._interval:
+            self.report()
+
+    def report(self):
+        self._reported_at = time.monotonic()
+        metrics = self._metrics.snapshot()
+        metrics["elapsed_seconds"] = self._reported_at - self._started_at
+        stream_name = self._metrics.stream_name
+        if self._interval is not None:
+            self._logger.info(f"Metrics of {stream_name} stream: {json.dumps(metrics, sort_keys=True)}")
+        for sink in self._sinks:
+            try:
+                sink.export(stream_name, metrics)
+            except Exception as e:
+                # Metrics are best effort: a monitoring system being unavailable must not fail the sync
+                self._logger.warn(f"Failed to export metrics of {stream_name} stream with {type(sink).__name__}: {e!r}")
+
+
+def _sanitize(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,115 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+from typing import Any, Callable, List, Mapping, Optional
+
+from jsonschema import Draft4Validator
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is an optional dependency, see the "validation" extra in setup.py
+    fastjsonschema = None
+
+# How many distinct validation errors are reported for each stream
+MAX_REPORTED_ERRORS = 5
+
+
+class RecordValidator:
+    """
+    Validates records of a stream against its JSON schema, and counts those which don't match it instead of failing.
+
+    The schema is compiled once: into Python code when the fastjsonschema package is installed (which validates records an order of magnitude
+    faster), or into a jsonschema validator otherwise. To keep the cost down further, only a fraction of the records can be validated.
+    """
+
+    def __init__(self, schema: Mapping[str, Any], sample_rate: float = 1.0):
+        """
+        :param schema: the JSON schema records are validated against
+        :param sample_rate: the fraction of records to validate, between 0 and 1: e.g: with 0.1, one record out of 10 is validated
+        """
+        self.sample_rate = sample_rate
+        self.validated_records = 0
+        self.invalid_records = 0
+        self.errors: List[str] = []
+        self._validate = self._compile(schema)
+        self._seen_records = 0
+
+    @staticmethod
+    def _compile(schema: Mapping[str, Any]) -> Callable[[Any], Optional[str]]:
+        if fastjsonschema:
+            try:
+                validate = fastjsonschema.compile(dict(schema))
+            except fastjsonschema.JsonSchemaDefinitionException:
+                # e.g: a format fastjsonschema doesn't know about, fall back on jsonschema, which is more lenient
+                pass
+            else:
+
+                def validate_compiled(record: Any) -> Optional[str]:
+                    try:
+                        validate(record)
+                    except fastjsonschema.JsonSchemaValueException as e:
+                        return e.message
+                    return None
+
+                return validate_compiled
+
+        validator = Draft4Validator(schema)
+
+        def validate_interpreted(record: Any) -> Optional[str]:
+            if validator.is_valid(record):
+                return None
+            error = next(validator.iter_errors(record))
+            # Describe the error with the failing schema keyword rather than with error.message, which contains the invalid value: records
+            # may hold sensitive data, and errors would not be deduplicated
+            path = ".".join(["data"] + [str(key) for key in error.absolute_path])
+            return f"{path} must match {error.validator}: {error.validator_value}"
+
+        return validate_interpreted
+
+    def validate(self, record: Mapping[str, Any]) -> bool:
+        """
+        Validates the record if it is part of the sample.
+
+        :return: False if the record was validated and doesn't match the schema, True otherwise
+        """
+        # Sampling is deterministic: a record is validated whenever seen_records * sample_rate reaches the next integer
+        self._seen_records += 1
+        if int(self._seen_records * self.sample_rate) == int((self._seen_records - 1) * self.sample_rate):
+            return True
+
+        self.validated_records += 1
+        error = self._validate(record)
+        if error is None:
+            return True
+        self.invalid_records += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS and error not in self.errors:
+            self.errors.append(error)
+        return False
+
+    def summary(self, stream_name: str) -> str:
+        summary = f"Validated {self.validated_records} records of {stream_name} stream against its schema: {self.invalid_records} did not match it"
+        if self.errors:
+            summary += ". Errors: " + "; ".join(self.errors)
+        return summary
@@ -23,20 +23,41 @@
 #
 
 
+import copy
 import json
 import os
 import pkgutil
-from typing import Dict
+import threading
+from typing import Dict, Tuple
 
 import pkg_resources
 from jsonschema import RefResolver
 
+# Process-wide caches, so that schemas and their shared $refs are only read and resolved once however many streams (or calls) need them.
+# Schema files are not expected to change while a connector runs: modified files are only read again after ResourceSchemaLoader.clear_cache()
+_cache_lock = threading.Lock()
+# shared schemas folder -> shared refs
+_shared_refs_cache: Dict[str, Dict[str, dict]] = {}
+# (package name, schema name) -> resolved schema
+_resolved_schemas_cache: Dict[Tuple[str, str], dict] = {}
+
 
 class JsonSchemaResolver:
     """Helper class to expand $ref items in json schema"""
 
     def __init__(self, shared_schemas_path: str):
-        self._shared_refs = self._load_shared_schema_refs(shared_schemas_path)
+        # Resolving schemas modifies the shared refs in place, so each resolver works on its own copy of the cached ones
+        self._shared_refs = copy.deepcopy(self._get_shared_schema_refs(shared_schemas_path))
+
+    @classmethod
+    def _get_shared_schema_refs(cls, shared_schemas_path: str) -> Dict[str, dict]:
+        with _cache_lock:
+            shared_refs = _shared_refs_cache.get(shared_schemas_path)
+        if shared_refs is None:
+            shared_refs = cls._load_shared_schema_refs(shared_schemas_path)
+            with _cache_lock:
+                _shared_refs_cache[shared_schemas_path] = shared_refs
+        return shared_refs
 
     @staticmethod
     def _load_shared_schema_refs(shared_schemas_path: str):
@@ -107,8 +128,42 @@ class ResourceSchemaLoader:
         schemas/shared/<shared_definition>.json
         schemas/<name>.json # contains a $ref to shared_definition
         schemas/<name2>.json # contains a $ref to shared_definition
+
+        Schemas are cached for the lifetime of the process: the files of a schema are only read and resolved the first time it is requested, and
+        are not read again when they are modified unless clear_cache() is called.
+        """
+
+        with _cache_lock:
+            cached = _resolved_schemas_cache.get((self.package_name, name))
+        if cached is None:
+            cached = self._load_schema(name)
+            with _cache_lock:
+                _resolved_schemas_cache[(self.package_name, name)] = cached
+        # Callers are free to modify the schema they get
+        return copy.deepcopy(cached)
+
+    def get_all_schemas(self) -> Dict[str, dict]:
+        """
+        Loads and resolves all the top-level schemas of the package at once, e.g: to pay the cost of loading schemas upfront rather than on the
+        first use of each stream.
+
+        :return: a dict of schema name to schema
+        """
+        schemas_folder = pkg_resources.resource_filename(self.package_name, "schemas")
+        schema_names = [file_name[: -len(".json")] for file_name in os.listdir(schemas_folder) if file_name.endswith(".json")]
+        return {name: self.get_schema(name) for name in sorted(schema_names)}
+
+    @staticmethod
+    def clear_cache():
+        """
+        Forgets all the schemas and shared $refs loaded so far. This is the only way to have schema files modified after they were loaded
+        read again.
         """
+        with _cache_lock:
+            _shared_refs_cache.clear()
+            _resolved_schemas_cache.clear()
 
+    def _load_schema(self, name: str) -> dict:
         schema_filename = f"schemas/{name}.json"
         raw_file = pkgutil.get_data(self.package_name, schema_filename)
         if not raw_file:
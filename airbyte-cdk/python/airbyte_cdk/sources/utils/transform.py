@@ -0,0 +1,219 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import sys
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Mapping, Union
+
+import pendulum
+
+Transform = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass
+class TransformConfig:
+    """
+    What a TypeTransformer does to records, see Stream.transform_config.
+
+    cast_types: cast values to the type declared by the schema when they can be, e.g: "12" to 12 for an integer, 12 to "12" for a string.
+        Values which can't be cast without losing information are left as they are, e.g: "1.5" for an integer, "nan" or a string with more
+        significant digits than a float has for a number. Integral numbers are cast to int, so big integers keep all their digits
+    normalize_datetimes: rewrite values of the date-time and date formats as ISO 8601 strings, e.g: "2021-05-01 10:00:00" to
+        "2021-05-01T10:00:00+00:00"
+    drop_undeclared_fields: drop the fields of objects which are not declared in the properties of their schema, unless the schema allows
+        additionalProperties explicitly
+    """
+
+    cast_types: bool = True
+    normalize_datetimes: bool = False
+    drop_undeclared_fields: bool = False
+
+
+class TypeTransformer:
+    """
+    Makes records conform to a JSON schema.
+
+    The schema is compiled once into a tree of functions, one per node of the schema, so transforming a record only runs the checks relevant
+    to its fields instead of interpreting the schema for each record. Transforming a record returns a new record, the input is not modified.
+    Schema keywords which are not supported (e.g: anyOf, unresolved $refs) leave the corresponding values as they are.
+    """
+
+    def __init__(self, schema: Mapping[str, Any], config: TransformConfig = None):
+        self._config = config or TransformConfig()
+        self._transform = self._compile(schema)
+
+    def transform(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        return self._transform(record)
+
+    def _compile(self, schema: Mapping[str, Any]) -> Transform:
+        if not isinstance(schema, Mapping):
+            return _identity
+        types = schema.get("type", [])
+        types = [types] if isinstance(types, str) else list(types)
+        non_null_types = [t for t in types if t != "null"]
+        if len(non_null_types) != 1:
+            # Untyped or multi-typed values can't be cast unambiguously
+            return _identity
+
+        json_type = non_null_types[0]
+        if json_type == "object":
+            return self._compile_object(schema)
+        if json_type == "array":
+            return self._compile_array(schema)
+        if json_type == "string" and self._config.normalize_datetimes and schema.get("format") in ("date-time", "date"):
+            return self._datetime_transform(schema["format"])
+        if self._config.cast_types and json_type in _CASTS:
+            return _CASTS[json_type]
+        return _identity
+
+    def _compile_object(self, schema: Mapping[str, Any]) -> Transform:
+        properties = {name: self._compile(property_schema) for name, property_schema in schema.get("properties", {}).items()}
+        properties = {name: transform for name, transform in properties.items() if transform is not _identity}
+        drop_undeclared = self._config.drop_undeclared_fields and "properties" in schema and schema.get("additionalProperties") is not True
+        declared = set(schema.get("properties", {}))
+        if not properties and not drop_undeclared:
+            return _identity
+
+        def transform_object(value: Any) -> Any:
+            if not isinstance(value, Mapping):
+                return value
+            if drop_undeclared:
+                value = {k: v for k, v in value.items() if k in declared}
+            else:
+                value = dict(value)
+            for name, transform in properties.items():
+                field_value = value.get(name)
+                if field_value is not None:
+                    value[name] = transform(field_value)
+            return value
+
+        return transform_object
+
+    def _compile_array(self, schema: Mapping[str, Any]) -> Transform:
+        items = self._compile(schema.get("items"))
+        if items is _identity:
+            return _identity
+
+        def transform_array(value: Any) -> Any:
+            if not isinstance(value, list):
+                return value
+            return [items(item) if item is not None else None for item in value]
+
+        return transform_array
+
+    @staticmethod
+    def _datetime_transform(datetime_format: str) -> Transform:
+        def transform_datetime(value: Any) -> Any:
+            if not isinstance(value, str):
+                return value
+            try:
+                parsed = pendulum.parse(value, exact=True)
+            except ValueError:
+                return value
+            if not isinstance(parsed, pendulum.Date):
+                # e.g: a time or a duration
+                return value
+            return parsed.to_date_string() if datetime_format == "date" else parsed.isoformat()
+
+        return transform_datetime
+
+
+def _cast(cast: Callable[[Any], Any], accepted: tuple) -> Transform:
+    def transform(value: Any) -> Any:
+        # Exact type checks, since bool is a subclass of int but booleans are not valid integers or numbers
+        if type(value) in accepted:
+            return value
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return value
+
+    return transform
+
+
+_MAX_NUMBER = Decimal(sys.float_info.max)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """
+    Parses value exactly, unlike float() which rounds numbers with more than 17 significant digits
+    """
+    if isinstance(value, (dict, list, bool)):
+        raise TypeError(f"{value} is not a number")
+    try:
+        number = Decimal(value.strip() if isinstance(value, str) else value)
+    except InvalidOperation:
+        raise ValueError(f"{value} is not a number")
+    if not number.is_finite() or abs(number) > _MAX_NUMBER:
+        # e.g: "nan", or "1e400" which most JSON parsers and destinations read as infinity
+        raise ValueError(f"{value} is not a finite number")
+    return number
+
+
+def _to_integer(value: Any) -> int:
+    number = _to_decimal(value)
+    if number != number.to_integral_value():
+        raise ValueError(f"{value} is not an integer")
+    return int(number)
+
+
+def _to_number(value: Any) -> Union[int, float]:
+    number = _to_decimal(value)
+    if number == number.to_integral_value():
+        return int(number)
+    result = float(number)
+    if Decimal(repr(result)) != number:
+        # e.g: "0.12345678901234567891", which a float can't represent without rounding it
+        raise ValueError(f"{value} can't be represented as a float")
+    return result
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        raise TypeError(f"{value} is not a string")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"{value} is not a boolean")
+
+
+_CASTS = {
+    "integer": _cast(_to_integer, (int,)),
+    "number": _cast(_to_number, (int, float)),
+    "string": _cast(_to_string, (str,)),
+    "boolean": _cast(_to_boolean, (bool,)),
+}
@@ -0,0 +1,93 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+"""
+Micro-benchmark comparing the records/sec of building and serializing RECORD messages through pydantic (the previous behavior) and through the
+fast path used by the entrypoint.
+
+Usage (with the CDK installed e.g: pip install -e ".[orjson]"): python bin/benchmark_record_serialization.py [--records N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from airbyte_cdk import serialization
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+
+
+def sample_record(i: int):
+    return {
+        "id": i,
+        "name": f"record {i}",
+        "created_at": "2021-06-01T00:00:00Z",
+        "amount": i * 1.5,
+        "active": i % 2 == 0,
+        "tags": ["a", "b", "c"],
+        "owner": {"id": i % 100, "email": f"user{i % 100}@example.com"},
+    }
+
+
+def pydantic_path(records):
+    for data in records:
+        now_millis = int(datetime.now().timestamp()) * 1000
+        message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=data, emitted_at=now_millis))
+        yield message.json(exclude_unset=True)
+
+
+def fast_path(records):
+    for data in records:
+        now_millis = int(datetime.now().timestamp()) * 1000
+        message = AirbyteMessage.construct(
+            type=Type.RECORD, record=AirbyteRecordMessage.construct(stream="stream", data=data, emitted_at=now_millis)
+        )
+        yield serialization.serialize_message(message)
+
+
+def measure(name, path, records):
+    start = time.perf_counter()
+    for _ in path(records):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24}{len(records) / elapsed:>14,.0f} records/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    records = [sample_record(i) for i in range(args.records)]
+    measure("pydantic", pydantic_path, records)
+    orjson = serialization.orjson
+    if orjson:
+        measure("fast path (orjson)", fast_path, records)
+    serialization.orjson = None
+    measure("fast path (json)", fast_path, records)
+    serialization.orjson = orjson
+
+
+if __name__ == "__main__":
+    main()
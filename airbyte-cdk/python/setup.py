@@ -35,7 +35,7 @@ README = (HERE / "README.md").read_text()
 
 setup(
     name="airbyte-cdk",
-    version="0.1.4",
+    version="0.1.5",
     description="A framework for writing Airbyte Connectors.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -79,7 +79,15 @@ setup(
             "pytest",
             "pytest-cov",
             "pytest-mock",
-        ]
+            "aiohttp",
+            "fastjsonschema",
+        ],
+        # Required by AsyncHttpStream
+        "async": ["aiohttp"],
+        # Speeds up the validation of records, see AbstractSource.record_validation_sample_rate
+        "validation": ["fastjsonschema"],
+        # Speeds up serializing records when installed
+        "orjson": ["orjson"],
     },
     entry_points={
         "console_scripts": ["base-python=base_python.entrypoint:main"],
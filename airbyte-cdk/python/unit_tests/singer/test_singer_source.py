@@ -23,9 +23,137 @@
 #
 
 
-from airbyte_cdk.sources.singer import SingerSource
+import json
+import os
+
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.sources.singer import SingerHelper, SingerSource
+
+SINGER_CATALOG = {
+    "streams": [
+        {
+            "stream": "users",
+            "tap_stream_id": "users",
+            "schema": {"type": "object", "properties": {"id": {"type": "integer"}}},
+            "metadata": [{"breadcrumb": [], "metadata": {"valid-replication-keys": ["updated_at"]}}],
+        }
+    ]
+}
+
+CONFIGURED_CATALOG = {
+    "streams": [
+        {
+            "stream": {
+                "name": "users",
+                "json_schema": {"type": "object", "properties": {"id": {"type": "integer"}}},
+                "supported_sync_modes": ["full_refresh", "incremental"],
+                "source_defined_primary_key": [["id"]],
+            },
+            "sync_mode": "incremental",
+            "cursor_field": ["updated_at"],
+            "destination_sync_mode": "append",
+        }
+    ]
+}
+
+
+class StubSingerSource(SingerSource):
+    def discover_cmd(self, logger, config_path):
+        return "tap-stub --discover"
+
+    def read_cmd(self, logger, config_path, catalog_path, state_path=None):
+        return f"tap-stub --catalog {catalog_path}"
 
 
 def test_singer_source_loads():
     # TODO write tests. for now this just verifies the file imports correctly.
     assert SingerSource() is not None
+
+
+def _config_container(tmp_path, config):
+    return StubSingerSource().configure(config, str(tmp_path))
+
+
+def test_discover_cache(mocker, tmp_path, monkeypatch):
+    monkeypatch.setenv("AIRBYTE_SINGER_DISCOVER_CACHE_DIR", str(tmp_path / "cache"))
+    discover = mocker.patch.object(SingerHelper, "discover", side_effect=lambda *args: json.loads(json.dumps(SINGER_CATALOG)))
+    source, logger = StubSingerSource(), AirbyteLogger()
+    config_container = _config_container(tmp_path, {"api_key": "secret"})
+
+    assert source._discover_internal(logger, config_container.config_path).singer_catalog == SINGER_CATALOG
+    assert source._discover_internal(logger, config_container.config_path).singer_catalog == SINGER_CATALOG
+    assert discover.call_count == 1
+    # Only a hash of the config is persisted
+    assert "secret" not in "".join(open(tmp_path / "cache" / name).read() + name for name in os.listdir(tmp_path / "cache"))
+
+    (tmp_path / "other").mkdir()
+    other_config_container = _config_container(tmp_path / "other", {"api_key": "other"})
+    source._discover_internal(logger, other_config_container.config_path)
+    assert discover.call_count == 2
+
+
+def test_discover_cache_expires(mocker, tmp_path, monkeypatch):
+    monkeypatch.setenv("AIRBYTE_SINGER_DISCOVER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("AIRBYTE_SINGER_DISCOVER_CACHE_TTL", "0")
+    discover = mocker.patch.object(SingerHelper, "discover", side_effect=lambda *args: json.loads(json.dumps(SINGER_CATALOG)))
+    source, logger = StubSingerSource(), AirbyteLogger()
+    config_container = _config_container(tmp_path, {})
+
+    source._discover_internal(logger, config_container.config_path)
+    source._discover_internal(logger, config_container.config_path)
+    assert discover.call_count == 2
+
+
+def test_discover_refreshes_the_cache(mocker, tmp_path, monkeypatch):
+    monkeypatch.setenv("AIRBYTE_SINGER_DISCOVER_CACHE_DIR", str(tmp_path / "cache"))
+    discover = mocker.patch.object(SingerHelper, "discover", side_effect=lambda *args: json.loads(json.dumps(SINGER_CATALOG)))
+    source, logger = StubSingerSource(), AirbyteLogger()
+    config_container = _config_container(tmp_path, {})
+
+    source.discover(logger, config_container)
+    source.discover(logger, config_container)
+    assert discover.call_count == 2
+    source._discover_internal(logger, config_container.config_path)
+    assert discover.call_count == 2
+
+
+def test_discover_without_cache(mocker, tmp_path, monkeypatch):
+    monkeypatch.delenv("AIRBYTE_SINGER_DISCOVER_CACHE_DIR", raising=False)
+    discover = mocker.patch.object(SingerHelper, "discover", side_effect=lambda *args: json.loads(json.dumps(SINGER_CATALOG)))
+    source, logger = StubSingerSource(), AirbyteLogger()
+    config_container = _config_container(tmp_path, {})
+
+    source._discover_internal(logger, config_container.config_path)
+    source._discover_internal(logger, config_container.config_path)
+    assert discover.call_count == 2
+
+
+def test_read_from_configured_catalog(mocker, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    discover = mocker.patch.object(SingerHelper, "discover")
+    read = mocker.patch.object(SingerHelper, "read", return_value=iter([]))
+    source = StubSingerSource()
+    source.read_from_configured_catalog = True
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(CONFIGURED_CATALOG))
+
+    source.read(AirbyteLogger(), _config_container(tmp_path, {}), str(catalog_path))
+
+    assert not discover.called
+    assert read.call_args[0][1] == "tap-stub --catalog singer_rendered_catalog.json"
+    singer_catalog = json.loads((tmp_path / "singer_rendered_catalog.json").read_text())
+    [stream] = singer_catalog["streams"]
+    assert stream["stream"] == "users"
+    assert stream["schema"]["properties"] == {"id": {"type": "integer"}}
+    assert stream["metadata"] == [
+        {
+            "breadcrumb": [],
+            "metadata": {
+                "table-key-properties": ["id"],
+                "selected": True,
+                "replication-key": "updated_at",
+                "forced-replication-method": "INCREMENTAL",
+                "replication-method": "INCREMENTAL",
+            },
+        }
+    ]
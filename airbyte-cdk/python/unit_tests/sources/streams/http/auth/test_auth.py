@@ -135,3 +135,27 @@ class TestOauth2Authenticator:
         token = oauth.refresh_access_token()
 
         assert ("access_token", 1000) == token
+
+    def test_refresh_access_token_with_session(self, mocker):
+        """
+        Should send the refresh request through the given session.
+        """
+        session = requests.Session()
+        oauth = Oauth2Authenticator(
+            TestOauth2Authenticator.refresh_endpoint,
+            TestOauth2Authenticator.client_id,
+            TestOauth2Authenticator.client_secret,
+            TestOauth2Authenticator.refresh_token,
+            session=session,
+        )
+        resp = Response()
+        resp.status_code = 200
+
+        mocker.patch.object(session, "request", return_value=resp)
+        mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": 1000})
+        token = oauth.refresh_access_token()
+
+        assert ("access_token", 1000) == token
+        session.request.assert_called_once_with(
+            method="POST", url=TestOauth2Authenticator.refresh_endpoint, data=oauth.get_refresh_request_body()
+        )
@@ -0,0 +1,143 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import threading
+import time
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.auth import TokenManager
+
+
+class StubRefresh:
+    """Returns token-1, token-2, etc.. or raises the given errors first"""
+
+    def __init__(self, lifespan: float = 3600, delay: float = 0, errors=()):
+        self.lifespan = lifespan
+        self.delay = delay
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"token-{self.calls}", self.lifespan
+
+
+def _http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(response=response)
+
+
+def test_concurrent_callers_share_a_single_refresh():
+    refresh = StubRefresh(delay=0.1)
+    manager = TokenManager(refresh)
+    tokens = []
+
+    threads = [threading.Thread(target=lambda: tokens.append(manager.get_token())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ["token-1"] * 10 == tokens
+    assert 1 == refresh.calls
+
+
+def test_token_is_refreshed_in_the_background_ahead_of_expiry():
+    refresh = StubRefresh(lifespan=0.4, delay=0.05)
+    manager = TokenManager(refresh, refresh_ahead=300)
+    assert "token-1" == manager.get_token()
+
+    # Past half of the token's lifespan, the current token is returned right away while a new one is fetched
+    time.sleep(0.25)
+    started_at = time.monotonic()
+    assert "token-1" == manager.get_token()
+    assert time.monotonic() - started_at < 0.05
+
+    time.sleep(0.1)
+    assert "token-2" == manager.get_token()
+    assert 2 == refresh.calls
+
+
+def test_expired_token_is_refreshed_before_being_returned():
+    refresh = StubRefresh(lifespan=0)
+    manager = TokenManager(refresh)
+
+    assert "token-1" == manager.get_token()
+    assert manager.token_has_expired()
+    assert "token-2" == manager.get_token()
+
+
+@pytest.mark.parametrize("error", [requests.exceptions.ConnectionError(), _http_error(503), _http_error(429)])
+def test_transient_refresh_errors_are_retried(error):
+    refresh = StubRefresh(errors=[error])
+    manager = TokenManager(refresh, factor=0)
+
+    assert "token-2" == manager.get_token()
+
+
+def test_refresh_errors_raised_from_transient_errors_are_retried():
+    try:
+        raise _http_error(502)
+    except requests.exceptions.HTTPError as e:
+        error = Exception("Error while refreshing access token")
+        error.__cause__ = e
+
+    refresh = StubRefresh(errors=[error])
+    assert "token-2" == TokenManager(refresh, factor=0).get_token()
+
+
+def test_other_refresh_errors_are_raised():
+    refresh = StubRefresh(errors=[_http_error(400)])
+    manager = TokenManager(refresh, factor=0)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        manager.get_token()
+    assert 1 == refresh.calls
+
+
+def test_failed_background_refresh_keeps_current_token():
+    refresh = StubRefresh(lifespan=0.4)
+    manager = TokenManager(refresh, max_tries=1)
+    manager.get_token()
+
+    time.sleep(0.25)
+    refresh.errors.append(_http_error(400))
+    assert "token-1" == manager.get_token()
+    time.sleep(0.05)
+    assert "token-1" == manager.get_token()
+
+
+def test_invalidate_forces_a_refresh():
+    refresh = StubRefresh()
+    manager = TokenManager(refresh)
+    manager.get_token()
+
+    manager.invalidate()
+    assert "token-2" == manager.get_token()
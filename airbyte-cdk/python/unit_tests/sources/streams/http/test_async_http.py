@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Iterable, Mapping, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+from airbyte_cdk.sources.streams.http.auth import HttpAuthenticator
+from airbyte_cdk.sources.utils.concurrency import ITERABLE_EXHAUSTED
+
+pytest.importorskip("aiohttp")
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Returns 3 pages of 2 records per "key", and fails the first request of the "flaky" key with a 429"""
+
+    failures = {"flaky": 1}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        key, page = url.path.strip("/"), int(params.get("page", 0))
+        with self.lock:
+            fail = self.failures.get(key, 0) > 0
+            if fail:
+                self.failures[key] -= 1
+        if fail:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"data": [{"key": key, "page": page, "i": i} for i in range(2)], "next_page": page + 1 if page < 2 else None})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+class StubAsyncHttpStream(AsyncHttpStream):
+    primary_key = None
+    max_concurrent_slices = 3
+
+    def __init__(self, base_url: str, keys=("a",), authenticator: HttpAuthenticator = None):
+        super().__init__(**({"authenticator": authenticator} if authenticator else {}))
+        self._base_url = base_url
+        self._keys = keys
+
+    @property
+    def url_base(self) -> str:
+        return self._base_url
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return (stream_slice or {}).get("key", "a")
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return [{"key": key} for key in self._keys]
+
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice=None, next_page_token=None) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json()["next_page"]
+        return {"page": next_page} if next_page is not None else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+    def backoff_time(self, response: requests.Response) -> Optional[float]:
+        return 0
+
+
+def test_read_records_paginates(server_url):
+    stream = StubAsyncHttpStream(server_url)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"key": "a"}))
+
+    assert [(r["page"], r["i"]) for r in records] == [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 1)]
+    assert stream._client_session is None
+
+
+def test_auth_header_is_fetched_outside_of_the_event_loop(server_url):
+    class BlockingAuthenticator(HttpAuthenticator):
+        threads = set()
+
+        def get_auth_header(self) -> Mapping[str, Any]:
+            self.threads.add(threading.get_ident())
+            return {"Authorization": "Bearer token"}
+
+    stream = StubAsyncHttpStream(server_url, authenticator=BlockingAuthenticator())
+
+    assert len(list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"key": "a"}))) == 6
+    # The event loop runs in the thread iterating over the records
+    assert BlockingAuthenticator.threads and threading.get_ident() not in BlockingAuthenticator.threads
+
+
+def test_read_slices_concurrently(server_url):
+    stream = StubAsyncHttpStream(server_url, keys=("a", "b", "c", "d"))
+    slices_read_kwargs = [{"sync_mode": SyncMode.full_refresh, "stream_slice": s} for s in stream.stream_slices()]
+
+    records_by_slice = {}
+    for index, record in stream.read_slices_concurrently(slices_read_kwargs):
+        records_by_slice.setdefault(index, []).append(record)
+
+    assert sorted(records_by_slice) == [0, 1, 2, 3]
+    for index, key in enumerate("abcd"):
+        assert records_by_slice[index][-1] is ITERABLE_EXHAUSTED
+        records = records_by_slice[index][:-1]
+        assert [(r["key"], r["page"], r["i"]) for r in records] == [(key, p, i) for p in range(3) for i in range(2)]
+
+
+def test_retries_with_user_defined_backoff(server_url, mocker):
+    mocker.patch("asyncio.sleep", side_effect=_no_sleep)
+    stream = StubAsyncHttpStream(server_url)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice={"key": "flaky"}))
+
+    assert len(records) == 6
+
+
+async def _no_sleep(*args, **kwargs):
+    pass
@@ -0,0 +1,168 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import BackoffPolicy, Cassette, HttpStream, use_cassette
+from airbyte_cdk.sources.streams.http.auth import Oauth2Authenticator
+from airbyte_cdk.sources.streams.http.exceptions import CassetteMissError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Returns 2 pages of records, and an access token on POST /token"""
+
+    requests_count = 0
+
+    def do_GET(self):
+        _Handler.requests_count += 1
+        page = 2 if "page=2" in self.path else 1
+        self._send_json({"data": [{"page": page}], "next_page": 2 if page == 1 else None})
+
+    def do_POST(self):
+        _Handler.requests_count += 1
+        self._send_json({"access_token": "token", "expires_in": 3600})
+
+    def _send_json(self, body):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    _Handler.requests_count = 0
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+class StubPaginatedHttpStream(HttpStream):
+    primary_key = None
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self._base_url = base_url
+
+    @property
+    def url_base(self) -> str:
+        return self._base_url
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice=None, next_page_token=None) -> Mapping[str, Any]:
+        return dict(next_page_token or {}, since="2021-01-01T00:00:00")
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json()["next_page"]
+        return {"page": next_page} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+
+def _record(path: str, base_url: str):
+    with use_cassette(Cassette(path, mode=Cassette.RECORD)):
+        return list(StubPaginatedHttpStream(base_url).read_records(SyncMode.full_refresh))
+
+
+def test_replays_recorded_responses_without_sending_requests(tmp_path, server_url):
+    path = str(tmp_path / "cassette.jsonl")
+    recorded = _record(path, server_url)
+    assert 2 == _Handler.requests_count
+
+    with use_cassette(Cassette(path)):
+        assert recorded == list(StubPaginatedHttpStream(server_url).read_records(SyncMode.full_refresh))
+    assert 2 == _Handler.requests_count
+
+
+def test_replay_raises_on_requests_which_were_not_recorded(tmp_path, server_url):
+    path = str(tmp_path / "cassette.jsonl")
+    _record(path, server_url)
+
+    with use_cassette(Cassette(path)), pytest.raises(CassetteMissError):
+        list(StubPaginatedHttpStream("http://other.host/").read_records(SyncMode.full_refresh))
+
+
+def test_replay_ignores_params(tmp_path, server_url):
+    path = str(tmp_path / "cassette.jsonl")
+    _record(path, server_url)
+
+    class StubOtherSinceHttpStream(StubPaginatedHttpStream):
+        def request_params(self, **kwargs) -> Mapping[str, Any]:
+            return dict(super().request_params(**kwargs), since="2021-06-01T00:00:00")
+
+    with use_cassette(Cassette(path, ignored_params=["since"])):
+        assert [{"page": 1}, {"page": 2}] == list(StubOtherSinceHttpStream(server_url).read_records(SyncMode.full_refresh))
+
+
+def test_replay_simulates_rate_limits(tmp_path, server_url):
+    path = str(tmp_path / "cassette.jsonl")
+    _record(path, server_url)
+
+    # The second request gets a 429 and is retried once the simulated Retry-After passed
+    stream = StubPaginatedHttpStream(server_url, backoff_policy=BackoffPolicy(factor=0))
+    with use_cassette(Cassette(path, rate_limit_every=2, retry_after=0)):
+        assert [{"page": 1}, {"page": 2}] == list(stream.read_records(SyncMode.full_refresh))
+    assert 3 == stream.metrics.snapshot()["http_requests"]
+
+    stream = StubPaginatedHttpStream(server_url, backoff_policy=BackoffPolicy(max_tries=2, factor=0))
+    with use_cassette(Cassette(path, rate_limit_every=1, retry_after=0)), pytest.raises(requests.exceptions.HTTPError) as error:
+        list(stream.read_records(SyncMode.full_refresh))
+    assert 429 == error.value.response.status_code
+
+
+def test_records_and_replays_token_refresh(tmp_path, server_url):
+    path = str(tmp_path / "cassette.jsonl")
+    authenticator = Oauth2Authenticator(f"{server_url}token", "client_id", "client_secret", "refresh_token")
+    with use_cassette(Cassette(path, mode=Cassette.RECORD)):
+        assert ("token", 3600) == authenticator.refresh_access_token()
+
+    assert "refresh_token" not in open(path).read()
+    with use_cassette(Cassette(path)):
+        assert ("token", 3600) == authenticator.refresh_access_token()
+    assert 1 == _Handler.requests_count
+
+
+def test_cassette_from_env(tmp_path, monkeypatch):
+    path = tmp_path / "cassette.jsonl"
+    path.write_text("")
+    monkeypatch.setenv("AIRBYTE_HTTP_CASSETTE", str(path))
+    monkeypatch.setenv("AIRBYTE_HTTP_CASSETTE_LATENCY", "0.5")
+
+    cassette = Cassette.from_env()
+    assert Cassette.REPLAY == cassette.mode and 0.5 == cassette.latency
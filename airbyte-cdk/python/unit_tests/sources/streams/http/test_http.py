@@ -23,12 +23,13 @@
 #
 
 
+import threading
 from typing import Any, Iterable, Mapping, Optional
 
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
-from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http import BackoffPolicy, HttpStream
 from airbyte_cdk.sources.streams.http.exceptions import UserDefinedBackoffException
 
 
@@ -140,3 +141,71 @@ def test_stub_custom_backoff_http_stream(mocker):
         list(stream.read_records(SyncMode.full_refresh))
 
     # TODO(davin): Figure out how to assert calls.
+
+
+class StubPrefetchingHttpStream(StubNextPageTokenHttpStream):
+    page_prefetch_depth = 2
+
+
+def test_prefetching_pages_reads_all_pages_in_order(mocker):
+    pages = 5
+    stream = StubPrefetchingHttpStream(pages=pages)
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", return_value={})
+    mocker.patch.object(stream, "request_params", wraps=stream.request_params)
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert [{"data": i} for i in range(1, pages + 2)] == records
+    tokens = [call[1]["next_page_token"] for call in stream.request_params.call_args_list]
+    assert [None] + [{"page": i} for i in range(pages)] == tokens
+
+
+def test_prefetching_pages_requests_next_page_while_parsing(mocker):
+    stream = StubPrefetchingHttpStream(pages=3)
+    sent = threading.Semaphore(0)
+
+    def send_request(request):
+        sent.release()
+        return {}
+
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", side_effect=send_request)
+
+    records = stream.read_records(SyncMode.full_refresh)
+    assert {"data": 1} == next(records)
+    # The second page is requested even though the records of the first one were not all consumed yet
+    assert sent.acquire(timeout=5) and sent.acquire(timeout=5)
+    assert 3 == len(list(records))
+
+
+def test_prefetching_pages_raises_request_errors(mocker):
+    stream = StubPrefetchingHttpStream(pages=3)
+    mocker.patch.object(StubPrefetchingHttpStream, "_send_request", side_effect=[{}, requests.exceptions.ConnectionError()])
+
+    records = stream.read_records(SyncMode.full_refresh)
+    assert {"data": 1} == next(records)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        list(records)
+
+
+class StubRetryingHttpStream(StubBasicReadHttpStream):
+    backoff_policy = BackoffPolicy(factor=0)
+
+
+def _response(status_code: int, content: bytes = b"") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def test_stream_metrics_count_requests_and_retries(mocker):
+    stream = StubRetryingHttpStream()
+    mocker.patch.object(requests.Session, "send", side_effect=[_response(500), _response(200, b'{"data": 1}')])
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    metrics = stream.metrics.snapshot()
+    assert 2 == metrics["http_requests"]
+    assert 1 == metrics["http_retries"]
+    assert len(b'{"data": 1}') == metrics["response_bytes"]
+    assert metrics["request_seconds"] >= 0 and metrics["parse_seconds"] >= 0 and metrics["backoff_seconds"] >= 0
@@ -0,0 +1,298 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import threading
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import BackoffPolicy, CircuitBreaker, HttpStream, RateLimiter, RateLimitPolicy
+from airbyte_cdk.sources.streams.http.exceptions import CircuitBreakerOpenError, DefaultBackoffException, UserDefinedBackoffException
+from airbyte_cdk.sources.streams.http.rate_limiting import TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(url: str = "https://api.com/v1/users") -> requests.PreparedRequest:
+    return requests.Request("GET", url).prepare()
+
+
+def _response(status_code: int = 200, headers: Mapping[str, str] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def test_token_bucket_allows_bursts_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, period=1, clock=clock)
+
+    for _ in range(2):
+        assert bucket.wait_time() == 0
+        bucket.consume()
+    assert bucket.wait_time() == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert bucket.wait_time() == 0
+
+
+def test_token_bucket_pauses_when_nothing_remains():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock)
+
+    bucket.limit_remaining(0, reset_after=30)
+
+    assert bucket.wait_time() == pytest.approx(30.1)
+    clock.now = 30.1
+    assert bucket.wait_time() == 0
+
+
+def test_rate_limiter_applies_global_and_endpoint_limits():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitPolicy(requests_per_second=10), endpoint_policies={"/search": RateLimitPolicy(requests_per_minute=1)}, clock=clock
+    )
+
+    assert limiter.try_acquire(_request("https://api.com/v1/search?q=a")) == 0
+    assert limiter.try_acquire(_request("https://api.com/v1/search?q=b")) == pytest.approx(60)
+    # Other endpoints are only subject to the global limit
+    assert limiter.try_acquire(_request()) == 0
+
+
+def test_rate_limiter_caps_concurrent_requests():
+    limiter = RateLimiter(RateLimitPolicy(max_concurrent_requests=1))
+    request = _request()
+
+    assert limiter.try_acquire(request) == 0
+    assert limiter.try_acquire(request) > 0
+    limiter.release(request)
+    assert limiter.try_acquire(request) == 0
+
+
+@pytest.mark.parametrize(
+    "response,expected_wait",
+    [
+        (_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}), 20),
+        (_response(429, headers={"Retry-After": "5"}), 5),
+        (_response(headers={"X-RateLimit-Remaining": "100"}), 0),
+    ],
+)
+def test_rate_limiter_adapts_to_response_headers(response, expected_wait):
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitPolicy(requests_per_second=100), clock=clock)
+    request = _request()
+
+    assert limiter.try_acquire(request) == 0
+    limiter.release(request, response)
+
+    assert limiter.try_acquire(request) == pytest.approx(expected_wait, abs=0.05)
+
+
+class StubRateLimitedStream(HttpStream):
+    url_base = "https://api.com/v1/"
+    primary_key = None
+
+    def path(self, **kwargs) -> str:
+        return "users"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield {}
+
+
+def test_rate_limiter_is_shared_by_streams(mocker):
+    limiter = RateLimiter(RateLimitPolicy(max_concurrent_requests=1))
+    in_flight, max_in_flight = [0], [0]
+    lock = threading.Lock()
+
+    def send(request, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return _response()
+
+    mocker.patch.object(requests.Session, "send", side_effect=send)
+    streams = [StubRateLimitedStream(rate_limiter=limiter) for _ in range(3)]
+    threads = [threading.Thread(target=lambda s=s: list(s.read_records(SyncMode.full_refresh))) for s in streams]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert requests.Session.send.call_count == 3
+    assert max_in_flight[0] == 1
+
+
+def test_backoff_policy_wait_time():
+    assert [5, 10, 20, 40] == [BackoffPolicy().wait_time(tries) for tries in range(1, 5)]
+    assert [1, 2, 3, 3] == [BackoffPolicy(factor=1, max_wait=3).wait_time(tries) for tries in range(1, 5)]
+    assert all(0 <= BackoffPolicy(factor=1, jitter=True).wait_time(3) <= 4 for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [({}, None), ({"Retry-After": "12"}, 12), ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0), ({"Retry-After": "soon"}, None)],
+)
+def test_parse_retry_after(headers, expected):
+    assert expected == parse_retry_after(_response(429, headers))
+
+
+def test_circuit_breaker_opens_after_consecutive_failures_and_probes_after_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_request()
+
+    clock.now = 10
+    breaker.before_request()
+    # Only one request probes the API at a time
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_request()
+
+    clock.now = 20
+    breaker.before_request()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_request()
+
+
+def test_circuit_breaker_reopens_when_probe_raises_transient_error():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        with breaker.request():
+            raise requests.exceptions.ReadTimeout()
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_request()
+
+    clock.now = 20
+    with breaker.request():
+        pass
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_releases_probe_on_non_transient_error():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    with pytest.raises(requests.exceptions.HTTPError):
+        with breaker.request():
+            raise requests.exceptions.HTTPError("400 Client Error", response=_response(400))
+    # The circuit stays open but another request can probe the API right away
+    assert breaker.is_open
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.request():
+            raise KeyboardInterrupt()
+    with breaker.request():
+        pass
+    assert not breaker.is_open
+
+
+def test_circuit_breaker_only_counts_transient_errors_as_failures():
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            with breaker.request():
+                raise ValueError("bad record")
+    with pytest.raises(requests.exceptions.HTTPError):
+        with breaker.request():
+            raise requests.exceptions.HTTPError("404 Client Error", response=_response(404))
+    assert not breaker.is_open
+
+    for status_code in (429, 502):
+        with pytest.raises(requests.exceptions.HTTPError):
+            with breaker.request():
+                raise requests.exceptions.HTTPError(response=_response(status_code))
+    assert breaker.is_open
+
+
+def test_stream_retries_with_its_backoff_policy(mocker):
+    mocker.patch.object(requests.Session, "send", return_value=_response(500))
+    stream = StubRateLimitedStream(backoff_policy=BackoffPolicy(max_tries=3, factor=0))
+
+    with pytest.raises(DefaultBackoffException):
+        list(stream.read_records(SyncMode.full_refresh))
+
+    assert requests.Session.send.call_count == 3
+
+
+def test_stream_waits_as_long_as_retry_after(mocker):
+    mocker.patch.object(requests.Session, "send", return_value=_response(429, {"Retry-After": "7"}))
+    stream = StubRateLimitedStream(backoff_policy=BackoffPolicy(max_tries=1, retry_after=True))
+
+    with pytest.raises(UserDefinedBackoffException) as e:
+        list(stream.read_records(SyncMode.full_refresh))
+
+    assert e.value.backoff == 7
+
+
+def test_stream_ignores_retry_after_by_default(mocker):
+    mocker.patch.object(requests.Session, "send", return_value=_response(429, {"Retry-After": "7"}))
+    stream = StubRateLimitedStream(backoff_policy=BackoffPolicy(max_tries=1))
+
+    with pytest.raises(DefaultBackoffException):
+        list(stream.read_records(SyncMode.full_refresh))
+
+
+def test_stream_fails_fast_once_circuit_breaker_is_open(mocker):
+    mocker.patch.object(requests.Session, "send", return_value=_response(503))
+    policy = BackoffPolicy(max_tries=2, factor=0, circuit_breaker=CircuitBreaker(failure_threshold=2))
+    streams = [StubRateLimitedStream(backoff_policy=policy) for _ in range(2)]
+
+    with pytest.raises(DefaultBackoffException):
+        list(streams[0].read_records(SyncMode.full_refresh))
+    with pytest.raises(CircuitBreakerOpenError):
+        list(streams[1].read_records(SyncMode.full_refresh))
+
+    assert requests.Session.send.call_count == 2
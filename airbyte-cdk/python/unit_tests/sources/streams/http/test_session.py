@@ -0,0 +1,71 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import socket
+
+import requests
+from airbyte_cdk.sources.streams.http import ConnectionPoolConfig, HttpStream, create_session
+from airbyte_cdk.sources.streams.http.session import KeepAliveHTTPAdapter
+from requests.adapters import HTTPAdapter
+
+
+class StubHttpStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = ""
+    path = next_page_token = parse_response = None
+
+
+def test_create_session_configures_pool():
+    session = create_session(ConnectionPoolConfig(pool_connections=2, pool_maxsize=50, max_retries=3))
+
+    for prefix in ["http://", "https://"]:
+        adapter = session.get_adapter(f"{prefix}example.com")
+        assert isinstance(adapter, KeepAliveHTTPAdapter)
+        assert 50 == adapter._pool_maxsize
+        assert 3 == adapter.max_retries.total
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+
+def test_create_session_without_keepalive():
+    session = create_session(ConnectionPoolConfig(tcp_keepalive=False))
+    adapter = session.get_adapter("https://example.com")
+    assert type(adapter) is HTTPAdapter
+
+
+def test_create_session_with_custom_adapter():
+    custom_adapter = HTTPAdapter()
+    session = create_session(ConnectionPoolConfig(adapter_factory=lambda config: custom_adapter))
+    assert custom_adapter is session.get_adapter("https://example.com")
+
+
+def test_streams_share_session():
+    session = create_session()
+
+    assert StubHttpStream(session=session)._session is StubHttpStream(session=session)._session is session
+    assert StubHttpStream()._session is not StubHttpStream()._session
+
+
+def test_default_session_is_requests_session():
+    assert isinstance(StubHttpStream()._session, requests.Session)
@@ -0,0 +1,99 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import gzip
+import io
+import zipfile
+from typing import Any, Iterable, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.streaming import iter_gzip_lines, iter_zip_members, spool_response
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _zip_of_gzips(members: Mapping[str, bytes]) -> bytes:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, gzip.compress(content))
+    return archive.getvalue()
+
+
+def test_spool_response_keeps_small_bodies_in_memory():
+    with spool_response(_response(b"small body"), max_memory_size=100) as body:
+        assert not body._rolled
+        assert body.read() == b"small body"
+
+
+def test_spool_response_writes_large_bodies_to_disk():
+    content = b"x" * 1000
+    with spool_response(_response(content), max_memory_size=100, chunk_size=64) as body:
+        assert body._rolled
+        assert body.read() == content
+
+
+def test_decompress_gzip_files_of_zip_archive():
+    archive = _zip_of_gzips({"1.json.gz": b'{"id": 1}\n{"id": 2}\n', "2.json.gz": b'{"id": 3}\n'})
+
+    with spool_response(_response(archive)) as body:
+        lines = [(name, line) for name, member in iter_zip_members(body) for line in iter_gzip_lines(member)]
+
+    assert lines == [("1.json.gz", b'{"id": 1}\n'), ("1.json.gz", b'{"id": 2}\n'), ("2.json.gz", b'{"id": 3}\n')]
+
+
+class StubStreamingHttpStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = None
+    stream_responses = True
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        for line in iter_gzip_lines(response.raw):
+            yield {"line": line.strip()}
+
+
+def test_stream_responses(mocker):
+    response = _response(gzip.compress(b"a\nb\n"))
+    mocker.patch.object(requests.Session, "send", return_value=response)
+    mocker.spy(response, "close")
+
+    records = list(StubStreamingHttpStream().read_records(SyncMode.full_refresh))
+
+    assert records == [{"line": b"a"}, {"line": b"b"}]
+    assert requests.Session.send.call_args[1]["stream"] is True
+    response.close.assert_called_once()
@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+from typing import Any, Iterable, Mapping
+
+import pytest
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import AsyncJobFailed, AsyncJobStatus, AsyncJobStream
+
+
+class StubAsyncJobStream(AsyncJobStream):
+    """Each job completes after being checked as many times as its "polls" parameter, or fails if "fail" is set"""
+
+    primary_key = None
+    poll_interval = 0.001
+    max_poll_interval = 0.001
+
+    def __init__(self, jobs_params, max_running_jobs: int = 10, max_job_attempts: int = 3):
+        self._jobs_params = jobs_params
+        self._max_running_jobs = max_running_jobs
+        self._max_job_attempts = max_job_attempts
+        self.created = []
+        self.max_running = 0
+
+    @property
+    def max_running_jobs(self) -> int:
+        return self._max_running_jobs
+
+    @property
+    def max_job_attempts(self) -> int:
+        return self._max_job_attempts
+
+    def job_params(self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        return self._jobs_params
+
+    def create_job(self, params: Mapping[str, Any]) -> Any:
+        job = {"params": params, "checks": 0, "id": len(self.created)}
+        self.created.append(job)
+        running = [job for job in self.created if job["checks"] < job["params"]["polls"] and not job["params"].get("fail")]
+        self.max_running = max(self.max_running, len(running))
+        return job["id"]
+
+    def check_job(self, job: Any) -> AsyncJobStatus:
+        job = self.created[job]
+        job["checks"] += 1
+        if job["params"].get("fail"):
+            return AsyncJobStatus.FAILED
+        return AsyncJobStatus.COMPLETED if job["checks"] >= job["params"]["polls"] else AsyncJobStatus.RUNNING
+
+    def read_job_results(self, job: Any) -> Iterable[Mapping[str, Any]]:
+        yield {"name": self.created[job]["params"]["name"]}
+
+
+def test_jobs_results_are_read_in_completion_order():
+    stream = StubAsyncJobStream([{"name": "slow", "polls": 5}, {"name": "fast", "polls": 1}, {"name": "medium", "polls": 3}])
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert [{"name": "fast"}, {"name": "medium"}, {"name": "slow"}] == records
+
+
+def test_running_jobs_are_capped():
+    stream = StubAsyncJobStream([{"name": str(i), "polls": 2} for i in range(10)], max_running_jobs=3)
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert 10 == len(records)
+    assert 3 == stream.max_running
+
+
+def test_failed_jobs_are_retried_then_raise():
+    stream = StubAsyncJobStream([{"name": "ok", "polls": 1}, {"name": "ko", "polls": 1, "fail": True}], max_job_attempts=2)
+
+    with pytest.raises(AsyncJobFailed):
+        list(stream.read_records(SyncMode.full_refresh))
+
+    assert ["ok", "ko", "ko"] == [job["params"]["name"] for job in stream.created]
+
+
+def test_state_is_only_checkpointed_at_the_end_of_slices():
+    stream = StubAsyncJobStream([])
+
+    assert stream.state_checkpoint_interval is None
+    assert stream.state_checkpoint_seconds is None
+    assert stream.state_checkpoint_bytes is None
@@ -23,8 +23,9 @@
 #
 
 
+import threading
 from collections import defaultdict
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import pytest
 from airbyte_cdk.logger import AirbyteLogger
@@ -44,6 +45,8 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.metrics import MetricsSink
+from airbyte_cdk.sources.utils.transform import TransformConfig
 
 
 class MockSource(AbstractSource):
@@ -366,3 +369,250 @@ def test_valid_incremental_read_with_slices_and_interval(mocker, logger):
     messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
     assert expected == messages
+
+
+class ConcurrentMockSource(MockSource):
+    max_concurrent_streams = 2
+
+
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Dict[str, List[AirbyteMessage]]:
+    by_stream = defaultdict(list)
+    for message in messages:
+        by_stream[message.record.stream].append(message)
+    return by_stream
+
+
+def test_concurrent_full_refresh_read_keeps_per_stream_order(mocker, logger):
+    """Tests that reading streams concurrently outputs every record exactly once, preserving the order of records within each stream"""
+    s1_output = [{"k": i} for i in range(100)]
+    s2_output = [{"k": -i} for i in range(100)]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, s1_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, s2_output)], name="s2")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = ConcurrentMockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert {"s1": _as_records("s1", s1_output), "s2": _as_records("s2", s2_output)} == _messages_by_stream(messages)
+
+
+def test_concurrent_incremental_read_only_checkpoints_emitted_streams(mocker, logger):
+    """Tests that when reading streams concurrently, a STATE message only contains the state of streams which already output their records"""
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s2")
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=1)
+
+    src = ConcurrentMockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental), _configured_stream(s2, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    records_seen = defaultdict(int)
+    for message in messages:
+        if message.type == Type.RECORD:
+            records_seen[message.record.stream] += 1
+        else:
+            # every stream present in the state must have output records before this state message
+            assert all(records_seen[stream] > 0 for stream in message.state.data)
+    assert {"s1": 2, "s2": 2} == records_seen
+    assert _state({"s1": state, "s2": state}) == messages[-1]
+
+
+def test_concurrent_read_raises_stream_exception(mocker, logger):
+    """Tests that an exception raised while reading one of the streams concurrently is propagated to the caller"""
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v"}])], name="s1")
+    s2 = MockStream(name="s2")  # no mocked output, so reading it raises
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = ConcurrentMockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    with pytest.raises(Exception, match="No mocked output supplied"):
+        list(src.read(logger, {}, catalog))
+
+
+class SlowFirstSliceStream(MockStream):
+    """Reads slices concurrently. The first slice only completes once every other slice was read, so slices complete out of order"""
+
+    max_concurrent_slices = 4
+    cursor_field = "cursor"
+
+    def __init__(self, slices: List[int], name: str):
+        super().__init__(name=name)
+        self._slices = slices
+        self._other_slices_read = threading.Event()
+        self._other_slices_left = len(slices) - 1
+        self._lock = threading.Lock()
+
+    def stream_slices(self, **kwargs):
+        return [{"slice": s} for s in self._slices]
+
+    def read_records(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:  # type: ignore
+        if stream_slice["slice"] == self._slices[0]:
+            self._other_slices_read.wait(timeout=5)
+        yield {"cursor": stream_slice["slice"]}
+        if stream_slice["slice"] != self._slices[0]:
+            with self._lock:
+                self._other_slices_left -= 1
+                if not self._other_slices_left:
+                    self._other_slices_read.set()
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
+        # keeps the cursor of the latest record instead of the max one, which makes the state depend on the order records are applied in
+        return {"cursor": latest_record["cursor"]}
+
+
+def test_concurrent_slices_full_refresh_read(mocker, logger):
+    """Tests that reading the slices of a stream concurrently outputs the records of all slices"""
+    s1 = SlowFirstSliceStream(slices=[1, 2, 3, 4, 5], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert all(message.type == Type.RECORD for message in messages)
+    assert [1, 2, 3, 4, 5] == sorted(message.record.data["cursor"] for message in messages)
+    # the first slice only completes after all the others
+    assert 1 == messages[-1].record.data["cursor"]
+
+
+def test_concurrent_slices_incremental_read_checkpoints_contiguous_slices(mocker, logger):
+    """
+    Tests that reading the slices of a stream concurrently only checkpoints state once all preceding slices are complete, and that records are
+    applied to the state in slice order
+    """
+    s1 = SlowFirstSliceStream(slices=[1, 2, 3, 4, 5], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    states = [message.state.data for message in messages if message.type == Type.STATE]
+    # no state can be checkpointed before the first slice completes, which happens after all the records were output
+    assert all(message.type == Type.RECORD for message in messages[:5])
+    assert [{"s1": {"cursor": i}} for i in [1, 2, 3, 4, 5]] == states
+
+
+def test_read_transforms_records_with_stream_transform_config(mocker, logger):
+    stream_output = [{"id": "1", "extra": True}, {"id": 2}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    mocker.patch.object(
+        MockStream,
+        "get_json_schema",
+        return_value={"type": "object", "properties": {"id": {"type": "integer"}}, "additionalProperties": False},
+    )
+    mocker.patch.object(MockStream, "transform_config", TransformConfig(drop_undeclared_fields=True))
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert _as_records("s1", [{"id": 1}, {"id": 2}]) == messages
+
+
+def test_read_validates_records_against_catalog_schema(mocker, logger):
+    stream_output = [{"id": 1}, {"id": "2"}, {"id": 3}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={"type": "object", "properties": {"id": {"type": "integer"}}})
+    mocker.patch.object(MockSource, "record_validation_sample_rate", 1.0)
+    mocker.spy(logger, "warn")
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    # Records which don't match their schema are still output
+    assert _as_records("s1", stream_output) == messages
+    assert "Validated 3 records of s1 stream against its schema: 1 did not match it" in logger.warn.call_args[0][0]
+
+
+class StubMetricsSink(MetricsSink):
+    def __init__(self):
+        self.exports = []
+
+    def export(self, stream_name: str, metrics: Mapping[str, float]):
+        self.exports.append((stream_name, metrics))
+
+
+def test_read_reports_stream_metrics_to_sinks(mocker, logger):
+    slices = [{"1": "1"}, {"2": "2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s, s]) for s in slices], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    sink = StubMetricsSink()
+    mocker.patch.object(MockSource, "metrics_sinks", [sink])
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+    list(src.read(logger, {}, catalog))
+
+    assert 1 == len(sink.exports)
+    stream_name, metrics = sink.exports[0]
+    assert "s1" == stream_name
+    assert 4 == metrics["records"] and 2 == metrics["slices"]
+    assert metrics["output_seconds"] >= 0 and metrics["elapsed_seconds"] >= 0
+
+
+def test_read_times_validation_separately(mocker, logger):
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"id": 1}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockSource, "record_validation_sample_rate", 1)
+    sink = StubMetricsSink()
+    mocker.patch.object(MockSource, "metrics_sinks", [sink])
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+    list(src.read(logger, {}, catalog))
+
+    _, metrics = sink.exports[0]
+    assert metrics["validation_seconds"] >= 0
+    assert "transform_seconds" not in metrics
+
+
+def test_read_only_counts_records_when_metrics_are_not_reported(mocker, logger):
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"id": 1}, {"id": 2}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+    list(src.read(logger, {}, catalog))
+
+    metrics = s1.metrics.snapshot()
+    assert 2 == metrics["records"]
+    assert "output_seconds" not in metrics
+
+
+@pytest.mark.parametrize("interval,logs_metrics", [(None, False), (60, True)])
+def test_read_logs_metrics_only_when_enabled(mocker, logger, interval, logs_metrics):
+    slices = [{"1": "1"}, {"2": "2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s]) for s in slices], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockSource, "metrics_report_interval", interval)
+    mocker.patch.object(logger, "info")
+    mocker.patch.object(logger, "debug")
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+    list(src.read(logger, {}, catalog))
+
+    messages = [call[0][0] for call in logger.info.call_args_list + logger.debug.call_args_list]
+    assert logs_metrics == any("Metrics of s1 stream" in message for message in messages)
+    assert (2 if logs_metrics else 0) == len([message for message in messages if message.startswith("Read slice")])
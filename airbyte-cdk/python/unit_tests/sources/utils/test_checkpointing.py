@@ -0,0 +1,112 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
+
+import pytest
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils import checkpointing
+from airbyte_cdk.sources.utils.checkpointing import IncrementalStateTracker
+
+
+class StubIncrementalStream(Stream):
+    primary_key = None
+    cursor_field = "updated_at"
+
+    def __init__(self, **checkpoint_policy):
+        self.checkpoint_policy = checkpoint_policy
+        self.get_updated_state_calls = 0
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return self.checkpoint_policy.get("records")
+
+    @property
+    def state_checkpoint_seconds(self) -> Optional[float]:
+        return self.checkpoint_policy.get("seconds")
+
+    @property
+    def state_checkpoint_bytes(self) -> Optional[int]:
+        return self.checkpoint_policy.get("bytes")
+
+    @property
+    def lazy_state_updates(self) -> bool:
+        return self.checkpoint_policy.get("lazy", False)
+
+    def read_records(self, sync_mode: SyncMode, cursor_field: List[str] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        return []
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
+        self.get_updated_state_calls += 1
+        return {"updated_at": max(current_stream_state.get("updated_at", 0), latest_record["updated_at"])}
+
+
+def _checkpoints(tracker: IncrementalStateTracker, records: Iterable[Mapping[str, Any]]) -> List[int]:
+    """:return: the indexes of the records after which state should be checkpointed"""
+    return [i for i, record in enumerate(records) if tracker.update(record) and tracker.checkpoint() is not None]
+
+
+@pytest.mark.parametrize(
+    "checkpoint_policy,expected_checkpoints",
+    [
+        ({}, []),
+        ({"records": 3}, [2, 5, 8]),
+        # each record is 16 or 17 bytes long once serialized, depending on the JSON library
+        ({"bytes": 40}, [2, 5, 8]),
+        ({"records": 2, "bytes": 40}, [1, 3, 5, 7, 9]),
+        ({"seconds": 0.0001}, list(range(10))),
+    ],
+)
+def test_checkpoint_policies(checkpoint_policy, expected_checkpoints, mocker):
+    mocker.patch("time.monotonic", side_effect=range(1000))
+    tracker = IncrementalStateTracker(StubIncrementalStream(**checkpoint_policy), {})
+
+    assert expected_checkpoints == _checkpoints(tracker, [{"updated_at": i} for i in range(10)])
+    assert {"updated_at": 9} == tracker.state
+
+
+def test_checkpoint_bytes_are_estimated_from_a_sample_of_records(mocker):
+    dumps = mocker.spy(checkpointing, "dumps")
+    tracker = IncrementalStateTracker(StubIncrementalStream(bytes=1_000_000), {})
+
+    _checkpoints(tracker, [{"updated_at": i} for i in range(250)])
+
+    sample_interval = checkpointing.BYTES_SAMPLE_INTERVAL
+    assert [0, sample_interval, 2 * sample_interval] == [call.args[0]["updated_at"] for call in dumps.call_args_list]
+
+
+def test_lazy_state_updates_only_compute_state_at_checkpoints():
+    stream = StubIncrementalStream(records=4, lazy=True)
+    tracker = IncrementalStateTracker(stream, {"updated_at": 5})
+
+    for cursor in [3, 8, 6, 7]:
+        tracker.update({"updated_at": cursor})
+    assert {"updated_at": 8} == tracker.checkpoint()
+    for cursor in [2, 9, None]:
+        tracker.update({"updated_at": cursor})
+
+    assert {"updated_at": 9} == tracker.state
+    assert 2 == stream.get_updated_state_calls
@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+from airbyte_cdk.sources.utils.concurrency import ITERABLE_EXHAUSTED, iterate_async, read_concurrently, read_concurrently_async
+
+
+def test_read_concurrently_yields_every_item_in_per_iterable_order():
+    iterables = [list(range(i * 100, (i + 1) * 100)) for i in range(5)]
+
+    items = defaultdict(list)
+    exhausted = []
+    for index, item in read_concurrently([lambda it=it: it for it in iterables], max_workers=3, buffer_size=10):
+        if item is ITERABLE_EXHAUSTED:
+            exhausted.append(index)
+        else:
+            assert index not in exhausted
+            items[index].append(item)
+
+    assert sorted(exhausted) == list(range(5))
+    assert [items[i] for i in range(5)] == iterables
+
+
+def test_read_concurrently_bounds_iterables_in_flight():
+    lock = threading.Lock()
+    in_flight, max_in_flight = 0, 0
+
+    def factory():
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        yield 1
+        with lock:
+            in_flight -= 1
+
+    results = list(read_concurrently((factory for _ in range(20)), max_workers=2))
+
+    assert len(results) == 40
+    assert max_in_flight <= 2
+
+
+def test_read_concurrently_propagates_exceptions():
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        list(read_concurrently([failing, lambda: range(1000)], max_workers=2, buffer_size=1))
+
+
+def _count_items_ahead_of_head(items) -> int:
+    """
+    :return: the highest number of items an iterable yielded while an earlier iterable was still being consumed
+    """
+    head, exhausted = 0, set()
+    items_ahead = defaultdict(int)
+    for index, item in items:
+        if item is ITERABLE_EXHAUSTED:
+            exhausted.add(index)
+            while head in exhausted:
+                head += 1
+        elif index != head:
+            items_ahead[index] += 1
+    return max(items_ahead.values(), default=0)
+
+
+def test_read_concurrently_bounds_items_ahead_of_head_iterable():
+    def slow():
+        for i in range(20):
+            time.sleep(0.005)
+            yield i
+
+    factories = [slow, lambda: range(1000), lambda: range(1000)]
+    assert _count_items_ahead_of_head(read_concurrently(factories, max_workers=3, max_items_ahead=10)) == 10
+    assert _count_items_ahead_of_head(read_concurrently(factories, max_workers=3)) > 10
+
+
+async def _async_range(start: int, stop: int):
+    for i in range(start, stop):
+        await asyncio.sleep(0)
+        yield i
+
+
+def test_iterate_async():
+    cleaned_up = []
+
+    async def cleanup():
+        cleaned_up.append(True)
+
+    assert list(range(10)) == list(iterate_async(_async_range(0, 10), cleanup=cleanup))
+    assert [True] == cleaned_up
+
+
+def test_read_concurrently_async_yields_every_item_in_per_iterable_order():
+    in_flight, max_in_flight = 0, 0
+
+    async def tracked_range(start: int, stop: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        async for i in _async_range(start, stop):
+            yield i
+        in_flight -= 1
+
+    items = defaultdict(list)
+    factories = [lambda i=i: tracked_range(i * 100, (i + 1) * 100) for i in range(10)]
+    for index, item in read_concurrently_async(factories, max_concurrency=4, buffer_size=5):
+        if item is not ITERABLE_EXHAUSTED:
+            items[index].append(item)
+
+    assert [list(range(i * 100, (i + 1) * 100)) for i in range(10)] == [items[i] for i in range(10)]
+    assert 1 < max_in_flight <= 4
+
+
+def test_read_concurrently_async_propagates_exceptions():
+    async def failing():
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        list(read_concurrently_async([failing, lambda: _async_range(0, 1000)], max_concurrency=2, buffer_size=1))
+
+
+def test_read_concurrently_async_bounds_items_ahead_of_head_iterable():
+    async def slow():
+        for i in range(20):
+            await asyncio.sleep(0.005)
+            yield i
+
+    factories = [slow, lambda: _async_range(0, 1000), lambda: _async_range(0, 1000)]
+    assert _count_items_ahead_of_head(read_concurrently_async(factories, max_concurrency=3, max_items_ahead=10)) == 10
+    assert _count_items_ahead_of_head(read_concurrently_async(factories, max_concurrency=3)) > 10
@@ -0,0 +1,147 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import socket
+import time
+from typing import List, Mapping
+
+import pytest
+from airbyte_cdk.sources.utils.metrics import MetricsReporter, MetricsSink, PrometheusTextfileSink, StatsdSink, StreamMetrics
+
+
+class StubLogger:
+    def __init__(self):
+        self.messages: List[str] = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+    def warn(self, message):
+        self.messages.append(message)
+
+
+class StubSink(MetricsSink):
+    def __init__(self):
+        self.exports = []
+
+    def export(self, stream_name: str, metrics: Mapping[str, float]):
+        self.exports.append((stream_name, metrics))
+
+
+def test_timed_counts_time_spent_producing_items_only():
+    def slow_items():
+        time.sleep(0.05)
+        yield 1
+        time.sleep(0.05)
+        yield 2
+
+    metrics = StreamMetrics("users")
+    for _ in metrics.timed("parse_seconds", slow_items()):
+        time.sleep(0.1)
+
+    assert 0.1 <= metrics.snapshot()["parse_seconds"] < 0.2
+
+
+def test_timed_counts_time_when_closed_early():
+    metrics = StreamMetrics("users")
+    items = metrics.timed("parse_seconds", iter([1, 2, 3]))
+    next(items)
+    items.close()
+
+    assert "parse_seconds" in metrics.snapshot()
+
+
+def test_complete_slice_returns_metrics_of_slice():
+    metrics = StreamMetrics("users")
+    metrics.increment("records", 3)
+    assert {"records": 3} == metrics.complete_slice()
+
+    metrics.increment("records", 2)
+    metrics.increment("http_requests")
+    assert {"records": 2, "http_requests": 1} == metrics.complete_slice()
+    assert {"records": 5, "http_requests": 1, "slices": 2} == metrics.snapshot()
+
+
+def test_reporter_reports_periodically_to_log_and_sinks():
+    logger, sink = StubLogger(), StubSink()
+    metrics = StreamMetrics("users")
+    metrics.increment("records", 10)
+    reporter = MetricsReporter(logger, metrics, [sink], interval=0.05)
+
+    reporter.maybe_report()
+    assert not sink.exports
+
+    time.sleep(0.05)
+    reporter.maybe_report()
+    assert 1 == len(sink.exports)
+    stream_name, exported = sink.exports[0]
+    assert "users" == stream_name and 10 == exported["records"] and exported["elapsed_seconds"] >= 0.05
+    assert json.loads(logger.messages[0].split(": ", 1)[1]) == exported
+
+
+def test_reporter_does_not_fail_when_sink_fails():
+    class FailingSink(MetricsSink):
+        def export(self, stream_name: str, metrics: Mapping[str, float]):
+            raise ConnectionError("unreachable")
+
+    logger = StubLogger()
+    MetricsReporter(logger, StreamMetrics("users"), [FailingSink()]).report()
+
+    assert "Failed to export metrics of users stream with FailingSink" in logger.messages[-1]
+
+
+def test_prometheus_textfile_sink(tmp_path):
+    sink = PrometheusTextfileSink(str(tmp_path), labels={"source": "source-stub"})
+    sink.export("users", {"records": 10, "request_seconds": 1.5})
+
+    assert ["airbyte_source_users.prom"] == [path.name for path in tmp_path.iterdir()]
+    assert (tmp_path / "airbyte_source_users.prom").read_text().splitlines() == [
+        "# TYPE airbyte_source_records_total counter",
+        'airbyte_source_records_total{source="source-stub",stream="users"} 10',
+        "# TYPE airbyte_source_request_seconds_total counter",
+        'airbyte_source_request_seconds_total{source="source-stub",stream="users"} 1.5',
+    ]
+
+
+@pytest.fixture
+def statsd_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(5)
+    yield server
+    server.close()
+
+
+def test_statsd_sink_sends_increments(statsd_server):
+    sink = StatsdSink("127.0.0.1", statsd_server.getsockname()[1])
+
+    sink.export("users", {"records": 10, "request_seconds": 1.5})
+    assert ["airbyte.source.users.records:10|c", "airbyte.source.users.request_seconds:1.5|c"] == statsd_server.recv(4096).decode().split(
+        "\n"
+    )
+
+    sink.export("users", {"records": 25, "request_seconds": 1.5})
+    assert ["airbyte.source.users.records:15|c"] == statsd_server.recv(4096).decode().split("\n")
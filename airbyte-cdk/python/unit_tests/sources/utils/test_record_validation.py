@@ -0,0 +1,64 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import pytest
+from airbyte_cdk.sources.utils import record_validation
+from airbyte_cdk.sources.utils.record_validation import RecordValidator
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "address": {"type": ["null", "object"], "properties": {"zip": {"type": "string"}}}},
+}
+
+
+@pytest.fixture(params=["compiled", "interpreted"])
+def validator_backend(request, monkeypatch):
+    if request.param == "compiled":
+        pytest.importorskip("fastjsonschema")
+    else:
+        monkeypatch.setattr(record_validation, "fastjsonschema", None)
+
+
+def test_validate_counts_invalid_records(validator_backend):
+    validator = RecordValidator(SCHEMA)
+
+    assert validator.validate({"id": 1, "address": None})
+    assert not validator.validate({"id": "1"})
+    assert not validator.validate({"id": 2, "address": {"zip": 75001}})
+    assert not validator.validate({"id": "3"})
+
+    assert (4, 3) == (validator.validated_records, validator.invalid_records)
+    # Identical errors are only reported once
+    assert 2 == len(validator.errors)
+    assert "Validated 4 records of users stream against its schema: 3 did not match it" in validator.summary("users")
+
+
+def test_validate_samples_records(validator_backend):
+    validator = RecordValidator(SCHEMA, sample_rate=0.1)
+
+    results = [validator.validate({"id": str(i)}) for i in range(100)]
+
+    assert 10 == validator.validated_records == validator.invalid_records
+    assert [i for i, valid in enumerate(results) if not valid] == list(range(9, 100, 10))
@@ -25,6 +25,7 @@
 
 import json
 import os
+import pkgutil
 import shutil
 import sys
 from collections.abc import Mapping
@@ -48,6 +49,12 @@ def create_and_teardown_schemas_dir():
     shutil.rmtree(SCHEMAS_ROOT)
 
 
+@fixture(autouse=True)
+def clear_schemas_cache():
+    # Each test writes its own schema files, which loaders only read again once the cache was cleared
+    ResourceSchemaLoader.clear_cache()
+
+
 def create_schema(name: str, content: Mapping):
     with open(SCHEMAS_ROOT / f"{name}.json", "w") as f:
         f.write(json.dumps(content))
@@ -96,3 +103,31 @@ class TestResourceSchemaLoader:
 
         actual_schema = resolver.get_schema("complex_schema")
         assert actual_schema == expected_schema
+
+    @staticmethod
+    def test_schemas_are_cached(mocker):
+        schema = {"type": ["null", "object"], "properties": {"str": {"type": "string"}}}
+        create_schema("cached_schema", schema)
+        get_data = mocker.spy(pkgutil, "get_data")
+
+        first = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+        first["properties"]["modified"] = {"type": "string"}
+        second = ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+
+        assert second == schema
+        assert get_data.call_count == 1
+
+        ResourceSchemaLoader.clear_cache()
+        ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema")
+        assert get_data.call_count == 2
+
+    @staticmethod
+    def test_get_all_schemas():
+        create_schema("all_schemas_1", {"type": "object"})
+        create_schema("all_schemas_2", {"type": "object", "properties": {"obj": {"$ref": "all_schemas_shared.json"}}})
+        create_schema("shared/all_schemas_shared", {"type": "object"})
+
+        schemas = ResourceSchemaLoader(MODULE_NAME).get_all_schemas()
+
+        assert schemas["all_schemas_1"] == {"type": "object"}
+        assert schemas["all_schemas_2"] == {"type": "object", "properties": {"obj": {"type": "object"}}}
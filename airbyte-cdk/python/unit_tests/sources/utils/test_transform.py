@@ -0,0 +1,96 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "price": {"type": ["null", "number"]},
+        "name": {"type": "string"},
+        "active": {"type": "boolean"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "day": {"type": "string", "format": "date"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {"type": ["null", "object"], "properties": {"zip": {"type": "string"}}},
+        "metadata": {"type": "object", "additionalProperties": True, "properties": {"version": {"type": "integer"}}},
+        "any": {},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "record,expected",
+    [
+        ({"id": "12", "price": "1.5", "name": 42, "active": "true"}, {"id": 12, "price": 1.5, "name": "42", "active": True}),
+        ({"id": 12.0, "price": 3, "active": 1}, {"id": 12, "price": 3, "active": True}),
+        # Values which can't be cast are left as they are
+        ({"id": "abc", "price": [1], "active": "yes", "id_float": 1.5}, {"id": "abc", "price": [1], "active": "yes", "id_float": 1.5}),
+        ({"id": True, "name": {"a": 1}}, {"id": True, "name": {"a": 1}}),
+        ({"id": "1.5", "price": "nan"}, {"id": "1.5", "price": "nan"}),
+        ({"id": "1e400", "price": "-1e400"}, {"id": "1e400", "price": "-1e400"}),
+        ({"id": "12.0", "name": True, "tags": [False]}, {"id": 12, "name": "true", "tags": ["false"]}),
+        # Numbers are not rounded
+        ({"id": "12345678901234567891.0", "price": "12345678901234567891"}, {"id": 12345678901234567891, "price": 12345678901234567891}),
+        ({"id": Decimal("12345678901234567891"), "price": Decimal("0.1")}, {"id": 12345678901234567891, "price": 0.1}),
+        ({"price": "0.12345678901234567891"}, {"price": "0.12345678901234567891"}),
+        ({"price": Decimal("12345678901234567891.5")}, {"price": Decimal("12345678901234567891.5")}),
+        ({"tags": [1, None, "a"], "address": {"zip": 75001}}, {"tags": ["1", None, "a"], "address": {"zip": "75001"}}),
+        ({"price": None, "address": None, "any": 1}, {"price": None, "address": None, "any": 1}),
+        # Dates are left as they are unless normalize_datetimes is set
+        ({"created_at": "2021-05-01 10:00:00"}, {"created_at": "2021-05-01 10:00:00"}),
+    ],
+)
+def test_cast_types(record, expected):
+    assert expected == TypeTransformer(SCHEMA).transform(record)
+
+
+def test_normalize_datetimes():
+    transformer = TypeTransformer(SCHEMA, TransformConfig(normalize_datetimes=True))
+
+    record = {"created_at": "2021-05-01 10:00:00", "day": "2021-05-01T23:00:00+02:00"}
+    assert {"created_at": "2021-05-01T10:00:00+00:00", "day": "2021-05-01"} == transformer.transform(record)
+    record = {"created_at": "not a date", "day": "10:00"}
+    assert record == transformer.transform(record)
+
+
+def test_drop_undeclared_fields():
+    transformer = TypeTransformer(SCHEMA, TransformConfig(cast_types=False, drop_undeclared_fields=True))
+
+    record = {"id": "1", "undeclared": 1, "address": {"zip": "1", "city": "Paris"}, "metadata": {"version": "2", "other": 1}}
+
+    assert {"id": "1", "address": {"zip": "1"}, "metadata": {"version": "2", "other": 1}} == transformer.transform(record)
+
+
+def test_transform_does_not_modify_input():
+    record = {"id": "1", "tags": [1]}
+
+    TypeTransformer(SCHEMA).transform(record)
+
+    assert {"id": "1", "tags": [1]} == record
@@ -0,0 +1,81 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+from typing import Any, Iterable, List, Mapping
+
+from airbyte_cdk.benchmark import benchmark_read, main
+from airbyte_cdk.logger import AirbyteLogger
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+
+
+class StubStream(Stream):
+    primary_key = None
+
+    def read_records(self, sync_mode: SyncMode, **kwargs) -> Iterable[Mapping[str, Any]]:
+        return ({"id": i} for i in range(100))
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+class StubSource(AbstractSource):
+    def check_connection(self, logger: AirbyteLogger, config: Mapping[str, Any]):
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return [StubStream()]
+
+
+def _catalog() -> ConfiguredAirbyteCatalog:
+    stream = StubStream().as_airbyte_stream()
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(stream=stream, sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite)
+        ]
+    )
+
+
+def test_benchmark_read_measures_read(capsys):
+    result = benchmark_read(StubSource(), {}, _catalog())
+
+    assert 100 == result.records and result.messages >= 100 and result.output_bytes > 0
+    assert result.seconds > 0 and result.cpu_seconds >= 0 and result.peak_rss_bytes > 0
+    assert result.records_per_second > 0
+    # Logs of the source are discarded
+    assert "" == capsys.readouterr().out
+
+
+def test_main_prints_result_of_each_run(tmp_path, capsys):
+    config_path, catalog_path = tmp_path / "config.json", tmp_path / "catalog.json"
+    config_path.write_text("{}")
+    catalog_path.write_text(_catalog().json())
+
+    main(["--source", f"{__name__}:StubSource", "--config", str(config_path), "--catalog", str(catalog_path), "--repeat", "2"])
+
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [100, 100] == [result["records"] for result in results]
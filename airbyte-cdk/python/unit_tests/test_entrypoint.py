@@ -23,12 +23,14 @@
 #
 
 
+import json
 from argparse import Namespace
 from copy import deepcopy
 from typing import Any, List, Mapping, MutableMapping, Union
 
 import pytest
 from airbyte_cdk import AirbyteEntrypoint
+from airbyte_cdk.entrypoint import launch
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -150,7 +152,8 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker):
     mocker.patch.object(MockSource, "read_state", return_value={})
     mocker.patch.object(MockSource, "read_catalog", return_value={})
     mocker.patch.object(MockSource, "read", return_value=[AirbyteMessage(record=expected, type=Type.RECORD)])
-    assert [_wrap_message(expected)] == list(entrypoint.run(parsed_args))
+    # records may be serialized with a faster JSON encoder than pydantic's, which doesn't use the same whitespace
+    assert [json.loads(_wrap_message(expected))] == [json.loads(message) for message in entrypoint.run(parsed_args)]
 
 
 def test_invalid_command(entrypoint: AirbyteEntrypoint, mocker):
@@ -158,3 +161,49 @@ def test_invalid_command(entrypoint: AirbyteEntrypoint, mocker):
         mocker.patch.object(MockSource, "read_config", return_value={})
         mocker.patch.object(MockSource, "configure", return_value={})
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
+
+
+def test_parse_profiling_args(entrypoint: AirbyteEntrypoint):
+    parsed_args = entrypoint.parse_args(
+        _as_arglist("read", {"config": "config_path", "catalog": "catalog_path", "profile": "read.prof", "profile-mode": "deterministic"})
+    )
+    assert "read.prof" == parsed_args.profile and "deterministic" == parsed_args.profile_mode
+
+
+def test_launch_profiles_read_when_env_var_is_set(tmp_path, mocker, monkeypatch):
+    profile_path = tmp_path / "read.folded"
+    monkeypatch.setenv("AIRBYTE_PROFILE", str(profile_path))
+    mocker.patch.object(MockSource, "read_config", return_value={})
+    mocker.patch.object(MockSource, "configure", return_value={})
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[])
+
+    launch(MockSource(), ["read", "--config", "config_path", "--catalog", "catalog_path"])
+
+    assert profile_path.exists()
+
+
+@pytest.mark.parametrize("profile_top", ["many", "0"])
+def test_launch_fails_on_invalid_profile_top_env_var(tmp_path, monkeypatch, profile_top):
+    monkeypatch.setenv("AIRBYTE_PROFILE", str(tmp_path / "read.folded"))
+    monkeypatch.setenv("AIRBYTE_PROFILE_TOP", profile_top)
+
+    with pytest.raises(ValueError, match="AIRBYTE_PROFILE_TOP must be a positive number"):
+        launch(MockSource(), ["read", "--config", "config_path", "--catalog", "catalog_path"])
+
+
+def test_launch_ignores_profile_top_env_var_when_passed_as_argument(tmp_path, mocker, monkeypatch):
+    monkeypatch.setenv("AIRBYTE_PROFILE_TOP", "many")
+    mocker.patch.object(MockSource, "read_config", return_value={})
+    mocker.patch.object(MockSource, "configure", return_value={})
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[])
+    profile_path = tmp_path / "read.folded"
+
+    launch(
+        MockSource(), ["read", "--config", "config_path", "--catalog", "catalog_path", "--profile", str(profile_path), "--profile-top", "5"]
+    )
+
+    assert profile_path.exists()
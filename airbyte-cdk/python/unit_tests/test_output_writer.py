@@ -0,0 +1,132 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import io
+import threading
+import time
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, Type
+from airbyte_cdk.output_writer import OutputWriter
+
+
+def test_writes_immediately_when_not_buffering():
+    stream = io.StringIO()
+    writer = OutputWriter(stream)
+
+    writer.write("message 1")
+    writer.write("message 2")
+
+    assert "message 1\nmessage 2\n" == stream.getvalue()
+
+
+def test_buffers_until_the_end_of_the_context():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, flush_interval=3600)
+
+    with writer.buffered():
+        writer.write("message 1")
+        writer.write("message 2")
+        assert "" == stream.getvalue()
+
+    assert "message 1\nmessage 2\n" == stream.getvalue()
+
+
+def test_flushes_when_buffer_is_full():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, buffer_size=20, flush_interval=3600)
+
+    with writer.buffered():
+        writer.write("message 1")
+        assert "" == stream.getvalue()
+        writer.write("message 2")
+        assert "message 1\nmessage 2\n" == stream.getvalue()
+
+
+def test_flushes_when_interval_elapsed():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, flush_interval=0)
+
+    with writer.buffered():
+        writer.write("message 1")
+        assert "message 1\n" == stream.getvalue()
+
+
+def test_flushes_in_the_background_when_interval_elapsed():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, flush_interval=0.01)
+
+    with writer.buffered():
+        writer.write("message 1")
+        # No other message is written: the buffered one must not wait for the next write or the end of the context
+        deadline = time.monotonic() + 5
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "message 1\n" == stream.getvalue()
+
+
+def test_flushes_on_state_messages():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, flush_interval=3600)
+    state = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"s": {}})).json(exclude_unset=True)
+
+    with writer.buffered():
+        writer.write("record")
+        writer.write(state, Type.STATE)
+        assert f"record\n{state}\n" == stream.getvalue()
+
+
+def test_flushes_on_error():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, flush_interval=3600)
+
+    try:
+        with writer.buffered():
+            writer.write("message 1")
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert "message 1\n" == stream.getvalue()
+
+
+def test_concurrent_writes_are_not_interleaved():
+    stream = io.StringIO()
+    writer = OutputWriter(stream, buffer_size=100)
+
+    def write_messages(prefix):
+        for i in range(1000):
+            writer.write(f"{prefix}-{i}")
+
+    with writer.buffered():
+        threads = [threading.Thread(target=write_messages, args=(prefix,)) for prefix in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = stream.getvalue().splitlines()
+    assert 4000 == len(lines)
+    for prefix in "abcd":
+        assert [f"{prefix}-{i}" for i in range(1000)] == [line for line in lines if line.startswith(prefix)]
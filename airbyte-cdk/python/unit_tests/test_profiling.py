@@ -0,0 +1,97 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import pstats
+import threading
+import time
+
+import pytest
+from airbyte_cdk.profiling import DeterministicProfiler, SamplingProfiler, profiled
+
+
+class StubLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+def busy_function(seconds: float):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def test_sampling_profiler_samples_other_threads(tmp_path):
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    worker = threading.Thread(target=busy_function, args=(0.2,))
+    worker.start()
+    worker.join()
+    profiler.stop()
+
+    assert "busy_function (test_profiling.py:" in profiler.summary(top=5)
+    path = tmp_path / "profile.folded"
+    profiler.dump(str(path))
+    stack, samples = path.read_text().splitlines()[0].rsplit(" ", 1)
+    assert int(samples) > 0 and stack
+
+
+def test_deterministic_profiler_writes_pstats(tmp_path):
+    profiler = DeterministicProfiler()
+    profiler.start()
+    busy_function(0.01)
+    profiler.stop()
+
+    path = tmp_path / "profile.prof"
+    profiler.dump(str(path))
+    assert any(name == "busy_function" for _, _, name in pstats.Stats(str(path)).stats)
+    assert "busy_function" in profiler.summary(top=10)
+
+
+def test_profiled_writes_profile_even_when_code_fails(tmp_path):
+    logger, path = StubLogger(), tmp_path / "profile.prof"
+
+    with pytest.raises(ValueError):
+        with profiled(str(path), mode="deterministic", top=3, logger=logger):
+            raise ValueError("sync failed")
+
+    assert path.exists()
+    assert logger.messages[0].startswith(f"Wrote deterministic profile to {path}. Top 3 functions:")
+
+
+def test_profiled_does_nothing_without_path():
+    logger = StubLogger()
+    with profiled(None, logger=logger):
+        pass
+
+    assert not logger.messages
+
+
+def test_profiled_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError, match="Unknown profiling mode"):
+        with profiled(str(tmp_path / "profile"), mode="statistical"):
+            pass
@@ -0,0 +1,65 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk import serialization
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Type
+from airbyte_cdk.serialization import dumps, serialize_message
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        AirbyteRecordMessage(stream="s", data={"str": "v", "int": 1, "nested": {"list": [1, None, True]}}, emitted_at=1),
+        AirbyteRecordMessage(stream="s", data={"date": datetime(2021, 1, 1, 12, 30), "dec": Decimal("1.5")}, emitted_at=1),
+        AirbyteRecordMessage(stream="s", data={}, emitted_at=1, namespace="ns"),
+        AirbyteRecordMessage.construct(stream="s", data={"k": "v"}, emitted_at=1),
+    ],
+)
+def test_serialize_record_matches_pydantic(encoder, record):
+    message = AirbyteMessage(type=Type.RECORD, record=record)
+    assert json.loads(message.json(exclude_unset=True)) == json.loads(serialize_message(message))
+
+
+def test_serialize_non_record_uses_pydantic(encoder):
+    message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"s": {"cursor": 1}}))
+    assert message.json(exclude_unset=True) == serialize_message(message)
+
+
+def test_dumps_large_integers(encoder):
+    assert {"k": 2 ** 70} == json.loads(dumps({"k": 2 ** 70}))
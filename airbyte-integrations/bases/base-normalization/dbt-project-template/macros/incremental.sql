@@ -0,0 +1,57 @@
+{#
+    Filters the rows of an incremental model (https://docs.getdbt.com/docs/building-a-dbt-project/building-models/configuring-incremental-models)
+    to the ones emitted after the most recent row of its table. When the table is (re)built from scratch, all rows are kept.
+#}
+
+{% macro incremental_clause(col_emitted_at) -%}
+{% if is_incremental() %}
+    {# -- max() is null when the table is empty, in which case all rows are kept #}
+    and coalesce({{ col_emitted_at }} > (select max({{ col_emitted_at }}) from {{ this }}), true)
+{% endif %}
+{%- endmacro %}
+
+{#
+    Overrides dbt's should_full_refresh() (https://docs.getdbt.com/reference/resource-configs/full_refresh), which both is_incremental()
+    and the incremental materialization rely on, so that an incremental model is also rebuilt from scratch when the columns of its existing
+    table don't match its expected_columns config, which lists all the columns the model generates. This happens when the schema of a stream
+    gained or lost a field, when its sync mode changed, or when the table was created by a version of normalization generating other
+    columns. Otherwise the model would fail to select columns from its table, or to merge the new rows into it (dbt inserts all the
+    columns of the existing table).
+#}
+
+{% macro should_full_refresh() %}
+  {% set config_full_refresh = config.get('full_refresh') %}
+  {% if config_full_refresh is none %}
+    {% set config_full_refresh = flags.FULL_REFRESH %}
+  {% endif %}
+  {% if not config_full_refresh %}
+    {% set config_full_refresh = has_changed_columns() %}
+  {% endif %}
+  {% do return(config_full_refresh) %}
+{% endmacro %}
+
+{% macro has_changed_columns() %}
+  {% set expected_columns = config.get('expected_columns') %}
+  {% if not execute or not expected_columns %}
+    {% do return(false) %}
+  {% endif %}
+  {% set relation = adapter.get_relation(this.database, this.schema, this.identifier) %}
+  {% if relation is none %}
+    {% do return(false) %}
+  {% endif %}
+  {% set existing_columns = adapter.get_columns_in_relation(relation) | map(attribute='name') | map('lower') | list %}
+  {% set expected_column_names = [] %}
+  {% for column in expected_columns %}
+    {# -- expected columns are quoted when they need to be, e.g. "HKD@spéçiäl & characters" #}
+    {% do expected_column_names.append(column | replace('"', '') | replace('`', '') | lower) %}
+  {% endfor %}
+  {% for column in expected_column_names if column not in existing_columns %}
+    {% do log("Rebuilding " ~ this ~ " from scratch since it has no " ~ column ~ " column", info=true) %}
+    {% do return(true) %}
+  {% endfor %}
+  {% for column in existing_columns if column not in expected_column_names %}
+    {% do log("Rebuilding " ~ this ~ " from scratch since its " ~ column ~ " column is no longer expected", info=true) %}
+    {% do return(true) %}
+  {% endfor %}
+  {% do return(false) %}
+{% endmacro %}
@@ -1,5 +1,61 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_airbyte_dedup_exchange_rate_hashid', schema="test_normalization", tags=["top-level"], expected_columns=['id', 'currency', 'date', 'HKD_special___characters', 'HKD_special___characters_1', 'NZD', 'USD', '_airbyte_start_at', '_airbyte_end_at', '_airbyte_active_row', '_airbyte_unique_key', '_airbyte_emitted_at', '_airbyte_dedup_exchange_rate_hashid']) }}
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with new_data as (
+    -- records to normalize, deduplicated based on the hash record column
+    select
+      *,
+      {{ dbt_utils.surrogate_key([
+        'id',
+        'currency',
+        'NZD',
+      ]) }} as _airbyte_unique_key,
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num
+    from {{ ref('dedup_exchange_rate_ab3') }}
+    where 1 = 1
+    {{ incremental_clause('_airbyte_emitted_at') }}
+),
+{% if is_incremental() %}
+previous_data as (
+    -- records normalized by previous runs for the primary keys of the new records, to recompute their validity along with the new records.
+    -- The records of the other primary keys are left untouched
+    select
+        id,
+        currency,
+        date,
+        HKD_special___characters,
+        HKD_special___characters_1,
+        NZD,
+        USD,
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from {{ this }}
+    where _airbyte_unique_key in (select _airbyte_unique_key from new_data)
+),
+{% endif %}
+input_data as (
+    select
+        id,
+        currency,
+        date,
+        HKD_special___characters,
+        HKD_special___characters_1,
+        NZD,
+        USD,
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from new_data
+    where _airbyte_row_num = 1
+    {% if is_incremental() %}
+    and _airbyte_dedup_exchange_rate_hashid not in (select _airbyte_dedup_exchange_rate_hashid from previous_data)
+    union all
+    select * from previous_data
+    {% endif %}
+)
 select
     id,
     currency,
@@ -17,9 +73,9 @@ select
         partition by id, currency, cast(NZD as {{ dbt_utils.type_string() }})
         order by date desc, _airbyte_emitted_at desc
     ) is null as _airbyte_active_row,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
-from {{ ref('dedup_exchange_rate_ab4') }}
+from input_data
 -- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
-where _airbyte_row_num = 1
 
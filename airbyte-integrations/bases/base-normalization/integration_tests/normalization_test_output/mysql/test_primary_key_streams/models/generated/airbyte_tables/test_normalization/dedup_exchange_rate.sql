@@ -8,6 +8,7 @@ select
     hkd_special___characters,
     nzd,
     usd,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from {{ ref('dedup_exchange_rate_scd') }}
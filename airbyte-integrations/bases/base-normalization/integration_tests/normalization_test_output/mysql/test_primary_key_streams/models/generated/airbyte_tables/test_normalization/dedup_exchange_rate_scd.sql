@@ -1,5 +1,35 @@
 {{ config(schema="test_normalization", tags=["top-level"]) }}
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with new_data as (
+    -- records to normalize, deduplicated based on the hash record column
+    select
+      *,
+      {{ dbt_utils.surrogate_key([
+        'id',
+        'currency',
+        'nzd',
+      ]) }} as _airbyte_unique_key,
+      row_number() over (
+        partition by _airbyte_dedup_exchange_rate_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num
+    from {{ ref('dedup_exchange_rate_ab3') }}
+),
+input_data as (
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from new_data
+    where _airbyte_row_num = 1
+)
 select
     id,
     currency,
@@ -17,9 +47,9 @@ select
         partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
         order by {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
     ) is null as _airbyte_active_row,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
-from {{ ref('dedup_exchange_rate_ab4') }}
+from input_data
 -- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
-where _airbyte_row_num = 1
 
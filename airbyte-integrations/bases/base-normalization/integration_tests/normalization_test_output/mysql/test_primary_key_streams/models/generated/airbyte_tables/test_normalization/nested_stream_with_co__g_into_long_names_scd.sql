@@ -1,5 +1,29 @@
 {{ config(schema="test_normalization", tags=["top-level"]) }}
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with new_data as (
+    -- records to normalize, deduplicated based on the hash record column
+    select
+      *,
+      {{ dbt_utils.surrogate_key([
+        'id',
+      ]) }} as _airbyte_unique_key,
+      row_number() over (
+        partition by _airbyte_nested_strea__nto_long_names_hashid
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num
+    from {{ ref('nested_stream_with_co__g_into_long_names_ab3') }}
+),
+input_data as (
+    select
+        id,
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _airbyte_nested_strea__nto_long_names_hashid
+    from new_data
+    where _airbyte_row_num = 1
+)
 select
     id,
     {{ adapter.quote('date') }},
@@ -13,9 +37,9 @@ select
         partition by id
         order by {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
     ) is null as _airbyte_active_row,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_nested_strea__nto_long_names_hashid
-from {{ ref('nested_stream_with_co__g_into_long_names_ab4') }}
+from input_data
 -- nested_stream_with_co__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_s__lting_into_long_names') }}
-where _airbyte_row_num = 1
 
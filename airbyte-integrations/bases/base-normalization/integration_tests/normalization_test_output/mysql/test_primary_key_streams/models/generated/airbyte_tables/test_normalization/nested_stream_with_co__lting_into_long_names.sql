@@ -4,6 +4,7 @@ select
     id,
     {{ adapter.quote('date') }},
     {{ adapter.quote('partition') }},
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_nested_strea__nto_long_names_hashid
 from {{ ref('nested_stream_with_co__g_into_long_names_scd') }}
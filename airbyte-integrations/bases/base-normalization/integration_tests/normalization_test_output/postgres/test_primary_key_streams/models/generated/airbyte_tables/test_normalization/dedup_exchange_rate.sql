@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level"], expected_columns=[adapter.quote('id'), 'currency', adapter.quote('date'), adapter.quote('HKD@spéçiäl & characters'), 'hkd_special___characters', 'nzd', 'usd', '_airbyte_unique_key', '_airbyte_emitted_at', '_airbyte_dedup_exchange_rate_hashid']) }}
 -- Final base SQL model
 select
     {{ adapter.quote('id') }},
@@ -8,9 +8,11 @@ select
     hkd_special___characters,
     nzd,
     usd,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
 from {{ ref('dedup_exchange_rate_scd') }}
 -- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
-where _airbyte_active_row = True
+where _airbyte_end_at is null
+{{ incremental_clause('_airbyte_emitted_at') }}
 
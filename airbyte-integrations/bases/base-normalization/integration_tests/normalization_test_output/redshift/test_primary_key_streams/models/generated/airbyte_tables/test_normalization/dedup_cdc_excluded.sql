@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level"], post_hook="delete from {{ this }} where _ab_cdc_deleted_at is not null", expected_columns=['id', 'name', '_ab_cdc_lsn', '_ab_cdc_updated_at', '_ab_cdc_deleted_at', '_airbyte_unique_key', '_airbyte_emitted_at', '_airbyte_dedup_cdc_excluded_hashid']) }}
 -- Final base SQL model
 select
     id,
@@ -6,9 +6,11 @@ select
     _ab_cdc_lsn,
     _ab_cdc_updated_at,
     _ab_cdc_deleted_at,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _airbyte_dedup_cdc_excluded_hashid
 from {{ ref('dedup_cdc_excluded_scd') }}
 -- dedup_cdc_excluded from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }}
-where _airbyte_active_row = True
+where _airbyte_end_at is null
+{{ incremental_clause('_airbyte_emitted_at') }}
 
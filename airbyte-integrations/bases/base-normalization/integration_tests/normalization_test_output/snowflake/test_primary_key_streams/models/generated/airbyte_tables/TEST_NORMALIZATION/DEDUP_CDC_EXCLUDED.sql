@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_airbyte_unique_key', schema="TEST_NORMALIZATION", tags=["top-level"], post_hook="delete from {{ this }} where _AB_CDC_DELETED_AT is not null", expected_columns=['ID', 'NAME', '_AB_CDC_LSN', '_AB_CDC_UPDATED_AT', '_AB_CDC_DELETED_AT', '_airbyte_unique_key', '_airbyte_emitted_at', '_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID']) }}
 -- Final base SQL model
 select
     ID,
@@ -6,9 +6,11 @@ select
     _AB_CDC_LSN,
     _AB_CDC_UPDATED_AT,
     _AB_CDC_DELETED_AT,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
 from {{ ref('DEDUP_CDC_EXCLUDED_SCD') }}
 -- DEDUP_CDC_EXCLUDED from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_CDC_EXCLUDED') }}
-where _airbyte_active_row = True
+where _airbyte_end_at is null
+{{ incremental_clause('_airbyte_emitted_at') }}
 
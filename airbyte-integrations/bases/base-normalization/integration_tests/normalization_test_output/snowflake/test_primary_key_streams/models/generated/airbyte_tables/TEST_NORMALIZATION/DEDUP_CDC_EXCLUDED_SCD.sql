@@ -1,5 +1,55 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID', schema="TEST_NORMALIZATION", tags=["top-level"], expected_columns=['ID', 'NAME', '_AB_CDC_LSN', '_AB_CDC_UPDATED_AT', '_AB_CDC_DELETED_AT', '_airbyte_start_at', '_airbyte_end_at', '_airbyte_active_row', '_airbyte_unique_key', '_airbyte_emitted_at', '_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID']) }}
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with new_data as (
+    -- records to normalize, deduplicated based on the hash record column
+    select
+      *,
+      {{ dbt_utils.surrogate_key([
+        'ID',
+      ]) }} as _airbyte_unique_key,
+      row_number() over (
+        partition by _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num
+    from {{ ref('DEDUP_CDC_EXCLUDED_AB3') }}
+    where 1 = 1
+    {{ incremental_clause('_airbyte_emitted_at') }}
+),
+{% if is_incremental() %}
+previous_data as (
+    -- records normalized by previous runs for the primary keys of the new records, to recompute their validity along with the new records.
+    -- The records of the other primary keys are left untouched
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from {{ this }}
+    where _airbyte_unique_key in (select _airbyte_unique_key from new_data)
+),
+{% endif %}
+input_data as (
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from new_data
+    where _airbyte_row_num = 1
+    {% if is_incremental() %}
+    and _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID not in (select _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID from previous_data)
+    union all
+    select * from previous_data
+    {% endif %}
+)
 select
     ID,
     NAME,
@@ -9,15 +59,15 @@ select
     _airbyte_emitted_at as _airbyte_start_at,
     lag(_airbyte_emitted_at) over (
         partition by ID
-        order by _airbyte_emitted_at desc, _airbyte_emitted_at desc
+        order by _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc
     ) as _airbyte_end_at,
     lag(_airbyte_emitted_at) over (
         partition by ID
         order by _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc
     ) is null and _ab_cdc_deleted_at is null as _airbyte_active_row,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
-from {{ ref('DEDUP_CDC_EXCLUDED_AB4') }}
+from input_data
 -- DEDUP_CDC_EXCLUDED from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_CDC_EXCLUDED') }}
-where _airbyte_row_num = 1
 
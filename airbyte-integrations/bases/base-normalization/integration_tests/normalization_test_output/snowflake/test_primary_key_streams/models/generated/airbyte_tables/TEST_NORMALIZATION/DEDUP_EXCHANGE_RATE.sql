@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(materialized="incremental", unique_key='_airbyte_unique_key', schema="TEST_NORMALIZATION", tags=["top-level"], expected_columns=['ID', 'CURRENCY', 'DATE', adapter.quote('HKD@spéçiäl & characters'), 'HKD_SPECIAL___CHARACTERS', 'NZD', 'USD', '_airbyte_unique_key', '_airbyte_emitted_at', '_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID']) }}
 -- Final base SQL model
 select
     ID,
@@ -8,9 +8,11 @@ select
     HKD_SPECIAL___CHARACTERS,
     NZD,
     USD,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
 from {{ ref('DEDUP_EXCHANGE_RATE_SCD') }}
 -- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
-where _airbyte_active_row = True
+where _airbyte_end_at is null
+{{ incremental_clause('_airbyte_emitted_at') }}
 
@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION_NAMESPACE", tags=["top-level"]) }}
+{{ config(materialized="incremental", schema="TEST_NORMALIZATION_NAMESPACE", tags=["top-level"], expected_columns=['ID', 'DATE', '_airbyte_emitted_at', '_AIRBYTE_SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES_HASHID']) }}
 -- Final base SQL model
 select
     ID,
@@ -7,4 +7,6 @@ select
     _AIRBYTE_SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES_HASHID
 from {{ ref('SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES_AB3') }}
 -- SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES from {{ source('TEST_NORMALIZATION_NAMESPACE', '_AIRBYTE_RAW_SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES') }}
+where 1 = 1
+{{ incremental_clause('_airbyte_emitted_at') }}
 
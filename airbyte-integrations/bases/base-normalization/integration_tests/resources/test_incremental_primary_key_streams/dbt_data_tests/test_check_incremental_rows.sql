@@ -0,0 +1,96 @@
+-- Checks the rows of the tables after records were appended to the raw tables and normalization ran a second time
+with row_checks as (
+    select 'raw records of both syncs' as description, count(*) as row_count, 5 as expected_count
+    from {{ source('test_normalization', '_airbyte_raw_dedup_users') }}
+union all
+    select 'history of all keys' as description, count(*) as row_count, 5 as expected_count
+    from {{ ref('dedup_users_scd') }}
+
+union all
+
+    -- updated key: the previous record is closed by the newer cursor, the newer one is active
+    select 'updated key history' as description, count(*) as row_count, 2 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 1
+union all
+    select 'updated key closed record' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 1 and username = 'alice' and _airbyte_start_at = 10 and _airbyte_end_at = 20
+union all
+    select 'updated key active record' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 1 and username = 'alice_updated' and _airbyte_start_at = 20 and _airbyte_end_at is null
+union all
+    select 'updated key final row' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users') }}
+    where id = 1 and username = 'alice_updated' and updated_at = 20
+
+union all
+
+    -- late record: the older cursor goes into the history, the record of the first sync stays active
+    select 'late record history' as description, count(*) as row_count, 2 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 2
+union all
+    select 'late record closed by the current record' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 2 and username = 'bob_late' and _airbyte_start_at = 5 and _airbyte_end_at = 10
+union all
+    select 'late record keeps the current record active' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 2 and username = 'bob' and _airbyte_start_at = 10 and _airbyte_end_at is null
+union all
+    select 'late record final row' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users') }}
+    where id = 2 and username = 'bob' and updated_at = 10
+
+union all
+
+    -- untouched key: same rows as after the first sync
+    select 'untouched key history' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users_scd') }}
+    where id = 3 and username = 'carol' and _airbyte_start_at = 10 and _airbyte_end_at is null
+union all
+    select 'untouched key final row' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_users') }}
+    where id = 3 and username = 'carol' and updated_at = 10
+union all
+    select 'one final row per key' as description, count(*) as row_count, 3 as expected_count
+    from {{ ref('dedup_users') }}
+
+union all
+
+    -- CDC delete: the delete closes the history of the key and removes it from the final table
+    select 'cdc raw records of both syncs' as description, count(*) as row_count, 3 as expected_count
+    from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_users') }}
+union all
+    select 'cdc deleted key history' as description, count(*) as row_count, 2 as expected_count
+    from {{ ref('dedup_cdc_users_scd') }}
+    where id = 1
+union all
+    select 'cdc deleted key closed record' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_cdc_users_scd') }}
+    where id = 1 and username = 'dave' and _airbyte_end_at is not null and _ab_cdc_deleted_at is null
+union all
+    select 'cdc deleted key delete record' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_cdc_users_scd') }}
+    where id = 1 and _airbyte_end_at is null and _ab_cdc_deleted_at is not null
+union all
+    select 'cdc deleted key final row' as description, count(*) as row_count, 0 as expected_count
+    from {{ ref('dedup_cdc_users') }}
+    where id = 1
+union all
+    select 'cdc untouched key history' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_cdc_users_scd') }}
+    where id = 2 and username = 'erin' and _airbyte_end_at is null
+union all
+    select 'cdc untouched key final row' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_cdc_users') }}
+    where id = 2 and username = 'erin'
+union all
+    select 'cdc one final row per remaining key' as description, count(*) as row_count, 1 as expected_count
+    from {{ ref('dedup_cdc_users') }}
+)
+select *
+from row_checks
+where row_count != expected_count
@@ -28,7 +28,7 @@ import pathlib
 import re
 import shutil
 import tempfile
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 from integration_tests.dbt_integration_test import DbtIntegrationTest
@@ -91,6 +91,29 @@ def test_normalization(destination_type: DestinationType, test_resource_name: st
     check_outputs(destination_type, test_resource_name, test_root_dir)
 
 
+@pytest.mark.parametrize("destination_type", list(DestinationType))
+def test_incremental_normalization(destination_type: DestinationType, setup_test_path):
+    """
+    Normalizes the raw tables, appends new records to them as a second sync would, then normalizes again
+    to check that incremental models merge the new records into the tables of the first run.
+    """
+    print("Testing incremental normalization")
+    test_resource_name = "test_incremental_primary_key_streams"
+    integration_type = destination_type.value
+    # Create the test folder with dbt project and appropriate destination settings to run integration tests from
+    test_root_dir = setup_test_dir(integration_type, test_resource_name)
+    destination_config = dbt_test_utils.generate_profile_yaml_file(destination_type, test_root_dir)
+    # First sync and normalization
+    assert setup_input_raw_data(integration_type, test_resource_name, test_root_dir, destination_config)
+    generate_dbt_models(destination_type, test_resource_name, test_root_dir)
+    dbt_test_utils.dbt_run(test_root_dir)
+    # Second sync appending to the raw tables of the first one, then incremental normalization
+    assert append_input_raw_data(integration_type, test_resource_name, test_root_dir, "messages_incremental.txt")
+    dbt_test_utils.dbt_run(test_root_dir)
+    # Run checks on the rows merged by the second run
+    dbt_test(destination_type, test_resource_name, test_root_dir)
+
+
 def setup_test_dir(integration_type: str, test_resource_name: str) -> str:
     """
     We prepare a clean folder to run the tests from.
@@ -145,7 +168,29 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
     config_file = os.path.join(test_root_dir, "destination_config.json")
     with open(config_file, "w") as f:
         f.write(json.dumps(destination_config))
-    commands = [
+    # Force a reset in destination raw tables
+    assert dbt_test_utils.run_destination_process(
+        "", test_root_dir, destination_write_commands(integration_type, test_root_dir, "reset_catalog.json")
+    )
+    # Run a sync to create raw tables in destinations
+    return dbt_test_utils.run_destination_process(
+        message_file, test_root_dir, destination_write_commands(integration_type, test_root_dir, "destination_catalog.json")
+    )
+
+
+def append_input_raw_data(integration_type: str, test_resource_name: str, test_root_dir: str, message_file_name: str) -> bool:
+    """
+    Run another sync of the destination with the records of message_file_name, without resetting the raw tables
+    populated by setup_input_raw_data (append_dedup streams are appended to, as in incremental syncs).
+    """
+    message_file = os.path.join("resources", test_resource_name, "data_input", message_file_name)
+    return dbt_test_utils.run_destination_process(
+        message_file, test_root_dir, destination_write_commands(integration_type, test_root_dir, "destination_catalog.json")
+    )
+
+
+def destination_write_commands(integration_type: str, test_root_dir: str, catalog_file_name: str) -> List[str]:
+    return [
         "docker",
         "run",
         "--rm",
@@ -160,11 +205,8 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
         "--config",
         "/data/destination_config.json",
         "--catalog",
+        f"/data/{catalog_file_name}",
     ]
-    # Force a reset in destination raw tables
-    assert dbt_test_utils.run_destination_process("", test_root_dir, commands + ["/data/reset_catalog.json"])
-    # Run a sync to create raw tables in destinations
-    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
 
 
 def generate_dbt_models(destination_type: DestinationType, test_resource_name: str, test_root_dir: str):
@@ -0,0 +1,111 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+
+
+def synthetic_catalog(streams: int, columns: int, depth: int) -> Dict[str, Any]:
+    """
+    @return a configured catalog of streams alternating between the append and append_dedup sync modes. Each stream has the given number
+    of columns, plus a nested object and a nested array of objects with half as many columns each, recursively up to the given depth.
+    """
+    return {
+        "streams": [
+            {
+                "stream": {
+                    "name": f"stream_{i}",
+                    "json_schema": {"type": "object", "properties": synthetic_properties(columns, depth)},
+                    "supported_sync_modes": ["incremental"],
+                },
+                "sync_mode": "incremental",
+                "cursor_field": ["id"],
+                "primary_key": [["id"]],
+                "destination_sync_mode": "append_dedup" if i % 2 else "append",
+            }
+            for i in range(streams)
+        ]
+    }
+
+
+def synthetic_properties(columns: int, depth: int) -> Dict[str, Any]:
+    properties = {f"Column {i} with Spaces-{depth}": {"type": ["null", "string"]} for i in range(columns)}
+    properties["id"] = {"type": "integer"}
+    if depth > 0:
+        properties[f"nested_object_{depth}"] = {"type": ["null", "object"], "properties": synthetic_properties(columns // 2, depth - 1)}
+        properties[f"nested_array_{depth}"] = {
+            "type": ["null", "array"],
+            "items": {"type": "object", "properties": synthetic_properties(columns // 2, depth - 1)},
+        }
+    return properties
+
+
+def benchmark_catalog_processor(catalog: Dict[str, Any], destination_type: DestinationType, max_workers: int = None) -> float:
+    """
+    @return how long (in seconds) the catalog processor takes to generate the models of the catalog
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        catalog_file = os.path.join(temp_dir, "catalog.json")
+        with open(catalog_file, "w") as file:
+            json.dump(catalog, file)
+        processor = CatalogProcessor(os.path.join(temp_dir, "models"), destination_type, max_workers=max_workers)
+        started_at = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor.process(catalog_file=catalog_file, json_column_name="_airbyte_data", default_schema="benchmark")
+        return time.perf_counter() - started_at
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks the generation of models for a synthetic catalog")
+    parser.add_argument("--integration-type", type=str, default="postgres", help="type of integration dialect to use")
+    parser.add_argument("--streams", type=int, default=100, help="number of streams of the catalog")
+    parser.add_argument("--columns", type=int, default=40, help="number of columns of each stream")
+    parser.add_argument("--depth", type=int, default=3, help="how deep objects and arrays are nested in each stream")
+    parser.add_argument("--max-workers", type=int, help="number of processes generating models, defaults to the number of CPUs available, up to 4")
+    parser.add_argument("--repeat", type=int, default=1, help="how many times to run the benchmark")
+    return parser.parse_args(args)
+
+
+def main(args: List[str] = None):
+    parsed_args = parse_args(sys.argv[1:] if args is None else args)
+    destination_type = DestinationType.from_string(parsed_args.integration_type)
+    catalog = synthetic_catalog(parsed_args.streams, parsed_args.columns, parsed_args.depth)
+    for _ in range(parsed_args.repeat):
+        seconds = benchmark_catalog_processor(catalog, destination_type, parsed_args.max_workers)
+        print(json.dumps({"streams": parsed_args.streams, "seconds": seconds}))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,9 +23,12 @@
 #
 
 
+import io
 import json
 import os
-from typing import Any, Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
@@ -34,6 +37,10 @@ from normalization.transform_catalog.destination_name_transformer import Destina
 from normalization.transform_catalog.stream_processor import StreamProcessor
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 
+# Each worker process holds the models of the streams it generates, so the default number of workers is capped to
+# bound memory usage on hosts with many CPUs
+MAX_DEFAULT_WORKERS = 4
+
 
 class CatalogProcessor:
     """
@@ -44,21 +51,26 @@ class CatalogProcessor:
     targeted destination schema.
 
     This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
+    Once table names are resolved, streams are independent from each other: the models of each top-level stream and
+    of its substreams are generated by a pool of worker processes.
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(self, output_directory: str, destination_type: DestinationType, max_workers: Optional[int] = None):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param max_workers is the number of processes generating models, see default_max_workers
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
+        self.max_workers: int = max_workers or default_max_workers()
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
-        This method first parse and build models to handle top-level streams.
-        In a second loop will go over the substreams that were nested in a breadth-first traversal manner.
+        This method first builds the tree of stream processors of the top-level streams and their nested substreams,
+        to resolve the table names of the whole catalog.
+        Then models are generated for each top-level stream and its substreams in a breadth-first traversal manner.
 
         @param catalog_file input AirbyteCatalog file in JSON Schema describing the structure of the raw data
         @param json_column_name is the column name containing the JSON Blob with the raw data
@@ -68,7 +80,6 @@ class CatalogProcessor:
         schema_to_source_tables: Dict[str, Set[str]] = {}
         catalog = read_json(catalog_file)
         # print(json.dumps(catalog, separators=(",", ":")))
-        substreams = []
         stream_processors = self.build_stream_processor(
             catalog=catalog,
             json_column_name=json_column_name,
@@ -89,14 +100,11 @@ class CatalogProcessor:
             truncate = self.destination_type == DestinationType.MYSQL
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
-
-            nested_processors = stream_processor.process()
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
+        for sql_outputs, log in self.generate_models(stream_processors):
+            print(log, end="")
+            for file in sql_outputs:
+                output_sql_file(os.path.join(self.output_directory, file), sql_outputs[file])
         self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
 
     @staticmethod
     def build_stream_processor(
@@ -161,20 +169,16 @@ class CatalogProcessor:
             result.append(stream_processor)
         return result
 
-    def process_substreams(self, substreams: List[StreamProcessor], tables_registry: TableNameRegistry):
+    def generate_models(self, stream_processors: List[StreamProcessor]) -> Iterator[Tuple[Dict[str, str], str]]:
         """
-        Handle nested stream/substream/children
+        @return the models generated for each stream processor and its substreams, along with the log of their generation, in the
+        order of the stream processors
         """
-        while substreams:
-            children = substreams
-            substreams = []
-            for substream in children:
-                substream.tables_registry = tables_registry
-                nested_processors = substream.process()
-                if nested_processors:
-                    substreams += nested_processors
-                for file in substream.sql_outputs:
-                    output_sql_file(os.path.join(self.output_directory, file), substream.sql_outputs[file])
+        if self.max_workers == 1 or len(stream_processors) <= 1:
+            return map(process_stream_tree, stream_processors)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            # Results are collected before the pool shuts down, as streams are processed in separate processes
+            return iter(list(executor.map(process_stream_tree, stream_processors)))
 
     def write_yaml_sources_file(self, schema_to_source_tables: Dict[str, Set[str]]):
         """
@@ -213,6 +217,24 @@ class CatalogProcessor:
 # Static Functions
 
 
+def process_stream_tree(stream_processor: StreamProcessor) -> Tuple[Dict[str, str], str]:
+    """
+    Generates the models of a top-level stream and of its substreams. This is run by worker processes.
+
+    @return the models, as a mapping of file path to SQL, and the log of their generation
+    """
+    sql_outputs: Dict[str, str] = {}
+    with redirect_stdout(io.StringIO()) as log:
+        substreams = [stream_processor]
+        while substreams:
+            children = substreams
+            substreams = []
+            for substream in children:
+                substreams += substream.process()
+                sql_outputs.update(substream.sql_outputs)
+    return sql_outputs, log.getvalue()
+
+
 def read_json(input_path: str) -> Any:
     """
     Reads and load a json file
@@ -284,11 +306,27 @@ def output_sql_file(file: str, sql: str):
     @param file is the path to filename to be written
     @param sql is the dbt sql content to be written in the generated model file
     """
+    content = "".join(line + "\n" for line in sql.splitlines() if line.strip()) + "\n"
+    if os.path.exists(file):
+        with open(file, "r") as f:
+            if f.read() == content:
+                # Files are only written when their content changed, so dbt can tell which models changed
+                return
     output_dir = os.path.dirname(file)
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     with open(file, "w") as f:
-        for line in sql.splitlines():
-            if line.strip():
-                f.write(line + "\n")
-        f.write("\n")
+        f.write(content)
+
+
+def default_max_workers() -> int:
+    """
+    @return the number of CPUs this process may run on (which are fewer than the CPUs of the host when running in a container
+    limited to some CPUs), up to MAX_DEFAULT_WORKERS
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpu_count = len(os.sched_getaffinity(0))
+    else:
+        # e.g: macOS
+        cpu_count = os.cpu_count() or 1
+    return max(1, min(cpu_count, MAX_DEFAULT_WORKERS))
@@ -23,8 +23,10 @@
 #
 
 
+import re
 import unicodedata as ud
-from re import match, sub
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.reserved_keywords import is_reserved_keyword
@@ -49,6 +51,14 @@ TRUNCATE_DBT_RESERVED_SIZE = 12
 # we keep 4 characters for 1 underscore and 3 characters hash (of the schema)
 TRUNCATE_RESERVED_SIZE = 8
 
+# Normalized names are computed many times per column (for each stream, substream and model) so they are cached.
+# The size of the cache bounds memory on catalogs with a very large number of distinct columns.
+NORMALIZED_NAMES_CACHE_SIZE = 65536
+
+NOT_ALPHA_UNDERSCORE_START = re.compile("[^A-Za-z_]")
+NOT_ALPHANUMERIC_UNDERSCORE = re.compile("[^A-Za-z0-9_]")
+WHITESPACES = re.compile(r"\s+")
+
 
 class DestinationNameTransformer:
     """
@@ -56,6 +66,8 @@ class DestinationNameTransformer:
     - schema
     - table
     - column
+
+    Normalized names are cached by destination type, kind of identifier and options, and shared by all instances.
     """
 
     def __init__(self, destination_type: DestinationType):
@@ -70,13 +82,7 @@ class DestinationNameTransformer:
         """
         @param input_name to test if it needs to manipulated with quotes or not
         """
-        if is_reserved_keyword(input_name, self.destination_type):
-            return True
-        if self.destination_type.value == DestinationType.BIGQUERY.value:
-            return False
-        doesnt_start_with_alphaunderscore = match("[^A-Za-z_]", input_name[0]) is not None
-        contains_non_alphanumeric = match(".*[^A-Za-z0-9_].*", input_name) is not None
-        return doesnt_start_with_alphaunderscore or contains_non_alphanumeric
+        return needs_quotes(input_name, self.destination_type)
 
     def normalize_schema_name(self, schema_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         """
@@ -85,7 +91,7 @@ class DestinationNameTransformer:
         @param truncate force ignoring truncate operation on resulting normalized name. For example, if we don't
         control how the name would be normalized
         """
-        return self.__normalize_non_column_identifier_name(input_name=schema_name, in_jinja=in_jinja, truncate=truncate)
+        return self.__normalize_name(self.destination_type, "schema", schema_name, in_jinja, truncate)
 
     def normalize_table_name(self, table_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         """
@@ -94,7 +100,7 @@ class DestinationNameTransformer:
         @param truncate force ignoring truncate operation on resulting normalized name. For example, if we don't
         control how the name would be normalized
         """
-        return self.__normalize_non_column_identifier_name(input_name=table_name, in_jinja=in_jinja, truncate=truncate)
+        return self.__normalize_name(self.destination_type, "table", table_name, in_jinja, truncate)
 
     def normalize_column_name(self, column_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         """
@@ -103,7 +109,32 @@ class DestinationNameTransformer:
         @param truncate force ignoring truncate operation on resulting normalized name. For example, if we don't
         control how the name would be normalized
         """
-        return self.__normalize_identifier_name(column_name=column_name, in_jinja=in_jinja, truncate=truncate)
+        return self.__normalize_name(self.destination_type, "column", column_name, in_jinja, truncate)
+
+    def normalize_column_names(self, column_names: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Normalizes all the columns of a table at once, avoiding duplicate names
+
+        @param column_names are the columns to normalize
+        @return a mapping of each column to a tuple where:
+         - the first value is the normalized "raw" column name
+         - the second value is the normalized quoted column name to be used in jinja context
+        """
+        result = {}
+        field_names = set()
+        for column_name in column_names:
+            field_name = self.normalize_column_name(column_name, in_jinja=False)
+            jinja_name = self.normalize_column_name(column_name, in_jinja=True)
+            if field_name in field_names:
+                # TODO handle column name duplicates or collisions deterministically in this stream
+                for i in range(1, 1000):
+                    field_name = self.normalize_column_name(f"{column_name}_{i}", in_jinja=False)
+                    jinja_name = self.normalize_column_name(f"{column_name}_{i}", in_jinja=True)
+                    if field_name not in field_names:
+                        break
+            field_names.add(field_name)
+            result[column_name] = (field_name, jinja_name)
+        return result
 
     def truncate_identifier_name(self, input_name: str, custom_limit: int = -1) -> str:
         """
@@ -132,6 +163,14 @@ class DestinationNameTransformer:
 
     # Private methods
 
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZED_NAMES_CACHE_SIZE)
+    def __normalize_name(destination_type: DestinationType, kind: str, input_name: str, in_jinja: bool, truncate: bool) -> str:
+        transformer = DestinationNameTransformer(destination_type)
+        if kind == "column":
+            return transformer.__normalize_identifier_name(column_name=input_name, in_jinja=in_jinja, truncate=truncate)
+        return transformer.__normalize_non_column_identifier_name(input_name=input_name, in_jinja=in_jinja, truncate=truncate)
+
     def __normalize_non_column_identifier_name(self, input_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         # We force standard naming for non column names (see issue #1785)
         result = transform_standard_naming(input_name)
@@ -164,7 +203,7 @@ class DestinationNameTransformer:
         result = input_name
         if self.destination_type.value == DestinationType.BIGQUERY.value:
             result = transform_standard_naming(result)
-            doesnt_start_with_alphaunderscore = match("[^A-Za-z_]", result[0]) is not None
+            doesnt_start_with_alphaunderscore = NOT_ALPHA_UNDERSCORE_START.match(result) is not None
             if doesnt_start_with_alphaunderscore:
                 result = f"_{result}"
         return result
@@ -193,13 +232,27 @@ class DestinationNameTransformer:
 # Static Functions
 
 
+@lru_cache(maxsize=NORMALIZED_NAMES_CACHE_SIZE)
+def needs_quotes(input_name: str, destination_type: DestinationType) -> bool:
+    if is_reserved_keyword(input_name, destination_type):
+        return True
+    if destination_type.value == DestinationType.BIGQUERY.value:
+        return False
+    doesnt_start_with_alphaunderscore = NOT_ALPHA_UNDERSCORE_START.match(input_name) is not None
+    contains_non_alphanumeric = NOT_ALPHANUMERIC_UNDERSCORE.search(input_name) is not None
+    return doesnt_start_with_alphaunderscore or contains_non_alphanumeric
+
+
 def transform_standard_naming(input_name: str) -> str:
     result = input_name.strip()
     result = strip_accents(result)
-    result = sub(r"\s+", "_", result)
-    result = sub(r"[^a-zA-Z0-9_]", "_", result)
+    result = WHITESPACES.sub("_", result)
+    result = NOT_ALPHANUMERIC_UNDERSCORE.sub("_", result)
     return result
 
 
 def strip_accents(input_name: str) -> str:
+    if input_name.isascii():
+        # Most names don't have any accent, and ASCII characters are never decomposed
+        return input_name
     return "".join(c for c in ud.normalize("NFD", input_name) if ud.category(c) != "Mn")
@@ -27,7 +27,6 @@ import os
 from typing import Dict, List, Optional, Tuple
 
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
-from jinja2 import Template
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
@@ -42,6 +41,7 @@ from normalization.transform_catalog.utils import (
     is_simple_property,
     is_string,
     jinja_call,
+    jinja_template,
 )
 
 # using too many columns breaks ephemeral materialization (somewhere between 480 and 490 columns)
@@ -107,6 +107,9 @@ class StreamProcessor(object):
         self.sql_outputs: Dict[str, str] = {}
         self.parent: Optional["StreamProcessor"] = None
         self.is_nested_array: bool = False
+        # Cached by extract_column_names() and collect_table_names(), so they are only computed once per stream
+        self.column_names: Optional[Dict[str, Tuple[str, str]]] = None
+        self.children: Optional[List["StreamProcessor"]] = None
 
     @staticmethod
     def create_from_parent(
@@ -195,7 +198,9 @@ class StreamProcessor(object):
     def collect_table_names(self):
         column_names = self.extract_column_names()
         self.tables_registry.register_table(self.get_schema(True), self.get_schema(False), self.stream_name, self.json_path)
-        for child in self.find_children_streams(self.from_table, column_names):
+        # The children are kept to be processed later on, once they know which table of this stream they are extracted from
+        self.children = self.find_children_streams(self.from_table, column_names)
+        for child in self.children:
             child.collect_table_names()
 
     def process(self) -> List["StreamProcessor"]:
@@ -225,24 +230,75 @@ class StreamProcessor(object):
             self.generate_id_hashing_model(from_table, column_names), is_intermediate=True, column_count=column_count, suffix="ab3"
         )
         if self.destination_sync_mode.value == DestinationSyncMode.append_dedup.value:
-            from_table = self.add_to_outputs(self.generate_dedup_record_model(from_table, column_names), is_intermediate=True, suffix="ab4")
-            where_clause = "\nwhere _airbyte_row_num = 1"
             from_table = self.add_to_outputs(
-                self.generate_scd_type_2_model(from_table, column_names) + where_clause,
+                self.generate_scd_type_2_model(from_table, column_names),
                 is_intermediate=False,
                 column_count=column_count,
                 suffix="scd",
+                is_incremental=self.is_incremental_mode(),
+                unique_key=self.hash_id(),
+                expected_columns=self.list_expected_columns(
+                    column_names, ["_airbyte_start_at", "_airbyte_end_at", "_airbyte_active_row", "_airbyte_unique_key", "_airbyte_emitted_at"]
+                ),
             )
-            where_clause = "\nwhere _airbyte_active_row = True"
+            if self.is_incremental_mode():
+                # Only the latest records of the primary keys updated since the last run are merged into the final table
+                where_clause = "\nwhere _airbyte_end_at is null\n" + jinja_call("incremental_clause('_airbyte_emitted_at')")
+                post_hook = ""
+                if "_ab_cdc_deleted_at" in column_names.keys():
+                    # The latest record of deleted primary keys replaces their previous record, then gets deleted
+                    post_hook = f"delete from {{{{ this }}}} where {column_names['_ab_cdc_deleted_at'][0]} is not null"
+                from_table = self.add_to_outputs(
+                    self.generate_final_model(from_table, column_names, include_unique_key=True) + where_clause,
+                    is_intermediate=False,
+                    column_count=column_count,
+                    is_incremental=True,
+                    unique_key="_airbyte_unique_key",
+                    post_hook=post_hook,
+                    expected_columns=self.list_expected_columns(column_names, ["_airbyte_unique_key", "_airbyte_emitted_at"]),
+                )
+            else:
+                where_clause = "\nwhere _airbyte_active_row = True"
+                from_table = self.add_to_outputs(
+                    self.generate_final_model(from_table, column_names, include_unique_key=True) + where_clause,
+                    is_intermediate=False,
+                    column_count=column_count,
+                )
+            # TODO generate yaml file to dbt test final table where primary keys should be unique
+        elif self.is_incremental_mode():
+            where_clause = "\nwhere 1 = 1\n" + jinja_call("incremental_clause('_airbyte_emitted_at')")
             from_table = self.add_to_outputs(
-                self.generate_final_model(from_table, column_names) + where_clause, is_intermediate=False, column_count=column_count
+                self.generate_final_model(from_table, column_names) + where_clause,
+                is_intermediate=False,
+                column_count=column_count,
+                is_incremental=True,
+                expected_columns=self.list_expected_columns(column_names, ["_airbyte_emitted_at"]),
             )
-            # TODO generate yaml file to dbt test final table where primary keys should be unique
         else:
             from_table = self.add_to_outputs(
                 self.generate_final_model(from_table, column_names), is_intermediate=False, column_count=column_count
             )
-        return self.find_children_streams(from_table, column_names)
+        if self.children is None:
+            self.children = self.find_children_streams(from_table, column_names)
+        else:
+            for child in self.children:
+                child.from_table = from_table
+        return self.children
+
+    def is_incremental_mode(self) -> bool:
+        """
+        Incremental models only normalize the raw records emitted since they were last run, and insert (or merge) them into their
+        existing table instead of rebuilding it from the whole raw table.
+
+        Streams appending their records to the raw table are normalized incrementally, along with their nested streams. Nested streams
+        of deduplicated streams are rebuilt instead, so they don't keep the children of superseded records.
+        """
+        if self.destination_type == DestinationType.MYSQL:
+            # dbt-mysql does not support the incremental materialization
+            return False
+        if self.parent:
+            return self.parent.is_incremental_mode() and self.parent.destination_sync_mode.value == DestinationSyncMode.append.value
+        return self.destination_sync_mode.value in [DestinationSyncMode.append.value, DestinationSyncMode.append_dedup.value]
 
     def extract_column_names(self) -> Dict[str, Tuple[str, str]]:
         """
@@ -252,25 +308,14 @@ class StreamProcessor(object):
          - the first value is the normalized "raw" column name
          - the second value is the normalized quoted column name to be used in jinja context
         """
+        if self.column_names is not None:
+            return self.column_names
         fields = []
         for field in self.properties.keys():
             if not is_airbyte_column(field):
                 fields.append(field)
-        result = {}
-        field_names = set()
-        for field in fields:
-            field_name = self.name_transformer.normalize_column_name(field, in_jinja=False)
-            jinja_name = self.name_transformer.normalize_column_name(field, in_jinja=True)
-            if field_name in field_names:
-                # TODO handle column name duplicates or collisions deterministically in this stream
-                for i in range(1, 1000):
-                    field_name = self.name_transformer.normalize_column_name(f"{field}_{i}", in_jinja=False)
-                    jinja_name = self.name_transformer.normalize_column_name(f"{field}_{i}", in_jinja=True)
-                    if field_name not in field_names:
-                        break
-            field_names.add(field_name)
-            result[field] = (field_name, jinja_name)
-        return result
+        self.column_names = self.name_transformer.normalize_column_names(fields)
+        return self.column_names
 
     def find_children_streams(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> List["StreamProcessor"]:
         """
@@ -310,7 +355,7 @@ class StreamProcessor(object):
         return children
 
     def generate_json_parsing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = jinja_template(
             """
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 {{ unnesting_before_query }}
@@ -357,7 +402,7 @@ from {{ from_table }}
         return f"{json_extract} as {column_name}"
 
     def generate_column_typing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = jinja_template(
             """
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
@@ -408,7 +453,7 @@ from {{ from_table }}
         return f"cast({column_name} as {sql_type}) as {column_name}"
 
     def generate_id_hashing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = jinja_template(
             """
 -- SQL model to build a hash column based on the values of this record
 select
@@ -451,31 +496,70 @@ from {{ from_table }}
         else:
             return column_name
 
-    def generate_dedup_record_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
-            """
--- SQL model to prepare for deduplicating records based on the hash record column
-select
-  *,
-  row_number() over (
-    partition by {{ hash_id }}
-    order by _airbyte_emitted_at asc
-  ) as _airbyte_row_num
-from {{ from_table }}
-{{ sql_table_comment }}
-        """
-        )
-        sql = template.render(
-            hash_id=self.hash_id(),
-            from_table=jinja_call(from_table),
-            sql_table_comment=self.sql_table_comment(include_from_table=True),
-        )
-        return sql
-
     def generate_scd_type_2_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = jinja_template(
             """
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+with new_data as (
+    -- records to normalize, deduplicated based on the hash record column
+    select
+      *,
+      {{ '{{' }} dbt_utils.surrogate_key([
+      {%- for primary_key_column in primary_key_columns %}
+        {{ primary_key_column }},
+      {%- endfor %}
+      ]) {{ '}}' }} as _airbyte_unique_key,
+      row_number() over (
+        partition by {{ hash_id }}
+        order by _airbyte_emitted_at asc
+      ) as _airbyte_row_num
+    from {{ from_table }}
+  {%- if is_incremental %}
+    where 1 = 1
+    {{ incremental_clause }}
+  {%- endif %}
+),
+{%- if is_incremental %}
+{{ '{%' }} if is_incremental() {{ '%}' }}
+previous_data as (
+    -- records normalized by previous runs for the primary keys of the new records, to recompute their validity along with the new records.
+    -- The records of the other primary keys are left untouched
+    select
+      {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+      {%- endif %}
+      {%- for field in fields %}
+        {{ field }},
+      {%- endfor %}
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        {{ hash_id }}
+    from {{ '{{' }} this {{ '}}' }}
+    where _airbyte_unique_key in (select _airbyte_unique_key from new_data)
+),
+{{ '{%' }} endif {{ '%}' }}
+{%- endif %}
+input_data as (
+    select
+      {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+      {%- endif %}
+      {%- for field in fields %}
+        {{ field }},
+      {%- endfor %}
+        _airbyte_unique_key,
+        _airbyte_emitted_at,
+        {{ hash_id }}
+    from new_data
+    where _airbyte_row_num = 1
+  {%- if is_incremental %}
+    {{ '{%' }} if is_incremental() {{ '%}' }}
+    and {{ hash_id }} not in (select {{ hash_id }} from previous_data)
+    union all
+    select * from previous_data
+    {{ '{%' }} endif {{ '%}' }}
+  {%- endif %}
+)
 select
   {%- if parent_hash_id %}
     {{ parent_hash_id }},
@@ -486,15 +570,16 @@ select
     {{ cursor_field }} as _airbyte_start_at,
     lag({{ cursor_field }}) over (
         partition by {{ primary_key }}
-        order by {{ cursor_field }} desc, _airbyte_emitted_at desc
+        order by {{ cursor_field }} desc, _airbyte_emitted_at desc{{ cdc_updated_at_order }}
     ) as _airbyte_end_at,
     lag({{ cursor_field }}) over (
         partition by {{ primary_key }}
         order by {{ cursor_field }} desc, _airbyte_emitted_at desc{{ cdc_updated_at_order }}
     ) is null {{ cdc_active_row }}as _airbyte_active_row,
+    _airbyte_unique_key,
     _airbyte_emitted_at,
     {{ hash_id }}
-from {{ from_table }}
+from input_data
 {{ sql_table_comment }}
         """
         )
@@ -510,8 +595,11 @@ from {{ from_table }}
             fields=self.list_fields(column_names),
             cursor_field=self.get_cursor_field(column_names),
             primary_key=self.get_primary_key(column_names),
+            primary_key_columns=self.list_primary_key_columns(column_names),
             hash_id=self.hash_id(),
             from_table=jinja_call(from_table),
+            is_incremental=self.is_incremental_mode(),
+            incremental_clause=jinja_call("incremental_clause('_airbyte_emitted_at')"),
             sql_table_comment=self.sql_table_comment(include_from_table=True),
             cdc_active_row=cdc_active_row_pattern,
             cdc_updated_at_order=cdc_updated_order_pattern,
@@ -536,6 +624,19 @@ from {{ from_table }}
         else:
             raise ValueError(f"No primary key specified for stream {self.stream_name}")
 
+    def list_primary_key_columns(self, column_names: Dict[str, Tuple[str, str]]) -> List[str]:
+        """
+        @return the columns of the primary key, to be used within a jinja context (for example, from jinja macro surrogate_key call)
+        """
+        result = []
+        for path in self.primary_key:
+            field = path[0]
+            if is_airbyte_column(field):
+                result.append(f"'{field}'")
+            else:
+                result.append(StreamProcessor.safe_cast_to_string(self.properties[field], column_names[field][1]))
+        return result
+
     def get_primary_key_from_path(self, column_names: Dict[str, Tuple[str, str]], path: List[str]) -> str:
         if path and len(path) == 1:
             field = path[0]
@@ -558,8 +659,8 @@ from {{ from_table }}
             else:
                 raise ValueError(f"No path specified for stream {self.stream_name}")
 
-    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]], include_unique_key: bool = False) -> str:
+        template = jinja_template(
             """
 -- Final base SQL model
 select
@@ -569,6 +670,9 @@ select
   {%- for field in fields %}
     {{ field }},
   {%- endfor %}
+  {%- if include_unique_key %}
+    _airbyte_unique_key,
+  {%- endif %}
     _airbyte_emitted_at,
     {{ hash_id }}
 from {{ from_table }}
@@ -578,6 +682,7 @@ from {{ from_table }}
         sql = template.render(
             parent_hash_id=self.parent_hash_id(),
             fields=self.list_fields(column_names),
+            include_unique_key=include_unique_key,
             hash_id=self.hash_id(),
             from_table=jinja_call(from_table),
             sql_table_comment=self.sql_table_comment(include_from_table=True),
@@ -588,7 +693,32 @@ from {{ from_table }}
     def list_fields(column_names: Dict[str, Tuple[str, str]]) -> List[str]:
         return [column_names[field][0] for field in column_names]
 
-    def add_to_outputs(self, sql: str, is_intermediate: bool, column_count: int = 0, suffix: str = "") -> str:
+    def list_expected_columns(self, column_names: Dict[str, Tuple[str, str]], airbyte_columns: List[str]) -> List[str]:
+        """
+        Incremental models are rebuilt from scratch when the columns of their table don't match all the columns they generate,
+        e.g. when the stream gained a field (see should_full_refresh() in macros/incremental.sql)
+
+        @return the columns generated by a model, to be used within a jinja context
+        """
+        result = []
+        if self.parent:
+            result.append(self.parent.hash_id(in_jinja=True))
+        result += [column_names[field][1] for field in column_names]
+        result += [f"'{column}'" for column in airbyte_columns]
+        result.append(self.hash_id(in_jinja=True))
+        return result
+
+    def add_to_outputs(
+        self,
+        sql: str,
+        is_intermediate: bool,
+        column_count: int = 0,
+        suffix: str = "",
+        is_incremental: bool = False,
+        unique_key: str = "",
+        post_hook: str = "",
+        expected_columns: List[str] = None,
+    ) -> str:
         schema = self.get_schema(is_intermediate)
         # MySQL table names need to be manually truncated, because it does not do it automatically
         truncate_name = self.destination_type == DestinationType.MYSQL
@@ -605,11 +735,19 @@ from {{ from_table }}
         else:
             output = os.path.join("airbyte_tables", self.schema, file)
         tags = self.get_model_tags(is_intermediate)
+        config = f'schema="{schema}", tags=[{tags}]'
+        if is_incremental:
+            # Models without unique key only insert the new rows, the others merge them with the existing rows having the same key
+            config = 'materialized="incremental", ' + (f"unique_key='{unique_key}', " if unique_key else "") + config
+        if post_hook:
+            config += f', post_hook="{post_hook}"'
+        if is_incremental and expected_columns:
+            # See list_expected_columns
+            config += f", expected_columns=[{', '.join(expected_columns)}]"
         # The alias() macro configs a model's final table name.
         if file_name != table_name:
-            header = jinja_call(f'config(alias="{table_name}", schema="{schema}", tags=[{tags}])')
-        else:
-            header = jinja_call(f'config(schema="{schema}", tags=[{tags}])')
+            config = f'alias="{table_name}", ' + config
+        header = jinja_call(f"config({config})")
         self.sql_outputs[
             output
         ] = f"""
@@ -655,8 +793,8 @@ from {{ from_table }}
             result += f" from {from_table}"
         return result
 
-    def hash_id(self) -> str:
-        return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_hashid")
+    def hash_id(self, in_jinja: bool = False) -> str:
+        return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_hashid", in_jinja=in_jinja)
 
     # Nested Streams
 
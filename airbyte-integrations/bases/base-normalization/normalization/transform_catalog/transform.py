@@ -61,6 +61,12 @@ python3 main_dev_transform_catalog.py \
         parser.add_argument("--catalog", nargs="+", type=str, required=True, help="path to Catalog (JSON Schema) file")
         parser.add_argument("--out", type=str, required=True, help="path to output generated DBT Models to")
         parser.add_argument("--json-column", type=str, required=False, help="name of the column containing the json blob")
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            required=False,
+            help="number of processes generating models, defaults to the number of CPUs available, up to 4",
+        )
         parsed_args = parser.parse_args(args)
         profiles_yml = read_profiles_yml(parsed_args.profile_config_dir)
         self.config = {
@@ -69,6 +75,7 @@ python3 main_dev_transform_catalog.py \
             "catalog": parsed_args.catalog,
             "output_path": parsed_args.out,
             "json_column": parsed_args.json_column,
+            "max_workers": parsed_args.max_workers,
         }
 
     def process_catalog(self) -> None:
@@ -76,7 +83,7 @@ python3 main_dev_transform_catalog.py \
         schema = self.config["schema"]
         output = self.config["output_path"]
         json_col = self.config["json_column"]
-        processor = CatalogProcessor(output_directory=output, destination_type=destination_type)
+        processor = CatalogProcessor(output_directory=output, destination_type=destination_type, max_workers=self.config.get("max_workers"))
         for catalog_file in self.config["catalog"]:
             print(f"Processing {catalog_file}...")
             processor.process(catalog_file=catalog_file, json_column_name=json_col, default_schema=schema)
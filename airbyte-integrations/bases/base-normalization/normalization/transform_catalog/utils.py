@@ -23,13 +23,24 @@
 #
 
 
+from functools import lru_cache
 from typing import Set
 
+from jinja2 import Template
+
 
 def jinja_call(command: str) -> str:
     return "{{ " + command + " }}"
 
 
+@lru_cache(maxsize=None)
+def jinja_template(source: str) -> Template:
+    """
+    Compiling a template takes far longer than rendering it, so each template is compiled once and reused for every stream
+    """
+    return Template(source)
+
+
 def is_string(property_type) -> bool:
     return property_type == "string" or "string" in property_type
 
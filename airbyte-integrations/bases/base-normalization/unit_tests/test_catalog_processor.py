@@ -0,0 +1,104 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import os
+from typing import Dict
+
+import pytest
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.benchmark import benchmark_catalog_processor, synthetic_catalog
+from normalization.transform_catalog.catalog_processor import CatalogProcessor, default_max_workers, output_sql_file
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+@pytest.mark.parametrize("catalog_file", ["nested_catalog", "un-nesting_collisions_catalog"])
+def test_parallel_processing(tmp_path, catalog_file: str):
+    """
+    Models generated by several worker processes should be the same as the ones generated sequentially
+    """
+    outputs = []
+    for max_workers in [1, 2]:
+        output_directory = str(tmp_path / str(max_workers))
+        CatalogProcessor(output_directory, DestinationType.POSTGRES, max_workers=max_workers).process(
+            catalog_file=f"resources/{catalog_file}.json", json_column_name="_airbyte_data", default_schema="schema_test"
+        )
+        outputs.append(read_directory(output_directory))
+    assert outputs[0]
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("available_cpus, expected_max_workers", [(1, 1), (2, 2), (64, 4)])
+def test_default_max_workers(monkeypatch, available_cpus: int, expected_max_workers: int):
+    """
+    Only the CPUs this process may run on are used by default, up to a few of them
+    """
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(available_cpus)), raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 128)
+    assert default_max_workers() == expected_max_workers
+    assert CatalogProcessor("output", DestinationType.POSTGRES).max_workers == expected_max_workers
+
+
+def test_benchmark_catalog_processor():
+    assert benchmark_catalog_processor(synthetic_catalog(streams=2, columns=4, depth=1), DestinationType.POSTGRES, max_workers=1) > 0
+
+
+def test_output_sql_file_only_writes_changed_content(tmp_path):
+    """
+    Files are only rewritten when their content changed, so their modification time tells dbt which models changed
+    """
+    file = str(tmp_path / "models" / "model.sql")
+    output_sql_file(file, "select 1\n\n  \nfrom table")
+    with open(file) as f:
+        assert f.read() == "select 1\nfrom table\n\n"
+    os.utime(file, ns=(0, 0))
+
+    output_sql_file(file, "select 1\nfrom table")
+    assert os.stat(file).st_mtime_ns == 0
+
+    output_sql_file(file, "select 2\nfrom table")
+    assert os.stat(file).st_mtime_ns != 0
+    with open(file) as f:
+        assert f.read() == "select 2\nfrom table\n\n"
+
+
+def read_directory(directory: str) -> Dict[str, str]:
+    files = {}
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            with open(os.path.join(root, file_name)) as file:
+                files[os.path.relpath(os.path.join(root, file_name), directory)] = file.read()
+    return files
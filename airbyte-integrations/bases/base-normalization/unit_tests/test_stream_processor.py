@@ -118,3 +118,102 @@ def test_primary_key(
     except ValueError as e:
         if not expecting_exception:
             raise e
+
+
+@pytest.mark.parametrize(
+    "destination_type, destination_sync_mode, expected_incremental",
+    [
+        (DestinationType.POSTGRES, DestinationSyncMode.append, True),
+        (DestinationType.POSTGRES, DestinationSyncMode.append_dedup, True),
+        (DestinationType.POSTGRES, DestinationSyncMode.overwrite, False),
+        (DestinationType.SNOWFLAKE, DestinationSyncMode.append, True),
+        (DestinationType.MYSQL, DestinationSyncMode.append, False),
+    ],
+)
+def test_incremental_mode(destination_type: DestinationType, destination_sync_mode: DestinationSyncMode, expected_incremental: bool):
+    stream_processor = StreamProcessor.create(
+        stream_name="test_incremental_mode",
+        destination_type=destination_type,
+        raw_schema="raw_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=destination_sync_mode,
+        cursor_field=["updated_at"],
+        primary_key=[["id"]],
+        json_column_name="json_column_name",
+        properties={"id": {"type": "integer"}, "updated_at": {"type": "string"}},
+        tables_registry=TableNameRegistry(destination_type),
+        from_table="source('schema_name', '_airbyte_raw_test_incremental_mode')",
+    )
+    child = StreamProcessor.create_from_parent(
+        parent=stream_processor,
+        child_name="child",
+        json_column_name="child",
+        properties={"id": {"type": "integer"}},
+        is_nested_array=False,
+        from_table="ref('test_incremental_mode')",
+    )
+    assert stream_processor.is_incremental_mode() == expected_incremental
+    # Nested streams of deduplicated streams are rebuilt
+    assert child.is_incremental_mode() == (expected_incremental and destination_sync_mode == DestinationSyncMode.append)
+
+    stream_processor.collect_table_names()
+    stream_processor.tables_registry.resolve_names()
+    stream_processor.process()
+    table_outputs = [sql for output, sql in stream_processor.sql_outputs.items() if output.startswith("airbyte_tables")]
+    incremental_outputs = [sql for sql in table_outputs if 'materialized="incremental"' in sql]
+    # Incremental tables whose columns don't match the ones of the stream are rebuilt
+    assert all("expected_columns=[adapter.quote('id'), 'updated_at', " in sql or "expected_columns=['ID', 'UPDATED_AT', " in sql for sql in incremental_outputs)
+    if not expected_incremental:
+        assert not incremental_outputs
+    elif destination_sync_mode == DestinationSyncMode.append_dedup:
+        scd_output, final_output = incremental_outputs
+        # Tables created before _airbyte_unique_key was added are rebuilt
+        assert (
+            "'updated_at', '_airbyte_start_at', '_airbyte_end_at', '_airbyte_active_row', '_airbyte_unique_key', '_airbyte_emitted_at', "
+            "'_airbyte_test_incremental_mode_hashid']" in scd_output
+        )
+        assert "'updated_at', '_airbyte_unique_key', '_airbyte_emitted_at', '_airbyte_test_incremental_mode_hashid']" in final_output
+        assert "unique_key='_airbyte_test_incremental_mode_hashid'" in scd_output
+        assert "{{ incremental_clause('_airbyte_emitted_at') }}" in scd_output
+        # Only the records of the primary keys of the new records are merged again
+        assert "where _airbyte_unique_key in (select _airbyte_unique_key from new_data)" in scd_output
+        assert "unique_key='_airbyte_unique_key'" in final_output
+        assert "{{ incremental_clause('_airbyte_emitted_at') }}" in final_output
+        assert "post_hook" not in final_output
+    else:
+        [final_output] = incremental_outputs
+        assert "unique_key" not in final_output
+        assert "'_airbyte_emitted_at', '_airbyte_test_incremental_mode_hashid']" in final_output.lower()
+        assert "{{ incremental_clause('_airbyte_emitted_at') }}" in final_output
+
+
+def test_incremental_dedup_cdc_deletes():
+    stream_processor = StreamProcessor.create(
+        stream_name="test_incremental_cdc",
+        destination_type=DestinationType.POSTGRES,
+        raw_schema="raw_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=DestinationSyncMode.append_dedup,
+        cursor_field=["_ab_cdc_lsn"],
+        primary_key=[["id"], ["_airbyte_emitted_at"]],
+        json_column_name="json_column_name",
+        properties={
+            "id": {"type": "boolean"},
+            "_ab_cdc_lsn": {"type": "number"},
+            "_ab_cdc_updated_at": {"type": "number"},
+            "_ab_cdc_deleted_at": {"type": "number"},
+        },
+        tables_registry=TableNameRegistry(DestinationType.POSTGRES),
+        from_table="source('schema_name', '_airbyte_raw_test_incremental_cdc')",
+    )
+    assert stream_processor.list_primary_key_columns(stream_processor.extract_column_names()) == [
+        "boolean_to_string(adapter.quote('id'))",
+        "'_airbyte_emitted_at'",
+    ]
+    stream_processor.collect_table_names()
+    stream_processor.tables_registry.resolve_names()
+    stream_processor.process()
+    final_output = stream_processor.sql_outputs[os.path.join("airbyte_tables", "schema_name", "test_incremental_cdc.sql")]
+    assert 'post_hook="delete from {{ this }} where _ab_cdc_deleted_at is not null"' in final_output
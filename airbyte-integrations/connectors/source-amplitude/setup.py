@@ -26,7 +26,7 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk~=0.1",
+    "airbyte-cdk>=0.1.5",
 ]
 
 TEST_REQUIREMENTS = ["pytest~=6.1"]
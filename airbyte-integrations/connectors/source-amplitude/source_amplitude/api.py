@@ -23,19 +23,17 @@
 #
 
 
-import gzip
-import io
 import json
 import urllib.parse as urlparse
-import zipfile
 from abc import ABC, abstractmethod
-from typing import IO, Any, Iterable, List, Mapping, MutableMapping, Optional
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
 from urllib.parse import parse_qs
 
 import pendulum
 import requests
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.streaming import iter_gzip_lines, iter_zip_members, spool_response
 
 
 class AmplitudeStream(HttpStream, ABC):
@@ -133,16 +131,14 @@ class Events(IncrementalAmplitudeStream):
     state_checkpoint_interval = 1000
     time_interval = {"days": 3}
 
+    # Exports can weigh several GB: they are spooled to disk and decompressed on the fly rather than loaded in memory
+    stream_responses = True
+
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        zip_file = zipfile.ZipFile(io.BytesIO(response.content))
-        for gzip_filename in zip_file.namelist():
-            with zip_file.open(gzip_filename) as file:
-                yield from self._parse_zip_file(file)
-
-    def _parse_zip_file(self, zip_file: IO[bytes]) -> Iterable[Mapping]:
-        with gzip.open(zip_file) as file:
-            for record in file:
-                yield json.loads(record)
+        with spool_response(response) as export:
+            for _, gzip_file in iter_zip_members(export):
+                for record in iter_gzip_lines(gzip_file):
+                    yield json.loads(record)
 
     def read_records(
         self,
@@ -26,6 +26,7 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
+    "airbyte-cdk>=0.1.5",
     "airbyte-protocol",
     "base-python",
     "backoff==1.10.0",
@@ -24,16 +24,17 @@
 
 
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
 from functools import partial
 from http import HTTPStatus
-from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import backoff
 import pendulum as pendulum
 import requests
+from airbyte_cdk.sources.streams.http.auth import TokenManager
 from base_python.entrypoint import logger
 from source_hubspot.errors import HubspotAccessDenied, HubspotInvalidAuth, HubspotRateLimited, HubspotTimeout
 
@@ -97,20 +98,25 @@ class API:
 
     def __init__(self, credentials: Mapping[str, Any]):
         self._credentials = {**credentials}
+        # The access token can be refreshed by a background thread while other threads read the credentials
+        self._credentials_lock = threading.Lock()
         self._session = requests.Session()
         self._session.headers = {
             "Content-Type": "application/json",
             "User-Agent": self.USER_AGENT,
         }
-
-    def _acquire_access_token_from_refresh_token(self):
-        payload = {
-            "grant_type": "refresh_token",
-            "redirect_uri": self._credentials["redirect_uri"],
-            "refresh_token": self._credentials["refresh_token"],
-            "client_id": self._credentials["client_id"],
-            "client_secret": self._credentials["client_secret"],
-        }
+        # Refreshes the access token 10 minutes before it expires, once for all the threads using the API
+        self._token_manager = TokenManager(self._acquire_access_token_from_refresh_token, refresh_ahead=600)
+
+    def _acquire_access_token_from_refresh_token(self) -> Tuple[str, int]:
+        with self._credentials_lock:
+            payload = {
+                "grant_type": "refresh_token",
+                "redirect_uri": self._credentials["redirect_uri"],
+                "refresh_token": self._credentials["refresh_token"],
+                "client_id": self._credentials["client_id"],
+                "client_secret": self._credentials["client_secret"],
+            }
 
         resp = requests.post(self.BASE_URL + "/oauth/v1/token", data=payload)
         if resp.status_code == HTTPStatus.FORBIDDEN:
@@ -118,25 +124,26 @@ class API:
 
         resp.raise_for_status()
         auth = resp.json()
-        self._credentials["access_token"] = auth["access_token"]
-        self._credentials["refresh_token"] = auth["refresh_token"]
-        self._credentials["token_expires"] = datetime.utcnow() + timedelta(seconds=auth["expires_in"] - 600)
-        logger.info(f"Token refreshed. Expires at {self._credentials['token_expires']}")
+        with self._credentials_lock:
+            self._credentials["access_token"] = auth["access_token"]
+            self._credentials["refresh_token"] = auth["refresh_token"]
+        logger.info(f"Token refreshed. Expires in {auth['expires_in']} seconds")
+        return auth["access_token"], auth["expires_in"]
 
     @property
     def api_key(self) -> Optional[str]:
         """Get API Key if set"""
-        return self._credentials.get("api_key")
+        with self._credentials_lock:
+            return self._credentials.get("api_key")
 
     @property
     def access_token(self) -> Optional[str]:
         """Get Access Token if set, refreshes token if needed"""
-        if not self._credentials.get("access_token"):
-            return None
+        with self._credentials_lock:
+            if not self._credentials.get("access_token"):
+                return None
 
-        if self._credentials["token_expires"] is None or self._credentials["token_expires"] < datetime.utcnow():
-            self._acquire_access_token_from_refresh_token()
-        return self._credentials.get("access_token")
+        return self._token_manager.get_token()
 
     def _add_auth(self, params: Mapping[str, Any] = None) -> Mapping[str, Any]:
         """Add auth info to request params/header"""
@@ -23,7 +23,10 @@
 #
 
 
+import time
+
 import pytest
+from source_hubspot.api import API
 from source_hubspot.client import Client
 
 
@@ -61,3 +64,33 @@ def test_client_backoff_on_server_error(requests_mock, some_credentials):
 
     assert alive
     assert not error
+
+
+def test_api_refreshes_access_token_once_expired(requests_mock, monkeypatch):
+    """Check the token is refreshed with the latest refresh token once it expired, and reused until then"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    responses = [
+        {"json": {"access_token": "first_token", "refresh_token": "second_refresh_token", "expires_in": 1800}, "status_code": 200},
+        {"json": {"access_token": "second_token", "refresh_token": "third_refresh_token", "expires_in": 1800}, "status_code": 200},
+    ]
+    requests_mock.register_uri("POST", "/oauth/v1/token", responses)
+    credentials = {
+        "access_token": "initial_token",
+        "refresh_token": "first_refresh_token",
+        "redirect_uri": "https://airbyte.io",
+        "client_id": "client_id",
+        "client_secret": "client_secret",
+    }
+    api = API(credentials=credentials)
+
+    assert api.access_token == "first_token"
+    now[0] += 60
+    assert api.access_token == "first_token"
+    assert requests_mock.call_count == 1
+
+    now[0] += 1800
+    assert api.access_token == "second_token"
+    assert requests_mock.call_count == 2
+    assert "refresh_token=first_refresh_token" in requests_mock.request_history[0].text
+    assert "refresh_token=second_refresh_token" in requests_mock.request_history[1].text
@@ -47,7 +47,7 @@ public class DefaultNormalizationRunner implements NormalizationRunner {
 
   private static final Logger LOGGER = LoggerFactory.getLogger(DefaultNormalizationRunner.class);
 
-  public static final String NORMALIZATION_IMAGE_NAME = "airbyte/normalization:0.1.35";
+  public static final String NORMALIZATION_IMAGE_NAME = "airbyte/normalization:0.1.41";
 
   private final DestinationType destinationType;
   private final ProcessFactory processFactory;